@@ -0,0 +1,539 @@
+#!/usr/bin/env python
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Micro benchmarks of the client library. None of them needs a running
+# server. Call without arguments to run all of them or pass the names of the
+# benchmarks that should run.
+
+import sys, time, struct, optparse
+from peerdrive import connector, merger, standin
+from peerdrive import peerdrive_client_pb2 as pb
+from peerdrive.transport import SocketTransport
+
+ADDRESS = 'tcp://127.0.0.1:0/00'
+MiB = 1 << 20
+
+class NullTransport(object):
+	"""Transport which only answers INIT_MSG and swallows everything else.
+
+	The most recently created instance is available as NullTransport.last so
+	that benchmarks can inject data into the connector.
+	"""
+
+	last = None
+
+	def __init__(self, host, port, received, deferred):
+		self.received = received
+		NullTransport.last = self
+
+	def send(self, data):
+		(length, ref, msg) = struct.unpack_from('>HLH', data)
+		if (msg >> 4) == connector._Connector.INIT_MSG:
+			cnf = pb.InitCnf(major=2, minor=0, max_packet_size=0x1000)
+			self.received(packet(ref, msg >> 4, connector._Connector.FLAG_CNF,
+				cnf.SerializeToString()))
+
+	def wait(self, timeout):
+		return False
+
+	def flush(self):
+		pass
+
+	def defer(self, delay=0):
+		pass
+
+	def close(self):
+		pass
+
+	def errorString(self):
+		return 'No server'
+
+
+def packet(ref, msg, flag, body):
+	return struct.pack('>HLH', len(body)+6, ref, (msg << 4) | flag) + body
+
+
+def measure(fun, *args):
+	start = time.time()
+	fun(*args)
+	return time.time() - start
+
+
+###############################################################################
+# Receive path framing
+###############################################################################
+
+def legacyFraming(chunks):
+	buf = ''
+	for data in chunks:
+		buf = buf + data
+		while len(buf) > 2:
+			expect = struct.unpack_from('>H', buf, 0)[0] + 2
+			if expect <= len(buf):
+				packet = buf[2:expect]
+				buf = buf[expect:]
+				(ref, msg) = struct.unpack_from('>LH', packet, 0)
+				body = packet[6:]
+			else:
+				break
+
+
+def benchFraming(options):
+	"""Sequential read delivered as READ_MSG confirmations"""
+	conn = connector._Connector(ADDRESS, NullTransport)
+	size = options.size * MiB
+	count = size // conn.maxPacketSize
+	futures = [ conn._request(connector._Connector.READ_MSG) for i in xrange(count) ]
+	body = pb.ReadCnf(data='\0' * conn.maxPacketSize).SerializeToString()
+	stream = ''.join([ packet(ref, connector._Connector.READ_MSG,
+		connector._Connector.FLAG_CNF, body) for ref in xrange(1, count+1) ])
+	chunks = [ stream[i:i+options.chunk] for i in xrange(0, len(stream),
+		options.chunk) ]
+	del stream
+
+	received = NullTransport.last.received
+	new = measure(lambda: [ received(c) for c in chunks ])
+	assert all(f.ready() for f in futures)
+	old = measure(legacyFraming, chunks)
+	return [
+		("legacy", "%.2f s, %.1f MiB/s" % (old, size / old / MiB)),
+		("bytearray", "%.2f s, %.1f MiB/s" % (new, size / new / MiB)),
+	]
+
+
+###############################################################################
+# PDSD coding
+###############################################################################
+
+class LegacyDecoder(object):
+	"""The if/elif chain decoder which was used up to now."""
+
+	def __init__(self, store):
+		self.__store = store
+
+	def decode(self, s):
+		self._s = s
+		self._i = 0
+		return self._decodeDoc()
+
+	def _getStore(self):
+		return self.__store
+
+	def _getInt(self, code):
+		length = struct.calcsize('<'+code)
+		value = struct.unpack_from('<'+code, self._s, self._i)[0]
+		self._i += length
+		return value
+
+	def _getStr(self, length):
+		res = self._s[self._i:self._i+length]
+		self._i += length
+		return res
+
+	def _decodeDoc(self):
+		tag = self._getInt('B')
+		if tag == 0x00:
+			res = self._decodeDict()
+		elif tag == 0x10:
+			res = self._decodeList()
+		elif tag == 0x20:
+			res = self._decodeString()
+		elif tag == 0x30:
+			res = (self._getInt('B') != 0)
+		elif tag == 0x40:
+			res = connector.RevLink()
+			res._fromStruct(self)
+		elif tag == 0x41:
+			res = connector.DocLink()
+			res._fromStruct(self)
+		elif tag == 0x50:
+			res = self._getInt('f')
+		elif tag == 0x51:
+			res = self._getInt('d')
+		elif tag == 0x60:
+			res = self._getInt('B')
+		elif tag == 0x61:
+			res = self._getInt('b')
+		elif tag == 0x62:
+			res = self._getInt('H')
+		elif tag == 0x63:
+			res = self._getInt('h')
+		elif tag == 0x64:
+			res = self._getInt('L')
+		elif tag == 0x65:
+			res = self._getInt('l')
+		elif tag == 0x66:
+			res = self._getInt('Q')
+		elif tag == 0x67:
+			res = self._getInt('q')
+		else:
+			raise TypeError("Invalid tag")
+		return res
+
+	def _decodeDict(self):
+		elements = self._getInt('L')
+		d = { }
+		for i in range(elements):
+			key = self._decodeString()
+			value = self._decodeDoc()
+			d[key] = value
+		return d
+
+	def _decodeList(self):
+		elements = self._getInt('L')
+		l = []
+		for i in range(elements):
+			l.append(self._decodeDoc())
+		return l
+
+	def _decodeString(self):
+		length = self._getInt('L')
+		value = self._getStr(length).decode('utf-8')
+		return value
+
+
+class LegacyEncoder(object):
+	"""The encoder which concatenated strings for every element."""
+
+	def encode(self, o):
+		if isinstance(o, dict):
+			res = self._encodeDict(o)
+		elif isinstance(o, (list, tuple)):
+			res = self._encodeList(o)
+		elif isinstance(o, basestring):
+			if isinstance(o, str):
+				res = struct.pack('<BL', 0x20, len(o)) + o
+			else:
+				encStr = o.encode('utf-8')
+				res = struct.pack('<BL', 0x20, len(encStr)) + encStr
+		elif o is True:
+			res = struct.pack('BB', 0x30, 1)
+		elif o is False:
+			res = struct.pack('BB', 0x30, 0)
+		elif isinstance(o, connector.RevLink):
+			res = o._toStruct()
+		elif isinstance(o, connector.DocLink):
+			res = o._toStruct()
+		elif isinstance(o, float):
+			res = struct.pack('<Bd', 0x51, o)
+		elif isinstance(o, (int, long)):
+			res = self._encodeInt(o)
+		else:
+			raise TypeError("Invalid object: " + repr(o))
+		return res
+
+	def _encodeDict(self, d):
+		data = struct.pack('<BL', 0x00, len(d))
+		for key, value in d.iteritems():
+			if isinstance(key, unicode):
+				key = key.encode('utf-8')
+			data += struct.pack('<L', len(key)) + key + self.encode(value)
+		return data
+
+	def _encodeList(self, l):
+		data = struct.pack('<BL', 0x10, len(l))
+		for i in l:
+			data += self.encode(i)
+		return data
+
+	def _encodeInt(self, i):
+		if i < 0:
+			if i >= -128:
+				return struct.pack('<Bb', 0x61, i)
+			elif i >= -32768:
+				return struct.pack('<Bh', 0x63, i)
+			elif i >= -2147483648:
+				return struct.pack('<Bl', 0x65, i)
+			else:
+				return struct.pack('<Bq', 0x67, i)
+		else:
+			if i <= 0xff:
+				return struct.pack('<BB', 0x60, i)
+			elif i <= 0xffff:
+				return struct.pack('<BH', 0x62, i)
+			elif i <= 0xffffffff:
+				return struct.pack('<BL', 0x64, i)
+			else:
+				return struct.pack('<BQ', 0x66, i)
+
+
+def makeContent(entries):
+	store = '\x01' * 16
+	content = []
+	for i in xrange(entries):
+		content.append({
+			'' : connector.DocLink(store, struct.pack('>QQ', 1, i), False),
+			'org.peerdrive.annotation' : {
+				'title' : u'Entry number %d' % i,
+				'comment' : u'Größe %d' % (i * 1021),
+			},
+			'size' : i * 4099,
+			'mtime' : 1300000000.0 + i,
+			'sticky' : (i % 3) == 0,
+		})
+	return {
+		'org.peerdrive.folder' : content,
+		'org.peerdrive.annotation' : { 'title' : u'Big folder' },
+	}
+
+
+def makeFolder(entries):
+	return connector.dumpPDSD(makeContent(entries))
+
+
+def benchDecode(options):
+	"""Decode a folder with --entries entries"""
+	data = makeFolder(options.entries)
+	size = len(data)
+	old = measure(LegacyDecoder(None).decode, data)
+	new = measure(connector.loadPDSD, None, data)
+	lazy = measure(lambda: connector.loadPDSD(None, data, True)
+		['org.peerdrive.annotation']['title'])
+	last = measure(lambda: connector.loadPDSD(None, data, True)
+		['org.peerdrive.folder'][-1]['org.peerdrive.annotation']['title'])
+	return [
+		("size", "%.1f MiB" % (float(size) / MiB)),
+		("legacy", "%.2f s, %.1f MB/s" % (old, size / old / 1e6)),
+		("table", "%.2f s, %.1f MB/s" % (new, size / new / 1e6)),
+		("lazy-title", "%.4f s" % lazy),
+		("lazy-last", "%.2f s" % last),
+	]
+
+
+def benchEncode(options):
+	"""Encode a folder with --entries entries"""
+	content = makeContent(options.entries)
+	result = []
+	new = measure(lambda: result.append(connector.dumpPDSD(content)))
+	old = measure(lambda: result.append(LegacyEncoder().encode(content)))
+	assert result[0] == result[1]
+	size = len(result[0])
+	return [
+		("size", "%.1f MiB" % (float(size) / MiB)),
+		("legacy", "%.2f s, %.1f MB/s" % (old, size / old / 1e6)),
+		("chunked", "%.2f s, %.1f MB/s" % (new, size / new / 1e6)),
+	]
+
+
+###############################################################################
+# Latency sensitivity against the stand-in server
+###############################################################################
+
+def populate(conn, store, count):
+	docs = []
+	for i in xrange(count):
+		with conn.create(store, 'public.text', 'org.peerdrive.benchmark') as h:
+			h.setData('', { u'org.peerdrive.annotation' : { u'title' : u'doc %d' % i } })
+			h.commit()
+			docs.append(h.getDoc())
+	return docs
+
+
+def benchLatency(options):
+	"""Lookup, stat and write --docs documents at --latency ms server delay"""
+	result = []
+	for latency in [ float(l) for l in options.latency.split(',') ]:
+		server = standin.Server(['user'], latency=latency / 1000.0).start()
+		try:
+			conn = connector._Connector(server.address(), SocketTransport)
+			store = conn.enum().fromLabel('user').sid
+			docs = populate(conn, store, options.docs)
+
+			def serial():
+				conn.lookupCache.clear()
+				conn.statCache.clear()
+				for doc in docs:
+					conn.stat(conn.lookupDoc(doc).rev(store))
+
+			def pipelined():
+				conn.lookupCache.clear()
+				conn.statCache.clear()
+				with conn.pipeline() as p:
+					lookups = p.lookupDocs(docs)
+				conn.statMany([ l.rev(store) for l in lookups.result() ])
+
+			def write():
+				with conn.create(store, 'public.data', 'org.peerdrive.benchmark') as h:
+					h.writeAll('FILE', '\0' * options.chunk)
+					h.commit()
+
+			result.extend([
+				("%gms serial" % latency, "%.3f s" % measure(serial)),
+				("%gms batched" % latency, "%.3f s" % measure(pipelined)),
+				("%gms write" % latency, "%.1f MiB/s" % (float(options.chunk)
+					/ measure(write) / MiB)),
+			])
+			conn.close()
+		finally:
+			server.stop()
+	return result
+
+
+###############################################################################
+# Structured merge
+###############################################################################
+
+def makeAnnotation(units, start=0):
+	props = {}
+	for i in xrange(start, start + units):
+		props[u'org.example.field%d' % i] = {
+			u'value' : u'Value of field %d' % i,
+			u'count' : i,
+			u'tags' : [ u'tag%d' % (i % 17), u'tag%d' % (i % 23) ],
+		}
+	return {
+		u'org.peerdrive.annotation' : {
+			u'title' : u'Annotated document',
+			u'comment' : u'Synthetic annotation with %d fields' % units,
+			u'tags' : [ u'tag%d' % i for i in xrange(min(units, 100)) ],
+		},
+		u'org.example.props' : props,
+	}
+
+
+def makeRegistry(units, start=0):
+	registry = {}
+	for i in xrange(start, start + units):
+		registry[u'org.example.type%d' % i] = {
+			u'display' : u'Example type %d' % i,
+			u'icon' : u'uti/type%d.png' % (i % 50),
+			u'conforming' : [ u'public.data', u'org.example.type%d' % (i // 10) ],
+			u'extensions' : [ u'.ex%d' % i ],
+			u'mimetypes' : [ u'application/x-example-%d' % i ],
+		}
+	return { u'org.peerdrive.registry' : registry }
+
+
+def makeFolderUnits(units, start=0):
+	content = makeContent(start + units)
+	del content['org.peerdrive.folder'][:start]
+	return content
+
+
+# (name, generator, key of the container with one item per unit)
+MERGE_DOCUMENTS = [
+	("annotation", makeAnnotation, u'org.example.props'),
+	("folder", makeFolderUnits, 'org.peerdrive.folder'),
+	("registry", makeRegistry, u'org.peerdrive.registry'),
+]
+
+
+def touch(value, tag):
+	# change the first string in 'value'
+	for key in sorted(value):
+		if isinstance(value[key], basestring):
+			value[key] += tag
+			return True
+		elif isinstance(value[key], dict) and touch(value[key], tag):
+			return True
+	return False
+
+
+def mutate(doc, make, key, units, tag, start, conflicting, phase):
+	# Change the first 'conflicting' units and every 100th one starting at
+	# 'phase', remove and add 0.5% of them.
+	container = doc[key]
+	count = max(1, units // 200)
+	new = make(count, start)[key]
+	if isinstance(container, dict):
+		keys = sorted(container)
+		for k in keys[:conflicting] + keys[conflicting+phase::100]:
+			touch(container[k], tag)
+		for k in keys[-count:]:
+			del container[k]
+		container.update(new)
+	else:
+		for item in container[:conflicting] + container[conflicting+phase::100]:
+			touch(item, tag)
+		del container[-count:]
+		container.extend(new)
+
+
+def parseSize(size):
+	units = { 'K' : 1 << 10, 'M' : MiB }
+	if size[-1:].upper() in units:
+		return int(size[:-1]) * units[size[-1:].upper()]
+	return int(size)
+
+
+def benchMerge(options):
+	"""Three-way merge of documents of --merge-sizes with 2 versions"""
+	result = []
+	for (name, make, key) in MERGE_DOCUMENTS:
+		perUnit = float(len(connector.dumpPDSD(make(100)))) / 100
+		for size in options.mergeSizes.split(','):
+			units = max(1, int(parseSize(size) / perUnit))
+			base = make(units)
+			ours = make(units)
+			theirs = make(units)
+			mutate(ours, make, key, units, u' (ours)', units, 10, 0)
+			mutate(theirs, make, key, units, u' (theirs)', 2 * units, 10, 50)
+			size = len(connector.dumpPDSD(base))
+
+			merged = []
+			duration = measure(lambda: merged.append(merger.merge(base,
+				[ours, theirs])))
+			(doc, conflicts) = merged[0]
+			result.append(("%s %s" % (name, formatSize(size)),
+				"%.3f s, %.1f MB/s, %d conflicts" % (duration,
+				size / duration / 1e6, len(conflicts))))
+	return result
+
+
+def formatSize(size):
+	if size >= MiB:
+		return "%.0fM" % (float(size) / MiB)
+	return "%.0fK" % (float(size) / 1024)
+
+
+###############################################################################
+# Main
+###############################################################################
+
+BENCHMARKS = [
+	("framing", benchFraming),
+	("decode", benchDecode),
+	("encode", benchEncode),
+	("latency", benchLatency),
+	("merge", benchMerge),
+]
+
+if __name__ == '__main__':
+	parser = optparse.OptionParser(usage="usage: %prog [options] [benchmark...]")
+	parser.add_option("--size", dest="size", type="int", default=100,
+		help="Payload size of bulk transfers in MiB (default: 100)")
+	parser.add_option("--chunk", dest="chunk", type="int", default=4*MiB,
+		help="Size of the chunks as delivered by the socket (default: 4 MiB)")
+	parser.add_option("--entries", dest="entries", type="int", default=50000,
+		help="Number of entries of synthetic folders (default: 50000)")
+	parser.add_option("--docs", dest="docs", type="int", default=200,
+		help="Number of documents of server benchmarks (default: 200)")
+	parser.add_option("--latency", dest="latency", default="0,1,5",
+		help="Comma separated server latencies in ms (default: 0,1,5)")
+	parser.add_option("--merge-sizes", dest="mergeSizes",
+		default="1K,64K,1M,10M,50M",
+		help="Comma separated sizes of merged documents (default: 1K,64K,1M,10M,50M)")
+	(options, args) = parser.parse_args()
+
+	for (name, bench) in BENCHMARKS:
+		if args and name not in args:
+			continue
+		print "%s: %s" % (name, bench.__doc__)
+		for (variant, result) in bench(options):
+			print "    %-12s %s" % (variant, result)
@@ -143,8 +143,8 @@ else:
 	if options.verbose:
 		try:
 			rev = Connector().lookupDoc(sid, [sid]).rev(sid)
-			with Connector().peek(sid, rev) as r:
-				name = r.getData("/org.peerdrive.annotation/title")
+			[name] = Connector().getRevData(sid, rev,
+				["/org.peerdrive.annotation/title"])
 		except IOError:
 			name = "Unnamed store"
 		print "Mounted '%s' (%s, '%s')" % (label, sid.encode('hex'), name)
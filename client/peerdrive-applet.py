@@ -527,8 +527,8 @@ class SyncRules(object):
 		self.sysStore = Connector().enum().sysStore().sid
 		self.syncDoc = struct.Folder(DocLink(self.sysStore, self.sysStore))["syncrules"].doc()
 		self.syncRev = Connector().lookupDoc(self.syncDoc).rev(self.sysStore)
-		with Connector().peek(self.sysStore, self.syncRev) as r:
-			rules = r.getData('/org.peerdrive.syncrules')
+		[rules] = Connector().getRevData(self.sysStore, self.syncRev,
+			['/org.peerdrive.syncrules'])
 
 		self.__changed = False
 		self.__rules = {}
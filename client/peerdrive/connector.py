@@ -18,10 +18,13 @@
 
 from __future__ import absolute_import
 
-from PyQt4 import QtCore, QtNetwork
 from datetime import datetime
 import sys, struct, atexit, weakref, traceback, os, os.path, json, time
+import collections, io, threading, contextlib, codecs, copy
 from . import peerdrive_client_pb2 as pb
+from .transport import defaultTransport, SocketTransport
+from . import metrics
+from .recorder import Recorder
 
 if sys.platform == "win32":
 	import _winreg
@@ -214,16 +217,79 @@ _requestNames = {
 	0x002a : "WALK_PATH_MSG",
 	0x002b : "GET_DATA_MSG",
 	0x002c : "SET_DATA_MSG",
-	0x002d : "GET_LINKS_MSG"
+	0x002d : "GET_LINKS_MSG",
+	0x002e : "STAT_MANY_MSG",
+	0x002f : "LOOKUP_MANY_MSG",
+	0x0030 : "GET_REV_DATA_MSG",
+	0x0031 : "WATCH_MANY_MSG"
 }
 
 
+# length, reference and message/flags of every packet
+_packetHeader = struct.Struct('>HLH')
+
+
 def _checkUuid(uuid):
 	if not (uuid.__class__ == str):
 		raise IOError('Invalid UUID: '+str(uuid.__class__)+' '+str(uuid))
 	return uuid
 
 
+class _LruCache(object):
+	"""Bounded mapping which evicts the least recently used entries."""
+
+	def __init__(self, maxSize, evicted=None):
+		self.maxSize = maxSize
+		self.evicted = evicted
+		self.hits = 0
+		self.misses = 0
+		self.__entries = collections.OrderedDict()
+
+	def __len__(self):
+		return len(self.__entries)
+
+	def get(self, key, default=None):
+		try:
+			value = self.__entries.pop(key)
+		except KeyError:
+			self.misses += 1
+			return default
+		self.hits += 1
+		self.__entries[key] = value
+		return value
+
+	def peek(self, key, default=None):
+		return self.__entries.get(key, default)
+
+	def put(self, key, value):
+		self.__entries.pop(key, None)
+		self.__entries[key] = value
+		if len(self.__entries) > self.maxSize:
+			(key, value) = self.__entries.popitem(last=False)
+			if self.evicted:
+				self.evicted(key, value)
+
+	def pop(self, key, default=None):
+		return self.__entries.pop(key, default)
+
+	def remove(self, predicate):
+		for key in [ k for k in self.__entries if predicate(k) ]:
+			value = self.__entries.pop(key)
+			if self.evicted:
+				self.evicted(key, value)
+
+	def clear(self):
+		# entries which are dropped count as evicted, e.g. to release watches
+		entries = self.__entries
+		self.__entries = collections.OrderedDict()
+		if self.evicted:
+			for (key, value) in entries.iteritems():
+				self.evicted(key, value)
+
+	def info(self):
+		return (self.hits, self.misses, len(self.__entries), self.maxSize)
+
+
 def _raiseError(error):
 	if error in _errorCodes:
 		raise IOError(_errorCodes[error])
@@ -231,7 +297,7 @@ def _raiseError(error):
 		raise IOError('Unknown error')
 
 
-class _Connector(QtCore.QObject):
+class _Connector(object):
 	ERROR_MSG           = 0x0000
 	INIT_MSG            = 0x0001
 	ENUM_MSG            = 0x0002
@@ -278,6 +344,10 @@ class _Connector(QtCore.QObject):
 	GET_DATA_MSG        = 0x002b
 	SET_DATA_MSG        = 0x002c
 	GET_LINKS_MSG       = 0x002d
+	STAT_MANY_MSG       = 0x002e
+	LOOKUP_MANY_MSG     = 0x002f
+	GET_REV_DATA_MSG    = 0x0030
+	WATCH_MANY_MSG      = 0x0031
 
 	FLAG_REQ = 0
 	FLAG_CNF = 1
@@ -291,11 +361,29 @@ class _Connector(QtCore.QObject):
 	PROGRESS_REP_DOC = pb.ProgressStartInd.rep_doc
 	PROGRESS_REP_REV = pb.ProgressStartInd.rep_rev
 
-	watchReady = QtCore.pyqtSignal()
-
-	def __init__(self, address=None):
-		super(_Connector, self).__init__()
-
+	# number of cached Stat objects
+	STAT_CACHE_SIZE = 16384
+	# number of documents whose heads are cached, each one is watched
+	LOOKUP_CACHE_SIZE = 8192
+	# cached documents which need a watch of their own on the server, those
+	# which are watched anyway do not count
+	LOOKUP_WATCH_LIMIT = 1024
+	# number of resolved path prefixes, the documents along them are watched
+	PATH_CACHE_SIZE = 1024
+	# largest reply the server can send, it uses 16 bit packet lengths
+	MAX_REPLY_SIZE = 0xFFFF - 6
+	# revisions per STAT_MANY request, fewer if the replies grow too big
+	STAT_MANY_BATCH = 128
+	# documents per LOOKUP_MANY request, fewer if the replies grow too big
+	LOOKUP_MANY_BATCH = 256
+	# revisions per GET_REV_DATA request, fewer if the replies grow too big
+	GET_REV_DATA_BATCH = 64
+	# watch changes per WATCH_MANY request
+	WATCH_MANY_BATCH = 1024
+	# seconds to collect indications before they are coalesced and dispatched
+	INDICATION_WINDOW = 0.0
+
+	def __init__(self, address=None, transport=None):
 		if not address:
 			# look into environment
 			address = os.getenv('PEERDRIVE')
@@ -336,21 +424,37 @@ class _Connector(QtCore.QObject):
 		port = int(port)
 		cookie = cookie.strip().decode('hex')
 
-		self.socket = QtNetwork.QTcpSocket()
-		self.socket.readyRead.connect(self.__readReady)
-		self.socket.connectToHost(host, port)
-		if not self.socket.waitForConnected(1000):
-			raise IOError("Could not connect to server!")
-		self.socket.setSocketOption(QtNetwork.QAbstractSocket.LowDelayOption, 1)
+		self.__lock = threading.RLock()
+		self.__reader = None # thread which waits on the transport
+		self.__readDone = threading.Condition(self.__lock)
+		self.statCache = _LruCache(_Connector.STAT_CACHE_SIZE)
+		self.lookupCache = _LruCache(_Connector.LOOKUP_CACHE_SIZE,
+			lambda doc, slot: self.__dropLookup(slot))
+		self.__lookupWatches = 0 # slots with a watch of their own
+		self.pathCache = _LruCache(_Connector.PATH_CACHE_SIZE, self.__dropPath)
+		self.pathWatches = {}
+		self.__replySizes = {} # msg -> estimated reply size per batch item
 		self.next = 0
-		self.buf = ''
+		self.buf = bytearray()
 		self.confirmations = {}
+		self.sent = {} # ref -> (msg, time) while metrics are collected
+		self.recorder = None
 		self.indications = []
 		self.watchHandlers = {}
+		self.__watchAdd = set()
+		self.__watchRem = set()
+		self.__watchSlots = []
 		self.progressHandlers = []
 		self.recursion = 0
+		self.indicationWindow = _Connector.INDICATION_WINDOW
+		self.__indicationDue = None
+		self.__indicationTimer = False
+		self.__indicationStats = [0, 0, 0] # delivered, merged, dropped
 
-		self.watchReady.connect(self.__dispatchIndications, QtCore.Qt.QueuedConnection)
+		if transport is None:
+			transport = defaultTransport()
+		self.__transport = transport(host, port, self.__readReady,
+			self.__deferred)
 
 		try:
 			req = pb.InitReq()
@@ -363,53 +467,135 @@ class _Connector(QtCore.QObject):
 				raise IOError("Unsupported protocol version!")
 			self.maxPacketSize = cnf.max_packet_size
 		except:
-			self.socket.disconnectFromHost()
+			self.__transport.close()
 			raise
 
 	def enum(self):
 		reply = pb.EnumCnf.FromString(self._rpc(_Connector.ENUM_MSG))
 		return Enum(reply)
 
-	def lookupDoc(self, doc, stores=[]):
-		req = pb.LookupDocReq()
-		req.doc = _checkUuid(doc)
-		for store in stores:
-			req.stores.append(_checkUuid(store))
-		reply = self._rpc(_Connector.LOOKUP_DOC_MSG, req.SerializeToString())
-		return Lookup(pb.LookupDocCnf.FromString(reply))
+	def lookupDoc(self, doc, stores=[], cached=True):
+		return Pipeline(self).lookupDoc(doc, stores, cached).result()
+
+	def lookupDocs(self, docs, stores=[]):
+		return Pipeline(self).lookupDocs(docs, stores).result()
 
 	def lookupRev(self, rev, stores=[]):
-		req = pb.LookupRevReq()
-		req.rev = _checkUuid(rev)
-		for store in stores:
-			req.stores.append(_checkUuid(store))
-		reply = self._rpc(_Connector.LOOKUP_REV_MSG, req.SerializeToString())
-		return pb.LookupRevCnf.FromString(reply).stores
+		return Pipeline(self).lookupRev(rev, stores).result()
 
 	def stat(self, rev, stores=[]):
-		req = pb.StatReq()
-		req.rev = _checkUuid(rev)
-		for store in stores:
-			req.stores.append(_checkUuid(store))
-		reply = self._rpc(_Connector.STAT_MSG, req.SerializeToString())
-		return Stat(pb.StatCnf.FromString(reply))
+		return Pipeline(self).stat(rev, stores).result()
+
+	def statMany(self, revs, stores=[]):
+		return Pipeline(self).statMany(revs, stores).result()
 
 	def getLinks(self, rev, stores=[]):
-		req = pb.GetLinksReq()
-		req.rev = _checkUuid(rev)
-		for store in stores:
-			req.stores.append(_checkUuid(store))
-		reply = self._rpc(_Connector.GET_LINKS_MSG, req.SerializeToString())
-		cnf = pb.GetLinksCnf.FromString(reply)
-		return (cnf.doc_links, cnf.rev_links)
+		return Pipeline(self).getLinks(rev, stores).result()
 
 	def peek(self, store, rev):
-		req = pb.PeekReq()
-		req.store = _checkUuid(store)
-		req.rev = _checkUuid(rev)
-		reply = self._rpc(_Connector.PEEK_MSG, req.SerializeToString())
-		cnf = pb.PeekCnf.FromString(reply)
-		return Handle(self, store, cnf.handle, None, rev)
+		return Pipeline(self).peek(store, rev).result()
+
+	def getRevData(self, store, rev, selectors=[''], lazy=False):
+		return Pipeline(self).getRevData(store, rev, selectors, lazy).result()
+
+	def getRevDataValues(self, store, rev, selectors=[''], lazy=False):
+		return Pipeline(self).getRevDataValues(store, rev, selectors,
+			lazy).result()
+
+	def getRevDataMany(self, requests, lazy=False):
+		return Pipeline(self).getRevDataMany(requests, lazy).result()
+
+	def pipeline(self):
+		return Pipeline(self)
+
+	def statCacheInfo(self):
+		"""Return (hits, misses, size, maxSize) of the revision Stat cache."""
+		with self.__lock:
+			return self.statCache.info()
+
+	def _cachedStat(self, key):
+		with self.__lock:
+			return self.statCache.get(key)
+
+	def _cacheStat(self, key, stat):
+		with self.__lock:
+			self.statCache.put(key, stat)
+		return stat
+
+	def _batchSize(self, msg, limit):
+		"""Number of items of a batch request whose reply fits into a packet."""
+		with self.__lock:
+			size = self.__replySizes.get(msg)
+		if size is None:
+			return limit
+		return max(1, min(limit, _Connector.MAX_REPLY_SIZE // size))
+
+	def _learnReplySize(self, msg, size, count):
+		# grow the estimate at once but let it shrink only slowly
+		size = (size + count - 1) // count
+		with self.__lock:
+			old = self.__replySizes.get(msg, size)
+			self.__replySizes[msg] = max(size, (old + size) // 2)
+
+	def lookupCacheInfo(self):
+		"""Return (hits, misses, size, maxSize) of the document Lookup cache."""
+		with self.__lock:
+			return self.lookupCache.info()
+
+	def _cachedLookup(self, doc, stores):
+		# Returns either the cached Lookup or a token for _cacheLookup(). The
+		# watch of a new slot is queued and flushed before the LOOKUP_DOC
+		# request so that no change after the lookup can go unnoticed.
+		key = frozenset(stores)
+		with self.__lock:
+			slot = self.lookupCache.peek(doc)
+			if slot is not None and key in slot.entries:
+				return (self.lookupCache.get(doc).entries[key], None)
+			if slot is None:
+				self.lookupCache.get(doc)
+				own = (Watch.TYPE_DOC, doc) not in self.watchHandlers
+				if own:
+					if self.__lookupWatches >= _Connector.LOOKUP_WATCH_LIMIT:
+						# don't let the server watch even more documents
+						return (None, None)
+					self.__lookupWatches += 1
+				slot = _LookupSlot(doc, own)
+				self.__watch(slot)
+				self.__watchSlots.append(slot)
+				self.lookupCache.put(doc, slot)
+			else:
+				self.lookupCache.misses += 1
+			return (None, (slot, key, slot.generation))
+
+	def _cacheLookup(self, token, lookup):
+		if token is None:
+			return lookup
+		(slot, key, generation) = token
+		with self.__lock:
+			# Drop the result if the document changed while the request was in
+			# flight or the slot was evicted in the meantime.
+			if slot.generation != generation:
+				return lookup
+			if self.lookupCache.peek(slot.getHash()) is not slot:
+				return lookup
+			try:
+				slot.registered.result()
+			except IOError:
+				return lookup
+			slot.entries[key] = lookup
+		return lookup
+
+	def __dropLookup(self, slot):
+		if slot.own:
+			self.__lookupWatches -= 1
+		self.__unwatch(slot)
+
+	def _invalidateLookup(self, doc):
+		with self.__lock:
+			slot = self.lookupCache.peek(doc)
+			if slot is not None:
+				slot.generation += 1
+				slot.entries.clear()
 
 	def create(self, store, typ, creator):
 		req = pb.CreateReq()
@@ -452,45 +638,157 @@ class _Connector(QtCore.QObject):
 		return Handle(self, store, cnf.handle, doc, rev)
 
 	def watch(self, w):
-		if w._incWatchRef() == 1:
-			(typ, h) = ref = w._getRef()
-			if ref not in self.watchHandlers:
-				req = pb.WatchAddReq()
-				req.type = typ
-				req.element = _checkUuid(h)
-				self._rpc(_Connector.WATCH_ADD_MSG, req.SerializeToString())
-				self.watchHandlers[ref] = []
-			tb = None #traceback.extract_stack()
-			self.watchHandlers[ref].append(weakref.ref(w,
-				lambda r, ref=ref, tb=tb: self.__delWatch(r, ref, tb)))
+		self.watchMany([w])
+
+	def watchMany(self, watches):
+		"""Arm many watches with a single request to the server.
+
+		Watches on the same (type, element) share one server side watch, so
+		only elements which are not watched yet are sent.
+		"""
+		with self.__lock:
+			for w in watches:
+				self.__watch(w)
+			try:
+				self._flushWatches().result()
+			except IOError:
+				# The server stops at the first watch it cannot arm but keeps
+				# those before. Drop the handlers and disarm the elements which
+				# nobody else watches again, which is harmless where the server
+				# did not arm them.
+				for w in watches:
+					self.__unwatch(w)
+				try:
+					self._flushWatches().result()
+				except IOError:
+					pass
+				raise
+
+	def __watch(self, w):
+		# Registers the handler at once. The server is only told with the
+		# next request or _flushWatches().
+		with self.__lock:
+			if w._incWatchRef() == 1:
+				(typ, h) = ref = w._getRef()
+				if ref not in self.watchHandlers:
+					_checkUuid(h)
+					self.__queueWatch(ref, True)
+					self.watchHandlers[ref] = []
+				tb = None #traceback.extract_stack()
+				self.watchHandlers[ref].append(weakref.ref(w,
+					lambda r, ref=ref, tb=tb: self.__delWatch(r, ref, tb)))
+				self.__checkLookupWatch(ref)
 
 	def __delWatch(self, watchObjRef, watchSpec, tb):
 		if tb:
 			print >>sys.stderr, "Warning: watch object has been deleted while being armed!"
 			for line in traceback.format_list(tb)[:-1]:
 				print >>sys.stderr, line,
-		self.watchHandlers[watchSpec].remove(watchObjRef)
-		if self.watchHandlers[watchSpec] == []:
-			(typ, h) = watchSpec
-			req = pb.WatchRemReq()
-			req.type = typ
-			req.element = h
-			self._rpc(_Connector.WATCH_REM_MSG, req.SerializeToString())
-			del self.watchHandlers[watchSpec]
+		with self.__lock:
+			# unwatch() may have dropped the handler already, e.g. when a path
+			# watch released itself while its indication was dispatched
+			handlers = self.watchHandlers.get(watchSpec, [])
+			if watchObjRef not in handlers:
+				return
+			handlers.remove(watchObjRef)
+			if handlers == []:
+				self.__queueWatch(watchSpec, False)
+				del self.watchHandlers[watchSpec]
+			else:
+				self.__checkLookupWatch(watchSpec)
 
 	def unwatch(self, w):
-		if w._decWatchRef() == 0:
-			(typ, h) = ref = w._getRef()
-			oldHandlers = self.watchHandlers[ref]
-			newHandlers = [x for x in oldHandlers if x() != w]
-			if newHandlers == []:
-				req = pb.WatchRemReq()
-				req.type = typ
-				req.element = h
-				self._rpc(_Connector.WATCH_REM_MSG, req.SerializeToString())
-				del self.watchHandlers[ref]
+		self.unwatchMany([w])
+
+	def unwatchMany(self, watches):
+		"""Disarm many watches with a single request to the server."""
+		with self.__lock:
+			for w in watches:
+				self.__unwatch(w)
+			self._flushWatches().result()
+
+	def __unwatch(self, w):
+		with self.__lock:
+			if w._decWatchRef() == 0:
+				ref = w._getRef()
+				oldHandlers = self.watchHandlers[ref]
+				newHandlers = [x for x in oldHandlers if x() != w]
+				if newHandlers == []:
+					self.__queueWatch(ref, False)
+					del self.watchHandlers[ref]
+				else:
+					self.watchHandlers[ref] = newHandlers
+					self.__checkLookupWatch(ref)
+
+	def __checkLookupWatch(self, ref):
+		# A lookup slot needs a watch of its own once nobody else watches its
+		# document, e.g. when the temporary watches of a prefetch are released,
+		# and no longer when somebody else does. Slots which would exceed the
+		# limit are dropped instead of evicting the others.
+		if ref[0] != Watch.TYPE_DOC:
+			return
+		slot = self.lookupCache.peek(ref[1])
+		if slot is None:
+			return
+		alone = len(self.watchHandlers[ref]) == 1
+		if alone == slot.own:
+			return
+		if not alone:
+			slot.own = False
+			self.__lookupWatches -= 1
+		elif self.__lookupWatches < _Connector.LOOKUP_WATCH_LIMIT:
+			slot.own = True
+			self.__lookupWatches += 1
+		else:
+			self.lookupCache.pop(ref[1])
+			self.__unwatch(slot)
+
+	def __queueWatch(self, ref, add):
+		# adding and removing the same element before a flush cancels out
+		if add:
+			if ref in self.__watchRem:
+				self.__watchRem.remove(ref)
 			else:
-				self.watchHandlers[ref] = newHandlers
+				self.__watchAdd.add(ref)
+		else:
+			if ref in self.__watchAdd:
+				self.__watchAdd.remove(ref)
+			else:
+				self.__watchRem.add(ref)
+
+	def watchCount(self):
+		"""Return the number of distinct elements watched on the server."""
+		with self.__lock:
+			return len(self.watchHandlers)
+
+	def _flushWatches(self):
+		# Send all queued watch changes. Returns a future which is done when
+		# the server has processed them.
+		with self.__lock:
+			if not (self.__watchAdd or self.__watchRem or self.__watchSlots):
+				# nothing queued, which is the case before almost every request
+				return Future.completed(None)
+			items = [ (True, ref) for ref in self.__watchAdd ]
+			items.extend([ (False, ref) for ref in self.__watchRem ])
+			self.__watchAdd.clear()
+			self.__watchRem.clear()
+			futures = []
+			for start in xrange(0, len(items), _Connector.WATCH_MANY_BATCH):
+				req = pb.WatchManyReq()
+				for (add, (typ, h)) in items[start:start+_Connector.WATCH_MANY_BATCH]:
+					if add:
+						item = req.add.add()
+					else:
+						item = req.rem.add()
+					item.type = typ
+					item.element = h
+				futures.append(self.__request(_Connector.WATCH_MANY_MSG,
+					req.SerializeToString()))
+			future = _Gather(futures, lambda done: None)
+			for slot in self.__watchSlots:
+				slot.registered = future
+			del self.__watchSlots[:]
+			return future
 
 	def forget(self, store, doc, rev):
 		req = pb.ForgetReq()
@@ -498,6 +796,7 @@ class _Connector(QtCore.QObject):
 		req.doc = _checkUuid(doc)
 		req.rev = _checkUuid(rev)
 		self._rpc(_Connector.FORGET_MSG, req.SerializeToString())
+		self._invalidateLookup(doc)
 
 	def deleteDoc(self, store, doc, rev):
 		req = pb.DeleteDocReq()
@@ -505,12 +804,15 @@ class _Connector(QtCore.QObject):
 		req.doc = _checkUuid(doc)
 		req.rev = _checkUuid(rev)
 		self._rpc(_Connector.DELETE_DOC_MSG, req.SerializeToString())
+		self._invalidateLookup(doc)
 
 	def deleteRev(self, store, rev):
 		req = pb.DeleteRevReq()
 		req.store = _checkUuid(store)
 		req.rev = _checkUuid(rev)
 		self._rpc(_Connector.DELETE_REV_MSG, req.SerializeToString())
+		with self.__lock:
+			self.statCache.remove(lambda key: key[0] == rev)
 
 	def forwardDoc(self, store, doc, fromRev, toRev, srcStore, depth=None, verbose=False):
 		req = pb.ForwardDocReq()
@@ -523,6 +825,7 @@ class _Connector(QtCore.QObject):
 			req.depth = depth
 		if verbose: req.verbose = verbose
 		self._rpc(_Connector.FORWARD_DOC_MSG, req.SerializeToString())
+		self._invalidateLookup(doc)
 
 	def replicateDoc(self, srcStore, doc, dstStore, depth=None, verbose=False, async=None):
 		req = pb.ReplicateDocReq()
@@ -532,6 +835,7 @@ class _Connector(QtCore.QObject):
 		if depth is not None:
 			req.depth = depth
 		if verbose: req.verbose = verbose
+		self._invalidateLookup(doc)
 		return self._rpc(_Connector.REPLICATE_DOC_MSG, req.SerializeToString(),
 			async, self.__replicateDocDone)
 
@@ -589,20 +893,163 @@ class _Connector(QtCore.QObject):
 		return cnf.path
 
 	def walkPath(self, path):
-		req = pb.WalkPathReq()
-		req.path = path
-		reply = self._rpc(_Connector.WALK_PATH_MSG, req.SerializeToString())
-		cnf = pb.WalkPathCnf.FromString(reply)
-		return [ (item.store, item.doc) for item in cnf.items ]
+		return Pipeline(self).walkPath(path).result()
+
+	def resolvePath(self, path):
+		"""Resolve a 'label:dir/.../name' path to (store, doc) with caching.
+
+		Every prefix of the path is cached together with the documents along
+		the way, which are watched. A change of any of them drops all paths
+		that lead through it. A cached path costs no round trip, an uncached
+		one two: the first walks all prefixes, the second arms the watches and
+		walks them again to catch changes before the watches took effect.
+
+		Entries which merely get a competing title in a folder are not
+		noticed, so the first match by title may be stale in that case.
+		"""
+		(label, sep, rest) = path.partition(':')
+		if not sep:
+			raise IOError('Invalid path')
+		steps = tuple(rest.split('/')) if rest else ()
+		with self.__lock:
+			entry = self.pathCache.get((label, steps))
+			if entry is not None:
+				return entry[:2]
+
+		prefixes = [ steps[:i] for i in xrange(len(steps)+1) ]
+		chain = self.__walkPrefixes(label, prefixes)
+
+		with self.__lock:
+			watches = [ self.__pathWatch(doc) for doc in chain[1:] ]
+			generations = [ w.generation for w in watches ]
+		try:
+			verify = self.__walkPrefixes(label, prefixes)
+			with self.__lock:
+				# Only cache if nothing changed since the watches were armed.
+				if verify == chain and generations == [ w.generation for w in watches ]:
+					for i in xrange(len(prefixes)):
+						self.__cachePath((label, prefixes[i]), chain[:i+2])
+		finally:
+			with self.__lock:
+				for w in watches:
+					self.__releasePathWatch(w)
+		return (verify[0], verify[-1])
+
+	def pathCacheInfo(self):
+		"""Return (hits, misses, size, maxSize) of the path cache."""
+		with self.__lock:
+			return self.pathCache.info()
+
+	def __walkPrefixes(self, label, prefixes):
+		# Returns [store, root, doc1, ..., docN] for the path prefixes
+		with self.pipeline() as p:
+			futures = [ p.walkPath(label + ':' + '/'.join(prefix))
+				for prefix in prefixes ]
+		result = []
+		for future in futures:
+			items = future.result()
+			if len(items) != 1:
+				raise IOError("Invalid server reply!")
+			(store, doc) = items[0]
+			result.append(doc)
+		return [store] + result
+
+	def __pathWatch(self, doc):
+		# The watch is only queued. The next walk flushes it before the
+		# server starts walking.
+		w = self.pathWatches.get(doc)
+		if w is None:
+			w = self.pathWatches[doc] = _PathWatch(self, doc)
+			self.__watch(w)
+		w.users += 1
+		return w
+
+	def __releasePathWatch(self, w):
+		w.users -= 1
+		if w.users == 0 and not w.keys:
+			del self.pathWatches[w.getHash()]
+			self.__unwatch(w)
+
+	def __cachePath(self, key, chain):
+		old = self.pathCache.pop(key)
+		if old is not None:
+			self.__dropPath(key, old)
+		self.pathCache.put(key, (chain[0], chain[-1], chain[1:]))
+		for doc in chain[1:]:
+			self.pathWatches[doc].keys.add(key)
+
+	def __dropPath(self, key, entry):
+		# a document may appear several times along a path
+		for doc in set(entry[2]):
+			w = self.pathWatches.get(doc)
+			if w is None:
+				continue
+			w.keys.discard(key)
+			if not w.keys and w.users == 0:
+				del self.pathWatches[doc]
+				self.__unwatch(w)
+
+	def _invalidatePath(self, w):
+		with self.__lock:
+			for key in list(w.keys):
+				entry = self.pathCache.pop(key)
+				if entry is not None:
+					self.__dropPath(key, entry)
 
 	def flush(self):
-		while self.socket.flush():
-			self.socket.waitForBytesWritten(10000)
+		with self.__lock:
+			# the transport reads while flushing, don't get in the way
+			while self.__reader not in (None, threading.current_thread()):
+				self.__readDone.wait()
+			self.__transport.flush()
+			if self.recorder:
+				self.recorder.flush()
+
+	def record(self, f):
+		"""Record all traffic of the connection into the file object 'f'.
+
+		The recording can be replayed without a server by replay.py. Pass
+		None to stop recording.
+		"""
+		with self.__lock:
+			if self.recorder:
+				self.recorder.flush()
+			if f is None:
+				self.recorder = None
+			else:
+				self.recorder = Recorder(f)
+
+	def setIndicationWindow(self, window):
+		"""Collect indications for 'window' seconds before dispatching them.
+
+		Identical watch indications of a window are delivered only once and
+		only the latest progress of each running job is reported. A window of
+		zero dispatches at once but still coalesces what arrived together.
+		"""
+		with self.__lock:
+			self.indicationWindow = window
+
+	def indicationInfo(self):
+		"""Return (delivered, merged, dropped) counts of indications.
+
+		Merged are watch indications which were folded into an identical one,
+		dropped are progress reports that were superseded by a later one.
+		"""
+		with self.__lock:
+			return tuple(self.__indicationStats)
 
 	def process(self, timeout=1):
-		if self.socket.waitForReadyRead(timeout):
-			self.__readReady()
-		self.__dispatchIndications()
+		with self.__lock:
+			if self.__reader in (None, threading.current_thread()):
+				self.__wait(timeout)
+			else:
+				# another thread reads, give it the chance to deliver
+				self.__readDone.wait(None if timeout < 0 else timeout / 1000.0)
+			self.__dispatchIndications()
+
+	def close(self):
+		with self.__lock:
+			self.__transport.close()
 
 	def regProgressHandler(self, start=None, progress=None, stop=None):
 		if start or progress:
@@ -661,18 +1108,6 @@ class _Connector(QtCore.QObject):
 
 	# protected functions
 
-	class _PollCompletion(object):
-		__slots__ = ['pending', 'cnf', 'reply']
-		def __init__(self):
-			self.pending = True
-			self.cnf = None
-			self.reply = None
-
-		def setResult(self, cnf, reply):
-			self.cnf = cnf
-			self.reply = reply
-			self.pending = False
-
 	class _AsyncCompletion(object):
 		__slots__ = ['__callback', '__msg', '__done']
 		def __init__(self, msg, callback, done):
@@ -687,96 +1122,226 @@ class _Connector(QtCore.QObject):
 				error_cnf = pb.ErrorCnf.FromString(reply)
 				self.__callback(IOError(_errorCodes[error_cnf.error]))
 
+	def _request(self, msg, request = '', done=lambda x: x):
+		with self.__lock:
+			# queued watches must be armed before any later request
+			self._flushWatches()
+			return self.__request(msg, request, done)
+
+	def __request(self, msg, request, done=lambda x: x):
+		future = Future(self, msg, done)
+		with self.__lock:
+			ref = self.__make_ref()
+			self.confirmations[ref] = future
+			self.__send(ref, msg, request)
+		return future
+
 	def _rpc(self, msg, request = '', async=None, done=lambda x: x):
-		ref = self.__make_ref()
-		req_msg = (msg << 4) | _Connector.FLAG_REQ
 		if async:
-			completion = _Connector._AsyncCompletion(msg, async, done)
+			with self.__lock:
+				self._flushWatches()
+				ref = self.__make_ref()
+				self.confirmations[ref] = _Connector._AsyncCompletion(msg, async, done)
+				self.__send(ref, msg, request)
 		else:
-			completion = _Connector._PollCompletion()
-		self.confirmations[ref] = completion
-		self.__send(struct.pack('>LH', ref, req_msg) + request)
-		if not async:
-			start = time.time()
-			self.__poll(completion)
-			end = time.time()
-			#print "RPC sync:", _requestNames[msg], int((end-start)*1000000)
-			if completion.cnf == msg:
-				return done(completion.reply)
-			elif completion.cnf == _Connector.ERROR_MSG:
-				error_cnf = pb.ErrorCnf.FromString(completion.reply)
-				_raiseError(error_cnf.error)
-			else:
-				raise IOError("Invalid server reply!")
+			return self._request(msg, request, done).result()
+
+	def _poll(self, completion):
+		# Only one thread reads from the socket at a time. It delivers the
+		# confirmations of all other threads too, which sleep until it has
+		# read the next chunk and then check their request again.
+		with self.__lock:
+			self.recursion += 1
+			try:
+				# loop until we've received the answer
+				while completion.pending:
+					if self.__reader not in (None, threading.current_thread()):
+						self.__readDone.wait()
+					elif not self.__wait(-1):
+						raise IOError("Error while waiting for data from server: "
+							+ self.__transport.errorString())
+			finally:
+				self.recursion -= 1
+
+	def __wait(self, timeout):
+		# Wait on the transport with the lock released, so that other threads
+		# can still send their requests meanwhile. Must be called with the
+		# lock held and without another thread reading. The lock is released
+		# completely, like Condition.wait() does, even if the caller holds it
+		# several times.
+		reader = self.__reader
+		self.__reader = threading.current_thread()
+		state = self.__readDone._release_save()
+		try:
+			return self.__transport.wait(timeout)
+		finally:
+			self.__readDone._acquire_restore(state)
+			self.__reader = reader
+			if reader is None:
+				self.__readDone.notify_all()
 
 	# private functions
 
-	def __send(self, packet):
-		raw = struct.pack('>H', len(packet)) + packet
-		if self.socket.write(raw) == -1:
-			raise IOError("Could not send request to server: "
-				+ str(self.socket.errorString()))
-
-	def __readReady(self):
-		# unpack incoming packets
+	def __send(self, ref, msg, request):
+		stats = metrics.get()
+		if stats:
+			stats.request(msg, len(request) + 8)
+			self.sent[ref] = (msg, time.time())
+		packet = _packetHeader.pack(len(request) + 6, ref,
+			(msg << 4) | _Connector.FLAG_REQ) + request
+		if self.recorder:
+			self.recorder.sent(packet)
+		self.__transport.send(packet)
+
+	def __readReady(self, data):
+		with self.__lock:
+			if self.recorder:
+				self.recorder.received(data)
+			self.__unpack(data)
+
+	def __unpack(self, data):
+		# Unpack incoming packets. The buffer is only compacted once per chunk
+		# of received data and the packet bodies are copied exactly once.
 		indications = False
-		self.buf = self.buf + str(self.socket.readAll())
-		while len(self.buf) > 2:
-			expect = struct.unpack_from('>H', self.buf, 0)[0] + 2
-			if expect <= len(self.buf):
-				packet = self.buf[2:expect]
-				self.buf = self.buf[expect:]
-
-				# immediately remove indications
-				(ref, msg) = struct.unpack_from('>LH', packet, 0)
-				typ = msg & 3
-				msg = msg >> 4
-				if typ == _Connector.FLAG_IND:
-					indications = True
-					self.indications.append((msg, packet[6:]))
-				elif typ == _Connector.FLAG_CNF:
-					self.confirmations[ref].setResult(msg, packet[6:])
-					del self.confirmations[ref]
-			else:
+		completed = []
+		stats = metrics.get()
+		buf = self.buf
+		buf.extend(data)
+		view = memoryview(buf)
+		avail = len(buf)
+		pos = 0
+		while avail - pos >= 8:
+			(length, ref, msg) = _packetHeader.unpack_from(buf, pos)
+			end = pos + length + 2
+			if end > avail:
 				break
+			body = view[pos+8:end].tobytes()
+			pos = end
+
+			# immediately remove indications
+			typ = msg & 3
+			msg = msg >> 4
+			if typ == _Connector.FLAG_IND:
+				indications = True
+				if msg == _Connector.WATCH_MSG:
+					# Invalidate cached lookups right away. The watch handlers
+					# might run much later but must not see stale heads.
+					body = pb.WatchInd.FromString(body)
+					if body.type == Watch.TYPE_DOC:
+						self._invalidateLookup(body.element)
+				self.indications.append((msg, body))
+				if stats:
+					stats.indication(msg, length + 2)
+			elif typ == _Connector.FLAG_CNF:
+				completed.append((self.confirmations.pop(ref), msg, body))
+				if self.sent:
+					self.__measure(stats, ref, msg, length + 2)
+
+		# The buffer cannot be resized while it is exported. Asynchronous
+		# completions may call back into the connector, so release it first.
+		del view
+		del buf[:pos]
+		for (completion, msg, body) in completed:
+			completion.setResult(msg, body)
 
 		if indications:
 			self.__dispatchIndications()
 
+	def __measure(self, stats, ref, msg, size):
+		sent = self.sent.pop(ref, None)
+		if stats and sent:
+			(req, start) = sent
+			stats.confirm(req, size, time.time() - start,
+				msg == _Connector.ERROR_MSG)
+
 	def __dispatchIndications(self):
 		# dispatch received indications if not in recursion
-		if self.recursion == 0:
-			dispatched = True
-			while dispatched:
-				dispatched = False
-				indications = self.indications[:]
-				self.indications = []
-				for (msg, packet) in indications:
-					dispatched = True
-					if msg == _Connector.WATCH_MSG:
-						ind = pb.WatchInd.FromString(packet)
-						# make explicit copy as watches may get modified by callouts!
-						matches = self.watchHandlers.get((ind.type, ind.element), [])[:]
-						for i in matches:
-							i = i() # dereference weakref
-							if i is not None:
-								i.triggered(ind.event, ind.store)
-					elif msg == _Connector.PROGRESS_START_MSG:
-						ind = pb.ProgressStartInd.FromString(packet)
-						handlers = [h for (e,h) in self.progressHandlers if e == msg]
-						self.__dispatchProgressStart(ind, handlers)
-					elif msg == _Connector.PROGRESS_MSG:
-						ind = pb.ProgressInd.FromString(packet)
-						handlers = [h for (e,h) in self.progressHandlers if e == msg]
-						self.__dispatchProgress(ind, handlers)
-					elif msg == _Connector.PROGRESS_END_MSG:
-						ind = pb.ProgressEndInd.FromString(packet)
-						handlers = self.progressHandlers[:]
-						for (event, handler) in handlers:
-							if event == msg:
-								handler(ind.tag)
-		else:
-			self.watchReady.emit()
+		if self.recursion != 0:
+			self.__transport.defer()
+			return
+
+		# hold back indications until the window is over
+		if self.indications and self.indicationWindow > 0:
+			now = time.time()
+			if self.__indicationDue is None:
+				self.__indicationDue = now + self.indicationWindow
+			if now < self.__indicationDue:
+				if not self.__indicationTimer:
+					self.__indicationTimer = True
+					self.__transport.defer(self.__indicationDue - now)
+				return
+		self.__indicationDue = None
+
+		dispatched = True
+		while dispatched:
+			dispatched = False
+			indications = self.__coalesceIndications(self.indications)
+			self.indications = []
+			self.__indicationStats[0] += len(indications)
+			for (msg, ind) in indications:
+				dispatched = True
+				if msg == _Connector.WATCH_MSG:
+					# make explicit copy as watches may get modified by callouts!
+					matches = self.watchHandlers.get((ind.type, ind.element), [])[:]
+					for i in matches:
+						i = i() # dereference weakref
+						if i is not None:
+							i.triggered(ind.event, ind.store)
+				elif msg == _Connector.PROGRESS_START_MSG:
+					handlers = [h for (e,h) in self.progressHandlers if e == msg]
+					self.__dispatchProgressStart(ind, handlers)
+				elif msg == _Connector.PROGRESS_MSG:
+					handlers = [h for (e,h) in self.progressHandlers if e == msg]
+					self.__dispatchProgress(ind, handlers)
+				elif msg == _Connector.PROGRESS_END_MSG:
+					handlers = self.progressHandlers[:]
+					for (event, handler) in handlers:
+						if event == msg:
+							handler(ind.tag)
+
+	def __deferred(self):
+		with self.__lock:
+			self.__indicationTimer = False
+			self.__dispatchIndications()
+
+	def __coalesceIndications(self, indications):
+		# Decode the indications and fold duplicates into the first one.
+		# Watch indications only tell that something has changed, so one of
+		# each kind is enough. Running progress reports are replaced by the
+		# latest one of their tag. Errors and pauses are always kept and the
+		# start and end of a job are never reordered.
+		result = []
+		watches = set()
+		progress = {}
+		(merged, dropped) = (0, 0)
+		for (msg, packet) in indications:
+			if msg == _Connector.WATCH_MSG:
+				ind = packet # already decoded by __unpack()
+				key = (ind.type, ind.element, ind.event, ind.store)
+				if key in watches:
+					merged += 1
+					continue
+				watches.add(key)
+			elif msg == _Connector.PROGRESS_MSG:
+				ind = pb.ProgressInd.FromString(packet)
+				i = progress.get(ind.tag)
+				if i is not None and result[i][1].state == _Connector.PROGRESS_RUNNING:
+					result[i] = (msg, ind)
+					dropped += 1
+					continue
+				progress[ind.tag] = len(result)
+			elif msg == _Connector.PROGRESS_START_MSG:
+				ind = pb.ProgressStartInd.FromString(packet)
+				progress.pop(ind.tag, None)
+			elif msg == _Connector.PROGRESS_END_MSG:
+				ind = pb.ProgressEndInd.FromString(packet)
+				progress.pop(ind.tag, None)
+			else:
+				continue
+			result.append((msg, ind))
+		self.__indicationStats[1] += merged
+		self.__indicationStats[2] += dropped
+		return result
 
 	def __dispatchProgressStart(self, ind, handlers):
 		for handler in handlers:
@@ -793,24 +1358,505 @@ class _Connector(QtCore.QObject):
 		for handler in handlers:
 			handler(ind.tag, ind.state, ind.progress, **kwargs)
 
-	def __poll(self, completion):
-		self.recursion += 1
-		try:
-			# loop until we've received the answer
-			while completion.pending:
-				if not self.socket.waitForReadyRead(-1):
-					raise IOError("Error while waiting for data from server: "
-						+ str(self.socket.errorString()))
-				self.__readReady()
-		finally:
-			self.recursion -= 1
-
 	def __make_ref(self):
 		ref = self.next
-		self.next += 1
+		# 0xFFFFFFFF is reserved for indications
+		self.next = (ref + 1) % 0xFFFFFFFF
 		return ref
 
 
+class Future(object):
+	"""Pending result of a request which has already been sent to the server.
+
+	The confirmation is matched by the reference of the request and may arrive
+	at any time the connector reads from the socket. result() blocks until it
+	is there and either returns the decoded reply or raises an IOError.
+	"""
+	__slots__ = ['__connector', '__msg', '__done', '__result', 'pending',
+		'cnf', 'reply']
+
+	__NONE = object()
+
+	def __init__(self, connector, msg, done):
+		self.__connector = connector
+		self.__msg = msg
+		self.__done = done
+		self.__result = Future.__NONE
+		self.pending = True
+		self.cnf = None
+		self.reply = None
+
+	def setResult(self, cnf, reply):
+		self.cnf = cnf
+		self.reply = reply
+		self.pending = False
+
+	@staticmethod
+	def completed(value):
+		future = Future(None, None, None)
+		future.pending = False
+		future.__result = value
+		return future
+
+	def ready(self):
+		return not self.pending
+
+	def wait(self):
+		if self.pending:
+			self.__connector._poll(self)
+
+	def result(self):
+		if self.__result is Future.__NONE:
+			self.wait()
+			if self.cnf == self.__msg:
+				self.__result = self.__done(self.reply)
+			elif self.cnf == _Connector.ERROR_MSG:
+				error_cnf = pb.ErrorCnf.FromString(self.reply)
+				_raiseError(error_cnf.error)
+			else:
+				raise IOError("Invalid server reply!")
+		return self.__result
+
+
+class _Gather(object):
+	"""Future of several requests whose results are combined in the end."""
+	__slots__ = ['__futures', '__combine']
+
+	def __init__(self, futures, combine):
+		self.__futures = futures
+		self.__combine = combine
+
+	def ready(self):
+		return all(future.ready() for future in self.__futures)
+
+	def wait(self):
+		for future in self.__futures:
+			future.wait()
+
+	def result(self):
+		return self.__combine([ future.result() for future in self.__futures ])
+
+
+class _Retry(object):
+	"""Future of a request which is issued again in another way if it fails.
+
+	'retry' is called with the IOError of the request. It either re-raises
+	the error or returns the futures which replace the request.
+	"""
+	__slots__ = ['__future', '__retry']
+
+	def __init__(self, future, retry):
+		self.__future = future
+		self.__retry = retry
+
+	def ready(self):
+		return self.__future.ready()
+
+	def wait(self):
+		self.__future.wait()
+
+	def result(self):
+		try:
+			return self.__future.result()
+		except IOError, error:
+			if self.__retry is None:
+				raise
+			retry = self.__retry
+			self.__retry = None
+			self.__future = _Gather(retry(error), lambda done: None)
+			return self.__future.result()
+
+
+class Pipeline(object):
+	"""Issue requests without waiting for the reply of each one.
+
+	Every method sends its request at once and returns a Future. Sending all
+	requests of a batch first and collecting the results afterwards costs
+	roughly one round trip instead of one per request:
+
+		with Connector().pipeline() as p:
+			lookups = [ p.lookupDoc(doc) for doc in docs ]
+		revs = [ l.result().revs() for l in lookups ]
+
+	Leaving the 'with' block waits for all outstanding confirmations. Futures
+	of peek() yield a Handle which must be closed by the caller, so always
+	fetch their result.
+	"""
+
+	def __init__(self, connector):
+		self.__connector = connector
+		self.__futures = []
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, type, value, traceback):
+		self.wait()
+		return False
+
+	def wait(self):
+		for future in self.__futures:
+			future.wait()
+		self.__futures = []
+
+	def lookupDoc(self, doc, stores=[], cached=True):
+		# The heads of documents are cached until the server reports a change
+		# through a watch, so the Lookup objects are shared and read-only.
+		# Without 'cached' the server is asked and the cache is left alone.
+		if cached:
+			(lookup, token) = self.__connector._cachedLookup(_checkUuid(doc),
+				stores)
+			if lookup is not None:
+				return Future.completed(lookup)
+		else:
+			token = None
+		req = pb.LookupDocReq()
+		req.doc = doc
+		for store in stores:
+			req.stores.append(_checkUuid(store))
+		return self.__issue(_Connector.LOOKUP_DOC_MSG, req,
+			lambda reply: self.__connector._cacheLookup(token,
+				Lookup(pb.LookupDocCnf.FromString(reply))))
+
+	def lookupDocs(self, docs, stores=[]):
+		"""Look up many documents at once.
+
+		Returns a Lookup for each document in the order of 'docs'. Documents
+		which are not cached are requested in batches of LOOKUP_MANY_BATCH, or
+		less if the replies would not fit into a packet.
+		"""
+		connector = self.__connector
+		stores = [ _checkUuid(store) for store in stores ]
+		results = []
+		missing = []
+		for doc in docs:
+			(lookup, token) = connector._cachedLookup(_checkUuid(doc), stores)
+			if lookup is None:
+				missing.append((len(results), token))
+			results.append(lookup)
+		futures = [ self.__lookupMany(docs, stores, batch, results) for batch
+			in self.__batches(_Connector.LOOKUP_MANY_MSG, missing,
+				_Connector.LOOKUP_MANY_BATCH) ]
+		return _Gather(futures, lambda done: results)
+
+	def __lookupMany(self, docs, stores, batch, results):
+		req = pb.LookupManyReq()
+		for (i, token) in batch:
+			req.docs.append(docs[i])
+		req.stores.extend(stores)
+		return self.__issueBatch(_Connector.LOOKUP_MANY_MSG, req, len(batch),
+			lambda reply: self.__lookupManyDone(reply, batch, results),
+			lambda error: self.__split(error, batch,
+				lambda half: self.__lookupMany(docs, stores, half, results)))
+
+	def __lookupManyDone(self, reply, batch, results):
+		cnf = pb.LookupManyCnf.FromString(reply)
+		for ((i, token), item) in zip(batch, cnf.results):
+			results[i] = self.__connector._cacheLookup(token, Lookup(item))
+
+	def lookupRev(self, rev, stores=[]):
+		req = pb.LookupRevReq()
+		req.rev = _checkUuid(rev)
+		for store in stores:
+			req.stores.append(_checkUuid(store))
+		return self.__issue(_Connector.LOOKUP_REV_MSG, req,
+			lambda reply: pb.LookupRevCnf.FromString(reply).stores)
+
+	def stat(self, rev, stores=[]):
+		# Revisions are immutable, so their Stat can be cached forever. Only
+		# the set of stores where the revision was found matters.
+		key = (rev, frozenset(stores))
+		stat = self.__connector._cachedStat(key)
+		if stat is not None:
+			return Future.completed(stat)
+		req = pb.StatReq()
+		req.rev = _checkUuid(rev)
+		for store in stores:
+			req.stores.append(_checkUuid(store))
+		return self.__issue(_Connector.STAT_MSG, req,
+			lambda reply: self.__connector._cacheStat(key,
+				Stat(pb.StatCnf.FromString(reply))))
+
+	def statMany(self, revs, stores=[]):
+		"""Stat many revisions at once.
+
+		The result holds a Stat or, if the revision could not be found, an
+		IOError for each revision in the order of 'revs'. Revisions which are
+		not cached are requested in batches of STAT_MANY_BATCH, or less if the
+		replies would not fit into a packet.
+		"""
+		connector = self.__connector
+		stores = [ _checkUuid(store) for store in stores ]
+		storeSet = frozenset(stores)
+		results = [ connector._cachedStat((rev, storeSet)) for rev in revs ]
+		missing = [ i for (i, stat) in enumerate(results) if stat is None ]
+		futures = [ self.__statMany(revs, stores, storeSet, batch, results)
+			for batch in self.__batches(_Connector.STAT_MANY_MSG, missing,
+				_Connector.STAT_MANY_BATCH) ]
+		return _Gather(futures, lambda done: results)
+
+	def __statMany(self, revs, stores, storeSet, batch, results):
+		req = pb.StatManyReq()
+		for i in batch:
+			req.revs.append(_checkUuid(revs[i]))
+		req.stores.extend(stores)
+		return self.__issueBatch(_Connector.STAT_MANY_MSG, req, len(batch),
+			lambda reply: self.__statManyDone(reply, revs, storeSet, batch,
+				results),
+			lambda error: self.__split(error, batch,
+				lambda half: self.__statMany(revs, stores, storeSet, half,
+					results)))
+
+	def __statManyDone(self, reply, revs, storeSet, batch, results):
+		cnf = pb.StatManyCnf.FromString(reply)
+		for (i, item) in zip(batch, cnf.results):
+			if item.HasField('stat'):
+				results[i] = self.__connector._cacheStat((revs[i], storeSet),
+					Stat(item.stat))
+			else:
+				results[i] = IOError(_errorCodes.get(item.error, 'Unknown error'))
+
+	def getLinks(self, rev, stores=[]):
+		req = pb.GetLinksReq()
+		req.rev = _checkUuid(rev)
+		for store in stores:
+			req.stores.append(_checkUuid(store))
+		return self.__issue(_Connector.GET_LINKS_MSG, req, self.__getLinksDone)
+
+	@staticmethod
+	def __getLinksDone(reply):
+		cnf = pb.GetLinksCnf.FromString(reply)
+		return (cnf.doc_links, cnf.rev_links)
+
+	def peek(self, store, rev):
+		req = pb.PeekReq()
+		req.store = _checkUuid(store)
+		req.rev = _checkUuid(rev)
+		return self.__issue(_Connector.PEEK_MSG, req,
+			lambda reply: Handle(self.__connector, store,
+				pb.PeekCnf.FromString(reply).handle, None, rev))
+
+	def walkPath(self, path):
+		req = pb.WalkPathReq()
+		req.path = path
+		return self.__issue(_Connector.WALK_PATH_MSG, req,
+			lambda reply: [ (item.store, item.doc) for item in
+				pb.WalkPathCnf.FromString(reply).items ])
+
+	def getRevData(self, store, rev, selectors=[''], lazy=False):
+		"""Read structured data of a revision without opening a handle.
+
+		Returns the data of each selector in the same order. Raises an IOError
+		if the revision or any of the selectors cannot be read.
+		"""
+		return _Gather([self.getRevDataValues(store, rev, selectors, lazy)],
+			self.__getRevDataDone)
+
+	@staticmethod
+	def __getRevDataDone(done):
+		[values] = done
+		for value in values:
+			if isinstance(value, IOError):
+				raise value
+		return values
+
+	def getRevDataValues(self, store, rev, selectors=[''], lazy=False):
+		"""Read structured data of a revision, one value per selector.
+
+		Like getRevData() but selectors which cannot be read yield an IOError
+		instead of failing the whole request. Raises an IOError if the
+		revision itself cannot be read.
+		"""
+		return _Gather([self.getRevDataMany([(store, rev, selectors)], lazy)],
+			self.__getRevDataValuesDone)
+
+	@staticmethod
+	def __getRevDataValuesDone(done):
+		[[values]] = done
+		if isinstance(values, IOError):
+			raise values
+		return values
+
+	def getRevDataMany(self, requests, lazy=False):
+		"""Read structured data of many revisions at once.
+
+		'requests' is a list of (store, rev, selectors) tuples. The result
+		holds a list of values for each request, where selectors which could
+		not be read yield an IOError. If the revision itself cannot be read
+		the list is replaced by an IOError.
+
+		The revisions are requested in batches of GET_REV_DATA_BATCH, or less
+		if the replies would not fit into a packet. If even a single revision
+		is too big its selectors are read one by one.
+		"""
+		results = [ None ] * len(requests)
+		futures = [ self.__revDataMany(requests, batch, results, lazy)
+			for batch in self.__batches(_Connector.GET_REV_DATA_MSG,
+				range(len(requests)), _Connector.GET_REV_DATA_BATCH) ]
+		return _Gather(futures, lambda done: results)
+
+	def __revDataMany(self, requests, batch, results, lazy):
+		req = self.__revDataReq([ requests[i] for i in batch ])
+		return self.__issueBatch(_Connector.GET_REV_DATA_MSG, req, len(batch),
+			lambda reply: self.__getRevDataManyDone(reply, requests, batch,
+				results, lazy),
+			lambda error: self.__revDataSplit(error, requests, batch, results,
+				lazy))
+
+	def __getRevDataManyDone(self, reply, requests, batch, results, lazy):
+		cnf = pb.GetRevDataCnf.FromString(reply)
+		for (i, result) in zip(batch, cnf.results):
+			results[i] = self.__revDataResult(requests[i][0], result, lazy)
+
+	def __revDataSplit(self, error, requests, batch, results, lazy):
+		if len(batch) > 1:
+			return self.__split(error, batch,
+				lambda half: self.__revDataMany(requests, half, results, lazy))
+		if error.args[0] != 'E2BIG':
+			raise error
+		# A single revision is too big. Read each selector on its own, those
+		# which are still too big keep the error.
+		[i] = batch
+		selectors = requests[i][2]
+		results[i] = [ error ] * len(selectors)
+		if len(selectors) < 2:
+			return []
+		return [ self.__revDataValue(requests, i, n, results, lazy)
+			for n in xrange(len(selectors)) ]
+
+	def __revDataValue(self, requests, i, n, results, lazy):
+		(store, rev, selectors) = requests[i]
+		req = self.__revDataReq([(store, rev, [selectors[n]])])
+		return _Retry(self.__issue(_Connector.GET_REV_DATA_MSG, req,
+			lambda reply: self.__revDataValueDone(reply, store, i, n, results,
+				lazy)),
+			self.__tooBig)
+
+	def __revDataValueDone(self, reply, store, i, n, results, lazy):
+		cnf = pb.GetRevDataCnf.FromString(reply)
+		for result in cnf.results[:1]:
+			values = self.__revDataResult(store, result, lazy)
+			if isinstance(values, IOError):
+				results[i] = values
+			elif not isinstance(results[i], IOError):
+				results[i][n] = values[0]
+
+	@staticmethod
+	def __tooBig(error):
+		# the value keeps its E2BIG error
+		if error.args[0] != 'E2BIG':
+			raise error
+		return []
+
+	@staticmethod
+	def __revDataReq(requests):
+		req = pb.GetRevDataReq()
+		for (store, rev, selectors) in requests:
+			item = req.items.add()
+			item.store = _checkUuid(store)
+			item.rev = _checkUuid(rev)
+			item.selectors.extend(selectors)
+		return req
+
+	@staticmethod
+	def __revDataResult(store, result, lazy):
+		if result.HasField('error'):
+			return IOError(_errorCodes.get(result.error, 'Unknown error'))
+		values = []
+		for value in result.values:
+			if value.HasField('error'):
+				values.append(IOError(_errorCodes.get(value.error, 'Unknown error')))
+			else:
+				values.append(loadPDSD(store, value.data, lazy))
+		return values
+
+	def getData(self, handle, selector, lazy=False):
+		if not handle.active:
+			raise IOError('Handle expired')
+		req = pb.GetDataReq()
+		req.handle = handle.handle
+		req.selector = selector
+		store = handle.getStore()
+		return self.__issue(_Connector.GET_DATA_MSG, req,
+			lambda reply: loadPDSD(store, pb.GetDataCnf.FromString(reply).data,
+				lazy))
+
+	def setData(self, handle, selector, data):
+		if not handle.active:
+			raise IOError('Handle expired')
+		req = pb.SetDataReq()
+		req.handle = handle.handle
+		req.selector = selector
+		req.data = dumpPDSD(data)
+		return self.__issue(_Connector.SET_DATA_MSG, req)
+
+	def read(self, handle, part, offset, length):
+		if not handle.active:
+			raise IOError('Handle expired')
+		req = pb.ReadReq()
+		req.handle = handle.handle
+		req.part = part
+		req.offset = offset
+		req.length = length
+		return self.__issue(_Connector.READ_MSG, req,
+			lambda reply: pb.ReadCnf.FromString(reply).data)
+
+	def writeBuffer(self, handle, part, data):
+		if not handle.active:
+			raise IOError('Handle expired')
+		req = pb.WriteBufferReq()
+		req.handle = handle.handle
+		req.part = part
+		req.data = data
+		return self.__issue(_Connector.WRITE_BUFFER_MSG, req)
+
+	def writeCommit(self, handle, part, offset, data):
+		if not handle.active:
+			raise IOError('Handle expired')
+		req = pb.WriteCommitReq()
+		req.handle = handle.handle
+		req.part = part
+		req.offset = offset
+		req.data = data
+		return self.__issue(_Connector.WRITE_COMMIT_MSG, req)
+
+	def close(self, handle):
+		if not handle.active:
+			raise IOError('Handle expired')
+		handle.active = False
+		req = pb.CloseReq()
+		req.handle = handle.handle
+		return self.__issue(_Connector.CLOSE_MSG, req)
+
+	def __batches(self, msg, items, limit):
+		size = self.__connector._batchSize(msg, limit)
+		return [ items[i:i+size] for i in xrange(0, len(items), size) ]
+
+	def __issueBatch(self, msg, req, count, done, retry):
+		def learn(reply):
+			self.__connector._learnReplySize(msg, len(reply), count)
+			return done(reply)
+		return _Retry(self.__issue(msg, req, learn), retry)
+
+	@staticmethod
+	def __split(error, batch, issue):
+		# The server refuses replies which do not fit into a packet. Our
+		# estimate was too low, so try again with two smaller batches.
+		if error.args[0] != 'E2BIG' or len(batch) < 2:
+			raise error
+		half = len(batch) // 2
+		return [ issue(batch[:half]), issue(batch[half:]) ]
+
+	def __issue(self, msg, req, done=lambda x: x):
+		future = self.__connector._request(msg, req.SerializeToString(), done)
+		# forget about finished requests from time to time to bound the
+		# memory of long running pipelines
+		if len(self.__futures) >= 1024:
+			self.__futures = [ f for f in self.__futures if f.pending ]
+		self.__futures.append(future)
+		return future
+
+
 class Watch(object):
 	EVENT_MODIFIED    = pb.WatchInd.modified
 	EVENT_APPEARED    = pb.WatchInd.appeared
@@ -846,6 +1892,42 @@ class Watch(object):
 		pass
 
 
+class _LookupSlot(Watch):
+	"""Cached Lookup objects of one document, keyed by the set of stores.
+
+	The slot watches the document as long as it is cached. Any event empties
+	it and bumps the generation so that replies which were already in flight
+	are not cached. 'own' tells if nobody else watches the document, so the
+	server watches it just for the slot.
+	"""
+
+	def __init__(self, doc, own):
+		super(_LookupSlot, self).__init__(Watch.TYPE_DOC, doc)
+		self.own = own
+		self.generation = 0
+		self.entries = {}
+		self.registered = None
+
+
+class _PathWatch(Watch):
+	"""Watch of a document along cached paths of _Connector.resolvePath().
+
+	'keys' are the cached paths which lead through the document. 'users'
+	counts resolvePath() calls which are still verifying a path.
+	"""
+
+	def __init__(self, connector, doc):
+		super(_PathWatch, self).__init__(Watch.TYPE_DOC, doc)
+		self.connector = connector
+		self.keys = set()
+		self.users = 0
+		self.generation = 0
+
+	def triggered(self, cause, store):
+		self.generation += 1
+		self.connector._invalidatePath(self)
+
+
 class Enum(object):
 
 	class Store(object):
@@ -919,7 +2001,7 @@ class Lookup(object):
 
 	def preRevs(self, store=None):
 		if store:
-			return self.__stores[store][1]
+			return self.__stores[store][1][:]
 		else:
 			return self.__preRevs.keys()
 
@@ -1011,6 +2093,10 @@ class Stat(object):
 
 
 class Handle(object):
+	# number of outstanding READ_MSG/WRITE_BUFFER_MSG requests while streaming
+	readAhead = 16
+	writeBehind = 16
+
 	def __init__(self, connector, store, handle, doc, rev):
 		self.__pos = { }
 		self.connector = connector
@@ -1041,20 +2127,11 @@ class Handle(object):
 	def _setPos(self, part, pos):
 		self.__pos[part] = pos
 
-	def getData(self, selector):
-		req = pb.GetDataReq()
-		req.handle = self.handle
-		req.selector = selector
-		reply = self.connector._rpc(_Connector.GET_DATA_MSG, req.SerializeToString())
-		data = pb.GetDataCnf.FromString(reply).data
-		return loadPDSD(self.__store, data)
+	def getData(self, selector, lazy=False):
+		return Pipeline(self.connector).getData(self, selector, lazy).result()
 
 	def setData(self, selector, data):
-		req = pb.SetDataReq()
-		req.handle = self.handle
-		req.selector = selector
-		req.data = dumpPDSD(data)
-		reply = self.connector._rpc(_Connector.SET_DATA_MSG, req.SerializeToString())
+		Pipeline(self.connector).setData(self, selector, data).result()
 
 	def seek(self, part, offset, whence = 0):
 		if whence == 0:
@@ -1068,71 +2145,120 @@ class Handle(object):
 	def tell(self, part):
 		return self._getPos(part)
 
-	def read(self, part, length):
+	def read(self, part, length, window=None):
+		pos = self._getPos(part)
+		result = ''.join(self.__readStream(part, pos, length, window))
+		self._setPos(part, pos + len(result))
+		return result
+
+	def readinto(self, part, buf, window=None):
+		view = memoryview(buf)
+		pos = self._getPos(part)
+		done = 0
+		for data in self.__readStream(part, pos, len(view), window):
+			size = len(data)
+			view[done:done+size] = data
+			done += size
+		self._setPos(part, pos + done)
+		return done
+
+	def readChunks(self, part, length=None, window=None):
+		pos = self._getPos(part)
+		for data in self.__readStream(part, pos, length, window):
+			pos += len(data)
+			self._setPos(part, pos)
+			yield data
+
+	def readAll(self, part, window=None):
+		return ''.join(self.__readStream(part, 0, None, window))
+
+	def __readStream(self, part, pos, length, window):
+		# Keep up to 'window' READ_MSG requests in flight and yield the
+		# replies in order until 'length' bytes are read or the end of the
+		# part is hit. Requests beyond the end are simply dropped.
 		if not self.active:
 			raise IOError('Handle expired')
-		result = ''
-		pos = self._getPos(part)
+		if window is None:
+			window = self.readAhead
+		if length is None:
+			end = None
+		else:
+			end = pos + length
 		packetSize = self.connector.maxPacketSize
-		while length > 0:
-			if length > packetSize:
-				chunk = packetSize
-			else:
-				chunk = length
-			req = pb.ReadReq()
-			req.handle = self.handle
-			req.part = part
-			req.offset = pos
-			req.length = chunk
-			reply = self.connector._rpc(_Connector.READ_MSG, req.SerializeToString())
-			data = pb.ReadCnf.FromString(reply).data
-			size = len(data)
-			result = result + data
-			pos = pos + size
-			if size < chunk:
+		pipe = Pipeline(self.connector)
+		pending = collections.deque()
+		while True:
+			while (len(pending) < window) and ((end is None) or (pos < end)):
+				if end is None:
+					chunk = packetSize
+				else:
+					chunk = min(packetSize, end - pos)
+				pending.append((chunk, pipe.read(self, part, pos, chunk)))
+				pos += chunk
+			if not pending:
+				break
+			(chunk, future) = pending.popleft()
+			data = future.result()
+			if data:
+				yield data
+			if len(data) < chunk:
 				break
-		self._setPos(part, pos)
-		return result
-
-	def readAll(self, part):
-		result = ''
-		oldPos = self._getPos(part)
-		try:
-			self._setPos(part, 0)
-			while True:
-				chunk = self.read(part, 0x20000)
-				result = result + chunk
-				if len(chunk) < 0x20000:
-					break
-			return result
-		finally:
-			self._setPos(part, oldPos)
 
 	def write(self, part, data):
+		self.writeStream(part, [data])
+
+	def writeFrom(self, part, fileobj, window=None):
+		self.writeStream(part, iter(lambda: fileobj.read(0x10000), ''), window)
+
+	def writeStream(self, part, iterable, window=None):
+		# The data is sent in WRITE_BUFFER_MSG packets, keeping up to
+		# 'window' of them in flight, and the last piece finally goes with a
+		# single WRITE_COMMIT_MSG which writes everything at the current
+		# position.
 		if not self.active:
 			raise IOError('Handle expired')
-
+		if window is None:
+			window = self.writeBehind
 		pos = self._getPos(part)
-		i = 0
-		length = len(data)
 		packetSize = self.connector.maxPacketSize
-		while length > i+packetSize:
-			req = pb.WriteBufferReq()
-			req.handle = self.handle
-			req.part = part
-			req.data = data[i:i+packetSize]
-			self.connector._rpc(_Connector.WRITE_BUFFER_MSG, req.SerializeToString())
-			i += packetSize
-
-		req = pb.WriteCommitReq()
-		req.handle = self.handle
-		req.part = part
-		req.offset = pos
-		req.data = data[i:i+packetSize]
-		self.connector._rpc(_Connector.WRITE_COMMIT_MSG, req.SerializeToString())
-
+		pipe = Pipeline(self.connector)
+		pending = collections.deque()
+		length = 0
+		tail = ''
+		for data in iterable:
+			length += len(data)
+			if tail:
+				data = tail + data
+			i = 0
+			while len(data) > i+packetSize:
+				if len(pending) >= window:
+					pending.popleft().result()
+				pending.append(pipe.writeBuffer(self, part, data[i:i+packetSize]))
+				i += packetSize
+			tail = data[i:]
+
+		for future in pending:
+			future.result()
+		pipe.writeCommit(self, part, pos, tail).result()
 		self._setPos(part, pos+length)
 
+	def open(self, part, mode='r', bufferSize=None):
+		"""Open a part as buffered binary file object.
+
+		Supported modes are 'r', 'w', 'a' and 'r+'. The default buffer size
+		covers a full read ahead window. Closing the file object does not
+		close the handle.
+		"""
+		raw = _PartIO(self, part, mode)
+		if bufferSize is None:
+			bufferSize = self.connector.maxPacketSize * self.readAhead
+		if raw.readable() and raw.writable():
+			return io.BufferedRandom(raw, bufferSize)
+		elif raw.writable():
+			return io.BufferedWriter(raw, bufferSize)
+		else:
+			return io.BufferedReader(raw, bufferSize)
+
 	def writeAll(self, part, data):
 		self._setPos(part, 0)
 		self.truncate(part)
@@ -1156,6 +2282,8 @@ class Handle(object):
 		reply = self.connector._rpc(_Connector.COMMIT_MSG, req.SerializeToString())
 		cnf = pb.CommitCnf.FromString(reply)
 		self.rev = cnf.rev
+		if self.doc is not None:
+			self.connector._invalidateLookup(self.doc)
 
 	def suspend(self, comment=None):
 		if not self.active:
@@ -1166,15 +2294,11 @@ class Handle(object):
 		reply = self.connector._rpc(_Connector.SUSPEND_MSG, req.SerializeToString())
 		cnf = pb.SuspendCnf.FromString(reply)
 		self.rev = cnf.rev
+		if self.doc is not None:
+			self.connector._invalidateLookup(self.doc)
 
 	def close(self):
-		if self.active:
-			self.active = False
-			req = pb.CloseReq()
-			req.handle = self.handle
-			self.connector._rpc(_Connector.CLOSE_MSG, req.SerializeToString())
-		else:
-			raise IOError('Handle expired')
+		Pipeline(self.connector).close(self).result()
 
 	def stat(self):
 		if not self.active:
@@ -1239,6 +2363,84 @@ class Handle(object):
 	def getStore(self):
 		return self.__store
 
+class _PartIO(io.RawIOBase):
+	"""Unbuffered file object for a part of a handle. Keeps its own position
+	so that it does not interfere with other users of the handle."""
+
+	def __init__(self, handle, part, mode):
+		super(_PartIO, self).__init__()
+		mode = mode.replace('b', '')
+		if mode not in ('r', 'w', 'a', 'r+'):
+			raise ValueError('Invalid mode: ' + mode)
+		self.__handle = handle
+		self.__part = part
+		self.__readable = mode in ('r', 'r+')
+		self.__writable = mode != 'r'
+		self.__pos = 0
+		if mode == 'w':
+			self.truncate(0)
+		elif mode == 'a':
+			self.__pos = self.__size()
+
+	def readable(self):
+		return self.__readable
+
+	def writable(self):
+		return self.__writable
+
+	def seekable(self):
+		return True
+
+	def readinto(self, b):
+		if not self.__readable:
+			raise IOError('File not open for reading')
+		self.__handle.seek(self.__part, self.__pos)
+		done = self.__handle.readinto(self.__part, b)
+		self.__pos += done
+		return done
+
+	def write(self, b):
+		if not self.__writable:
+			raise IOError('File not open for writing')
+		data = b.tobytes() if isinstance(b, memoryview) else str(b)
+		self.__handle.seek(self.__part, self.__pos)
+		self.__handle.write(self.__part, data)
+		self.__pos += len(data)
+		return len(data)
+
+	def seek(self, offset, whence=io.SEEK_SET):
+		if whence == io.SEEK_SET:
+			pos = offset
+		elif whence == io.SEEK_CUR:
+			pos = self.__pos + offset
+		elif whence == io.SEEK_END:
+			pos = self.__size() + offset
+		else:
+			raise ValueError('Invalid whence: ' + str(whence))
+		if pos < 0:
+			raise IOError('Negative seek position')
+		self.__pos = pos
+		return pos
+
+	def tell(self):
+		return self.__pos
+
+	def truncate(self, size=None):
+		if not self.__writable:
+			raise IOError('File not open for writing')
+		if size is None:
+			size = self.__pos
+		self.__handle.seek(self.__part, size)
+		self.__handle.truncate(self.__part)
+		return size
+
+	def __size(self):
+		try:
+			return self.__handle.stat().size(self.__part)
+		except KeyError:
+			return 0
+
+
 class ReplicateHandle(object):
 	def __init__(self, connector, handle):
 		self.connector = connector
@@ -1267,27 +2469,112 @@ class ReplicateHandle(object):
 			raise IOError('Handle expired')
 
 _connection = None
+_connectionLock = threading.Lock()
 
 def __FlushConnection():
 	global _connection
 	if _connection:
 		_connection.flush()
 
-def Connector(address=None):
+def Connector(address=None, transport=None):
 	global _connection
-	if not _connection:
-		_connection = _Connector(address)
-		atexit.register(__FlushConnection)
+	with _connectionLock:
+		if not _connection:
+			_connection = _Connector(address, transport)
+			atexit.register(__FlushConnection)
+			if os.getenv('PEERDRIVE_RECORD'):
+				_connection.record(open(os.getenv('PEERDRIVE_RECORD'), 'wb'))
 	return _connection
 
 
+class ConnectionPool(object):
+	"""Set of independent, authenticated connections to the server.
+
+	Every connection has its own socket, reference counter and dispatcher.
+	A connection is checked out exclusively for a task or a thread:
+
+		pool = ConnectionPool(4)
+		with pool.connection() as conn:
+			with conn.peek(store, rev) as r:
+				...
+
+	Handles and watches stay bound to the connection which created them and
+	must only be used while it is checked out. Connections are opened lazily
+	up to 'size'; further requests block until one is released. The pool
+	uses the Qt-free socket transport by default because Qt sockets must not
+	be used from other threads.
+	"""
+
+	def __init__(self, size=4, address=None, transport=SocketTransport):
+		self.__size = size
+		self.__address = address
+		self.__transport = transport
+		self.__all = []
+		self.__idle = []
+		self.__opening = 0 # connections which are being established
+		self.__available = threading.Condition(threading.Lock())
+
+	def size(self):
+		return self.__size
+
+	def acquire(self):
+		with self.__available:
+			while not self.__idle:
+				if len(self.__all) + self.__opening < self.__size:
+					self.__opening += 1
+					break
+				self.__available.wait()
+			else:
+				return self.__idle.pop()
+
+		# Connect without holding the lock, other threads may release their
+		# connections meanwhile.
+		try:
+			conn = _Connector(self.__address, self.__transport)
+		except:
+			with self.__available:
+				self.__opening -= 1
+				self.__available.notify()
+			raise
+		with self.__available:
+			self.__opening -= 1
+			self.__all.append(conn)
+		return conn
+
+	def release(self, conn):
+		with self.__available:
+			self.__idle.append(conn)
+			self.__available.notify()
+
+	@contextlib.contextmanager
+	def connection(self):
+		conn = self.acquire()
+		try:
+			yield conn
+		finally:
+			self.release(conn)
+
+	def close(self):
+		with self.__available:
+			for conn in self.__all:
+				conn.close()
+			self.__all = []
+			self.__idle = []
+
+
 ###############################################################################
 # PDSD data structures, encoders and decoders
 ###############################################################################
 
 LINK_MIME_TYPE = 'application/x-peerdrive-links'
 
-def Link(spec):
+def Link(spec, cached=False):
+	"""Parse a 'doc:', 'rev:' or 'label:dir/.../name' link specification.
+
+	Paths are walked by the server. With 'cached' they are resolved through
+	the path cache of the connection instead, which is worth it only for
+	paths that are resolved repeatedly.
+	"""
 	if spec.startswith('doc:'):
 		link = DocLink()
 		link._fromString(spec)
@@ -1298,7 +2585,10 @@ def Link(spec):
 		return link
 	else:
 		# FIXME: this assumes that we will only ever get single doc links o_O
-		[(store, doc)] = Connector().walkPath(spec)
+		if cached:
+			(store, doc) = Connector().resolvePath(spec)
+		else:
+			[(store, doc)] = Connector().walkPath(spec)
 		return DocLink(store, doc, False)
 
 class RevLink(object):
@@ -1419,13 +2709,31 @@ class DocLink(object):
 	def update(self, newStore=None):
 		if newStore:
 			self.__store = newStore
-		l = Connector().lookupDoc(self.__doc, [self.__store])
+		self.__setLookup(Connector().lookupDoc(self.__doc, [self.__store]))
+		return self
+
+	@staticmethod
+	def updateMany(links, newStore=None):
+		"""Update many links with one LOOKUP_MANY request per store."""
+		byStore = {}
+		for link in links:
+			if newStore:
+				link.__store = newStore
+			byStore.setdefault(link.__store, []).append(link)
+		with Connector().pipeline() as pipe:
+			pending = [ (batch, pipe.lookupDocs([ l.__doc for l in batch ],
+				[store])) for (store, batch) in byStore.items() ]
+		for (batch, future) in pending:
+			for (link, lookup) in zip(batch, future.result()):
+				link.__setLookup(lookup)
+		return links
+
+	def __setLookup(self, l):
 		if self.__store in l.stores():
 			self.__rev = l.rev(self.__store)
 		else:
 			self.__rev = None
 		self.__updated = True
-		return self
 
 	def doc(self):
 		return self.__doc
@@ -1439,23 +2747,44 @@ class DocLink(object):
 		return self.__store
 
 
+# precompiled formats of all PDSD scalars
+_pdsdScalars = dict((code, struct.Struct('<'+code)) for code in 'BbHhLlQqfd')
+_utf8Decode = codecs.utf_8_decode
+
+# tag followed by a length or element count
+_pdsdHeader = struct.Struct('<BL')
+_pdsdDouble = struct.Struct('<Bd')
+_pdsdTrue = struct.pack('<BB', 0x30, 1)
+_pdsdFalse = struct.pack('<BB', 0x30, 0)
+_pdsdInts = dict((code, struct.Struct('<B'+code)) for code in 'BbHhLlQq')
+
+
 class Decoder(object):
+	"""Decoder of PDSD (PeerDrive structured data) documents.
+
+	Every value starts with a tag byte which selects the decoding function
+	from Decoder._tags. Numbers are read with precompiled struct.Struct
+	objects directly from the buffer.
+	"""
+
 	def __init__(self, store):
 		self.__store = store
-		pass
 
 	def decode(self, s):
+		if not isinstance(s, str):
+			s = memoryview(s).tobytes()
 		self._s = s
 		self._i = 0
+		self._keys = {}
 		return self._decodeDoc()
 
 	def _getStore(self):
 		return self.__store
 
 	def _getInt(self, code):
-		length = struct.calcsize('<'+code)
-		value = struct.unpack_from('<'+code, self._s, self._i)[0]
-		self._i += length
+		fmt = _pdsdScalars[code]
+		value = fmt.unpack_from(self._s, self._i)[0]
+		self._i += fmt.size
 		return value
 
 	def _getStr(self, length):
@@ -1464,137 +2793,414 @@ class Decoder(object):
 		return res
 
 	def _decodeDoc(self):
-		tag = self._getInt('B')
-		if tag == 0x00:
-			res = self._decodeDict()
-		elif tag == 0x10:
-			res = self._decodeList()
-		elif tag == 0x20:
-			res = self._decodeString()
-		elif tag == 0x30:
-			res = (self._getInt('B') != 0)
-		elif tag == 0x40:
-			res = RevLink()
-			res._fromStruct(self)
-		elif tag == 0x41:
-			res = DocLink()
-			res._fromStruct(self)
-		elif tag == 0x50:
-			res = self._getInt('f')
-		elif tag == 0x51:
-			res = self._getInt('d')
-		elif tag == 0x60:
-			res = self._getInt('B')
-		elif tag ==	0x61:
-			res = self._getInt('b')
-		elif tag ==	0x62:
-			res = self._getInt('H')
-		elif tag ==	0x63:
-			res = self._getInt('h')
-		elif tag ==	0x64:
-			res = self._getInt('L')
-		elif tag ==	0x65:
-			res = self._getInt('l')
-		elif tag ==	0x66:
-			res = self._getInt('Q')
-		elif tag ==	0x67:
-			res = self._getInt('q')
-		else:
-			raise TypeError("Invalid tag")
-
-		return res
+		i = self._i
+		self._i = i + 1
+		return self._tags[ord(self._s[i])](self)
 
 	def _decodeDict(self):
-		elements = self._getInt('L')
+		s = self._s
+		tags = self._tags
+		getLength = _pdsdScalars['L'].unpack_from
+		# keys repeat a lot across the entries of a document
+		keys = self._keys
+		(elements,) = getLength(s, self._i)
+		i = self._i + 4
 		d = { }
-		for i in range(elements):
-			key = self._decodeString()
-			value = self._decodeDoc()
-			d[key] = value
+		for x in xrange(elements):
+			(length,) = getLength(s, i)
+			i += 4
+			raw = s[i:i+length]
+			key = keys.get(raw)
+			if key is None:
+				key = keys[raw] = _utf8Decode(raw, 'strict', True)[0]
+			i += length
+			self._i = i + 1
+			d[key] = tags[ord(s[i])](self)
+			i = self._i
+		self._i = i
 		return d
 
 	def _decodeList(self):
-		elements = self._getInt('L')
+		s = self._s
+		tags = self._tags
+		(elements,) = _pdsdScalars['L'].unpack_from(s, self._i)
+		self._i += 4
 		l = []
-		for i in range(elements):
-			l.append(self._decodeDoc())
+		for x in xrange(elements):
+			i = self._i
+			self._i = i + 1
+			l.append(tags[ord(s[i])](self))
 		return l
 
 	def _decodeString(self):
-		length = self._getInt('L')
-		value = self._getStr(length).decode('utf-8')
+		(length,) = _pdsdScalars['L'].unpack_from(self._s, self._i)
+		i = self._i + 4
+		self._i = i + length
+		return _utf8Decode(self._s[i:i+length], 'strict', True)[0]
+
+	def _decodeBool(self):
+		i = self._i
+		self._i = i + 1
+		return self._s[i] != '\0'
+
+	def _decodeRevLink(self):
+		i = self._i + 1
+		self._i = j = i + ord(self._s[i-1])
+		return RevLink(self.__store, self._s[i:j])
+
+	def _decodeDocLink(self):
+		i = self._i + 1
+		self._i = j = i + ord(self._s[i-1])
+		return DocLink(self.__store, self._s[i:j], False)
+
+	def _decodeInvalid(self):
+		raise TypeError("Invalid tag")
+
+	@staticmethod
+	def _scalar(code):
+		fmt = _pdsdScalars[code]
+		unpack = fmt.unpack_from
+		size = fmt.size
+		def decodeScalar(self):
+			i = self._i
+			self._i = i + size
+			return unpack(self._s, i)[0]
+		return decodeScalar
+
+	# indexed by tag
+	_tags = [ _decodeInvalid ] * 256
+	_tags[0x00] = _decodeDict
+	_tags[0x10] = _decodeList
+	_tags[0x20] = _decodeString
+	_tags[0x30] = _decodeBool
+	_tags[0x40] = _decodeRevLink
+	_tags[0x41] = _decodeDocLink
+	for (tag, code) in [(0x50, 'f'), (0x51, 'd'), (0x60, 'B'), (0x61, 'b'),
+			(0x62, 'H'), (0x63, 'h'), (0x64, 'L'), (0x65, 'l'), (0x66, 'Q'),
+			(0x67, 'q')]:
+		_tags[tag] = _scalar.__func__(code)
+	del tag, code
+
+
+class _LazyDecoder(Decoder):
+	"""Decoder which returns read-only views for dicts and lists.
+
+	Containers are not decoded up front. The views decode their elements from
+	the original buffer when they are accessed and remember the result.
+	"""
+
+	# size of fixed length values, indexed by tag
+	_sizes = [ None ] * 256
+	for (tag, size) in [(0x30, 1), (0x50, 4), (0x51, 8), (0x60, 1), (0x61, 1),
+			(0x62, 2), (0x63, 2), (0x64, 4), (0x65, 4), (0x66, 8), (0x67, 8)]:
+		_sizes[tag] = size
+	del tag, size
+
+	def _decodeAt(self, pos):
+		self._i = pos
+		return self._decodeDoc()
+
+	def _decodeDict(self):
+		return LazyDict(self, self._i)
+
+	def _decodeList(self):
+		return LazyList(self, self._i)
+
+	def _count(self, pos):
+		return _pdsdScalars['L'].unpack_from(self._s, pos)[0]
+
+	def _decodeKey(self, pos):
+		# return the key at pos and the position of its value
+		(length,) = _pdsdScalars['L'].unpack_from(self._s, pos)
+		pos += 4
+		raw = self._s[pos:pos+length]
+		key = self._keys.get(raw)
+		if key is None:
+			key = self._keys[raw] = _utf8Decode(raw, 'strict', True)[0]
+		return (key, pos + length)
+
+	def _skip(self, pos):
+		# Return the position after the value at pos without decoding it.
+		# Nested containers are tracked on an explicit stack.
+		s = self._s
+		sizes = _LazyDecoder._sizes
+		getLength = _pdsdScalars['L'].unpack_from
+		stack = []
+		pending = 1
+		isDict = False
+		while True:
+			while pending == 0:
+				if not stack:
+					return pos
+				(pending, isDict) = stack.pop()
+			pending -= 1
+			if isDict:
+				pos += 4 + getLength(s, pos)[0]
+			tag = ord(s[pos])
+			pos += 1
+			size = sizes[tag]
+			if size is not None:
+				pos += size
+			elif tag == 0x20:
+				pos += 4 + getLength(s, pos)[0]
+			elif tag == 0x40 or tag == 0x41:
+				pos += 1 + ord(s[pos])
+			elif tag == 0x00 or tag == 0x10:
+				stack.append((pending, isDict))
+				(pending,) = getLength(s, pos)
+				pos += 4
+				isDict = (tag == 0x00)
+			else:
+				raise TypeError("Invalid tag")
+
+	_tags = Decoder._tags[:]
+	_tags[0x00] = _decodeDict
+	_tags[0x10] = _decodeList
+
+
+class LazyDict(collections.Mapping):
+	"""Read-only dict view of a lazily decoded PDSD dict.
+
+	Keys are indexed up to the one that is looked up, values are decoded on
+	first access. Iteration follows the order of the encoded document.
+	"""
+
+	def __init__(self, decoder, pos):
+		self.__decoder = decoder
+		self.__remaining = decoder._count(pos)
+		self.__next = pos + 4
+		self.__keys = []
+		self.__index = {}
+		self.__values = {}
+
+	def __find(self, key):
+		index = self.__index
+		while key not in index and self.__remaining:
+			self.__scan()
+		return index.get(key)
+
+	def __scan(self):
+		# the value of the last indexed key is only skipped when needed
+		decoder = self.__decoder
+		if self.__keys:
+			self.__next = decoder._skip(self.__index[self.__keys[-1]])
+		(key, pos) = decoder._decodeKey(self.__next)
+		self.__keys.append(key)
+		self.__index[key] = pos
+		self.__remaining -= 1
+
+	def __getitem__(self, key):
+		try:
+			return self.__values[key]
+		except KeyError:
+			pass
+		pos = self.__find(key)
+		if pos is None:
+			raise KeyError(key)
+		value = self.__decoder._decodeAt(pos)
+		self.__values[key] = value
+		return value
+
+	def __contains__(self, key):
+		return self.__find(key) is not None
+
+	def __iter__(self):
+		while self.__remaining:
+			self.__scan()
+		return iter(self.__keys)
+
+	def __len__(self):
+		return len(self.__keys) + self.__remaining
+
+	def __deepcopy__(self, memo):
+		# yields a mutable dict
+		return dict((key, copy.deepcopy(value, memo)) for (key, value)
+			in self.iteritems())
+
+	def __repr__(self):
+		return 'LazyDict(' + repr(dict(self.iteritems())) + ')'
+
+
+class LazyList(collections.Sequence):
+	"""Read-only list view of a lazily decoded PDSD list.
+
+	Elements are indexed up to the one that is accessed and decoded on first
+	access.
+	"""
+
+	def __init__(self, decoder, pos):
+		self.__decoder = decoder
+		self.__length = decoder._count(pos)
+		self.__first = pos + 4
+		self.__index = []
+		self.__values = {}
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			return [ self[j] for j in xrange(*i.indices(self.__length)) ]
+		if i < 0:
+			i += self.__length
+		if i < 0 or i >= self.__length:
+			raise IndexError('list index out of range')
+		try:
+			return self.__values[i]
+		except KeyError:
+			pass
+		index = self.__index
+		decoder = self.__decoder
+		while len(index) <= i:
+			if index:
+				index.append(decoder._skip(index[-1]))
+			else:
+				index.append(self.__first)
+		value = decoder._decodeAt(index[i])
+		self.__values[i] = value
 		return value
 
+	def __len__(self):
+		return self.__length
+
+	def __eq__(self, other):
+		if not isinstance(other, collections.Sequence) or isinstance(other, basestring):
+			return NotImplemented
+		return len(self) == len(other) and all(a == b for (a, b) in zip(self, other))
+
+	def __ne__(self, other):
+		equal = self.__eq__(other)
+		if equal is NotImplemented:
+			return equal
+		return not equal
+
+	__hash__ = None
+
+	def __deepcopy__(self, memo):
+		# yields a mutable list
+		return [ copy.deepcopy(value, memo) for value in self ]
+
+	def __repr__(self):
+		return 'LazyList(' + repr(list(self)) + ')'
+
 
 class Encoder(object):
+	"""Encoder of PDSD documents.
+
+	The encoding functions are looked up by the exact type of each value and
+	write their output as chunks which are joined once at the end. Instances
+	of subclasses are resolved through isinstance() checks.
+	"""
+
 	def __init__(self):
 		pass
 
 	def encode(self, o):
-		if isinstance(o, dict):
-			res = self._encodeDict(o)
-		elif isinstance(o, (list, tuple)):
-			res = self._encodeList(o)
-		elif isinstance(o, basestring):
-			if isinstance(o, str):
-				res = struct.pack('<BL', 0x20, len(o)) + o
-			else:
-				encStr = o.encode('utf-8')
-				res = struct.pack('<BL', 0x20, len(encStr)) + encStr
-		elif o is True:
-			res = struct.pack('BB', 0x30, 1)
-		elif o is False:
-			res = struct.pack('BB', 0x30, 0)
-		elif isinstance(o, RevLink):
-			res = o._toStruct()
-		elif isinstance(o, DocLink):
-			res = o._toStruct()
+		chunks = []
+		self.__keys = {}
+		self._encodeDoc(o, chunks.append)
+		return ''.join(chunks)
+
+	def _encodeDoc(self, o, write):
+		encoder = Encoder._types.get(type(o)) or self._lookup(o)
+		encoder(self, o, write)
+
+	def _lookup(self, o):
+		if isinstance(o, (dict, collections.Mapping)):
+			return Encoder._encodeDict
+		elif isinstance(o, (list, tuple, LazyList)):
+			return Encoder._encodeList
+		elif isinstance(o, str):
+			return Encoder._encodeStr
+		elif isinstance(o, unicode):
+			return Encoder._encodeUnicode
+		elif o is True or o is False:
+			return Encoder._encodeBool
+		elif isinstance(o, (RevLink, DocLink)):
+			return Encoder._encodeLink
 		elif isinstance(o, float):
-			res = struct.pack('<Bd', 0x51, o)
+			return Encoder._encodeFloat
 		elif isinstance(o, (int, long)):
-			res = self._encodeInt(o)
+			return Encoder._encodeInt
 		else:
 			raise TypeError("Invalid object: " + repr(o))
 
-		return res
-
-	def _encodeDict(self, d):
-		data = struct.pack('<BL', 0x00, len(d))
+	def _encodeDict(self, d, write):
+		types = Encoder._types
+		# keys repeat a lot across the entries of a document
+		keys = self.__keys
+		write(_pdsdHeader.pack(0x00, len(d)))
 		for key, value in d.iteritems():
-			if isinstance(key, basestring):
-				if isinstance(key, unicode):
-					key = key.encode('utf-8')
-			else:
-				raise TypeError("Invalid dict key: " + repr(key))
-			data += struct.pack('<L', len(key)) + key + self.encode(value)
+			encKey = keys.get(key)
+			if encKey is None:
+				encKey = keys[key] = self._encodeKey(key)
+			write(encKey)
+			encoder = types.get(type(value)) or self._lookup(value)
+			encoder(self, value, write)
+
+	def _encodeKey(self, key):
+		if isinstance(key, basestring):
+			if isinstance(key, unicode):
+				key = key.encode('utf-8')
+		else:
+			raise TypeError("Invalid dict key: " + repr(key))
+		return _pdsdScalars['L'].pack(len(key)) + key
+
+	def _encodeList(self, l, write):
+		types = Encoder._types
+		write(_pdsdHeader.pack(0x10, len(l)))
+		for value in l:
+			encoder = types.get(type(value)) or self._lookup(value)
+			encoder(self, value, write)
 
-		return data
+	def _encodeStr(self, o, write):
+		write(_pdsdHeader.pack(0x20, len(o)))
+		write(o)
 
-	def _encodeList(self, l):
-		data = struct.pack('<BL', 0x10, len(l))
-		for i in l:
-			data += self.encode(i)
-		return data
+	def _encodeUnicode(self, o, write):
+		o = o.encode('utf-8')
+		write(_pdsdHeader.pack(0x20, len(o)))
+		write(o)
 
-	def _encodeInt(self, i):
+	def _encodeBool(self, o, write):
+		write(_pdsdTrue if o else _pdsdFalse)
+
+	def _encodeLink(self, o, write):
+		write(o._toStruct())
+
+	def _encodeFloat(self, o, write):
+		write(_pdsdDouble.pack(0x51, o))
+
+	def _encodeInt(self, i, write):
 		if i < 0:
 			if i >= -128:
-				return struct.pack('<Bb', 0x61, i)
+				write(_pdsdInts['b'].pack(0x61, i))
 			elif i >= -32768:
-				return struct.pack('<Bh', 0x63, i)
+				write(_pdsdInts['h'].pack(0x63, i))
 			elif i >= -2147483648:
-				return struct.pack('<Bl', 0x65, i)
+				write(_pdsdInts['l'].pack(0x65, i))
 			else:
-				return struct.pack('<Bq', 0x67, i)
+				write(_pdsdInts['q'].pack(0x67, i))
 		else:
 			if i <= 0xff:
-				return struct.pack('<BB', 0x60, i)
+				write(_pdsdInts['B'].pack(0x60, i))
 			elif i <= 0xffff:
-				return struct.pack('<BH', 0x62, i)
+				write(_pdsdInts['H'].pack(0x62, i))
 			elif i <= 0xffffffff:
-				return struct.pack('<BL', 0x64, i)
+				write(_pdsdInts['L'].pack(0x64, i))
 			else:
-				return struct.pack('<BQ', 0x66, i)
+				write(_pdsdInts['Q'].pack(0x66, i))
+
+	_types = {
+		dict : _encodeDict,
+		list : _encodeList,
+		tuple : _encodeList,
+		str : _encodeStr,
+		unicode : _encodeUnicode,
+		bool : _encodeBool,
+		RevLink : _encodeLink,
+		DocLink : _encodeLink,
+		float : _encodeFloat,
+		int : _encodeInt,
+		long : _encodeInt,
+	}
 
 
 def __decode_link(dct):
@@ -1618,8 +3224,11 @@ def __encode_link(obj):
 		raise TypeError(repr(obj) + " is not serializable")
 
 
-def loadPDSD(store, s):
-	dec = Decoder(store)
+def loadPDSD(store, s, lazy=False):
+	if lazy:
+		dec = _LazyDecoder(store)
+	else:
+		dec = Decoder(store)
 	return dec.decode(s)
 
 
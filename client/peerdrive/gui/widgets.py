@@ -23,7 +23,7 @@ import sys, os, subprocess, pickle, datetime
 
 from ..connector import Watch, Connector
 from ..registry import Registry
-from .. import struct
+from .. import struct, merger
 from .utils import showDocument, showProperties
 
 
@@ -437,6 +437,10 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 	def docSave(self, writer):
 		pass
 
+	# called after the data of docSave() was committed
+	def docSaved(self):
+		pass
+
 	# returns (type, handled) where:
 	#   type:    the resulting type code (if we would handle it)
 	#   handled: set of parts which this instance can merge automatically
@@ -446,16 +450,17 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 			return (None, set(['META'])) # cannot merge different types
 		return (types.copy().pop(), set(['META']))
 
-	# return conflict True/False
+	# returns a list of merger.Conflict
 	def docMergePerform(self, writer, baseReader, mergeReaders, changedParts):
+		conflicts = []
 		if 'META' in changedParts:
 			baseMeta = struct.loads(self.__store, baseReader.readAll('META'))
 			mergeMeta = []
 			for mr in mergeReaders:
 				mergeMeta.append(struct.loads(self.__store, mr.readAll('META')))
-			(newMeta, conflict) = struct.merge(baseMeta, mergeMeta)
+			(newMeta, conflicts) = merger.merge(baseMeta, mergeMeta)
 			writer.writeAll('META', struct.dumps(newMeta))
-		return False
+		return conflicts
 
 	def metaDataSetField(self, field, value):
 		item = self.__metaData
@@ -677,20 +682,21 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 		while heads:
 			oldHeads = heads
 			heads = []
+			tips = list(set().union(*[tips for (rev, tips) in oldHeads]))
+			stats = dict(zip(tips, Connector().statMany(tips)))
 			for (rev, tips) in oldHeads:
 				newTips = set()
 				for tip in tips:
-					try:
-						stat = Connector().stat(tip)
-						parents = stat.parents()
-						if target in parents:
-							found.append(rev)
-							newTips = None
-							break
-						elif depth < stat.mtime():
-							newTips |= set(parents)
-					except IOError:
-						pass
+					stat = stats[tip]
+					if isinstance(stat, IOError):
+						continue
+					parents = stat.parents()
+					if target in parents:
+						found.append(rev)
+						newTips = None
+						break
+					elif depth < stat.mtime():
+						newTips |= set(parents)
 
 				if newTips:
 					heads.append((rev, newTips))
@@ -786,6 +792,7 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 				with Connector().update(self.__store, self.__doc, self.__rev, self.__creator) as writer:
 					self.__saveFileInternal(writer)
 					writer.suspend(comment)
+			self.docSaved()
 			self.__metaDataChanged = False
 			self.__rev = writer.getRev()
 			self.__setPreliminary(True)
@@ -883,7 +890,7 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 
 		# don't use that for large documents... ;-)
 		mergeReaders = []
-		conflicts = False
+		conflicts = []
 		try:
 			# open all contributing revisions
 			mergeReaders.append(Connector().peek(self.__store, self.__rev))
@@ -916,7 +923,12 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 		self.__loadFile()
 		self.__emitNewRev()
 		if conflicts:
-			QtGui.QMessageBox.warning(self, 'Merge conflict', 'There were merge conflicts. Please check the new version...')
+			paths = sorted(set(c.path or '/' for c in conflicts))
+			if len(paths) > 10:
+				paths[10:] = ['...']
+			QtGui.QMessageBox.warning(self, 'Merge conflict',
+				'There were merge conflicts in:\n\n' + '\n'.join(paths) +
+				'\n\nPlease check the new version...')
 		return True
 
 
@@ -935,20 +947,22 @@ class DocumentView(QtGui.QStackedWidget, Watch):
 		addedSth = True
 		while addedSth:
 			addedSth = False
+			# stat the heads of all paths in one go
+			allHeads = list(set().union(*heads))
+			stats = dict(zip(allHeads, Connector().statMany(allHeads, stores)))
 			for i in xrange(len(heads)):
 				oldHeads = heads[i]
 				newHeads = []
 				for head in oldHeads:
-					try:
-						stat = Connector().stat(head, stores)
-						parents = stat.parents()
-						times[head] = stat.mtime()
-						for parent in parents:
-							newHeads.append(parent)
-							paths[i].add(parent)
-							addedSth = True
-					except:
-						pass
+					stat = stats[head]
+					if isinstance(stat, IOError):
+						continue
+					parents = stat.parents()
+					times[head] = stat.mtime()
+					for parent in parents:
+						newHeads.append(parent)
+						paths[i].add(parent)
+						addedSth = True
 				heads[i] = newHeads
 
 		#print "End:"
@@ -98,7 +98,7 @@ def importFile(store, path, name="", progress=None):
 			writer = Connector().create(store, uti, "")
 			try:
 				writer.setData('', meta)
-				writer.write('_', file.read())
+				writer.writeFrom('_', file)
 				writer.commit("Import from external file system")
 				return writer
 			except:
@@ -153,7 +153,9 @@ def overwriteFile(link, path):
 				__merge(meta, additionalMeta)
 
 		with open(path, "rb") as file:
-			writer.writeAll('_', file.read())
+			writer.seek('_', 0)
+			writer.truncate('_')
+			writer.writeFrom('_', file)
 		writer.setData('', meta)
 		writer.setType(uti)
 		writer.commit("Overwritten from external file system")
@@ -0,0 +1,265 @@
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import
+
+import itertools
+from . import connector
+
+# Three-way merge of structured (PDSD) data.
+#
+# merge(base, versions) combines the changes which any number of versions
+# made relative to their common ancestor 'base'. It returns the result and a
+# list of Conflict objects. By convention versions[0] is the latest version.
+# The strategy depends on the type of the value:
+#
+#	dicts    Every key is merged on its own. A key which was added by several
+#	         versions with different values, or which was removed by one
+#	         version and changed by another, is a conflict.
+#	lists    Items are matched by itemKey() and treated as a multiset. Items
+#	         which any version removed are dropped, added items are appended
+#	         in the order in which they first appear. Items which are unique
+#	         in the base and in a version are merged recursively.
+#	scalars  Strings, numbers, booleans and links. If all versions which
+#	         changed the value agree their value is taken. Otherwise it is a
+#	         conflict, just like a value whose type was changed differently.
+#
+# Every conflict is resolved in favour of the first version that changed the
+# value, unless the caller passes a resolver which decides otherwise.
+
+class _Missing(object):
+	def __repr__(self):
+		return 'MISSING'
+
+	def __nonzero__(self):
+		return False
+
+# Value of a dict key or list item which does not exist in a version
+MISSING = _Missing()
+
+
+class Conflict(object):
+	"""A value which was changed by several versions in different ways.
+
+	'path' is the PDSD selector of the value in the result, e.g.
+	'/org.peerdrive.annotation/title' or '/org.peerdrive.folder#3'. 'base'
+	is the common ancestor, 'values' holds the value of each version and
+	'result' the value that was chosen. Each of them is MISSING where the
+	value does not exist.
+	"""
+
+	VALUE  = 'value'  # a scalar was changed to different values
+	TYPE   = 'type'   # the type of the value was changed
+	ADD    = 'add'    # added by several versions with different values
+	DELETE = 'delete' # removed by some versions, changed by others
+
+	__slots__ = ['kind', 'path', 'base', 'values', 'result']
+
+	def __init__(self, kind, path, base, values, result):
+		self.kind = kind
+		self.path = path
+		self.base = base
+		self.values = values
+		self.result = result
+
+	def __repr__(self):
+		return 'Conflict(%s, %r)' % (self.kind, self.path)
+
+
+def merge(base, versions, resolve=None):
+	"""Merge 'versions' which are all derived from 'base'.
+
+	Returns (result, conflicts). 'resolve' is called with each Conflict and
+	returns the value which should be used instead of Conflict.result, or
+	MISSING to drop it. The returned value is stored as the Conflict's
+	result, so the conflicts are reported either way.
+	"""
+	m = _Merge(resolve)
+	result = m.mergeValue(base, list(versions), u'')
+	return (result, m.conflicts)
+
+
+def itemKey(item):
+	"""Identity of a list item as string.
+
+	Folder entries are identified by the document or revision they link to,
+	everything else by its encoding.
+	"""
+	if isinstance(item, dict):
+		link = item.get('')
+		if isinstance(link, connector.DocLink):
+			return 'd' + link.doc()
+		elif isinstance(link, connector.RevLink):
+			return 'r' + link.rev()
+	return 'p' + connector.dumpPDSD(item)
+
+
+_SCALARS = (basestring, bool, int, long, float, connector.DocLink,
+	connector.RevLink)
+
+def _same(a, b):
+	# 1 == True and 1 == 1.0 in Python, but not in PDSD
+	return a is b or (type(a) is type(b) and a == b)
+
+def _countKeys(keys):
+	count = {}
+	for key in keys:
+		count[key] = count.get(key, 0) + 1
+	return count
+
+
+class _Merge(object):
+
+	def __init__(self, resolve):
+		self.resolve = resolve
+		self.conflicts = []
+
+	def conflict(self, kind, path, base, values, result):
+		c = Conflict(kind, path, base, values, result)
+		if self.resolve:
+			c.result = self.resolve(c)
+		self.conflicts.append(c)
+		return c.result
+
+	def mergeValue(self, base, versions, path):
+		changed = [ v for v in versions if not _same(v, base) ]
+		if not changed:
+			return base
+		if all(_same(v, changed[0]) for v in changed[1:]):
+			return changed[0]
+		if isinstance(base, dict) and all(isinstance(v, dict) for v in versions):
+			return self.mergeDict(base, versions, path)
+		if isinstance(base, (list, tuple)) and all(isinstance(v, (list, tuple))
+				for v in versions):
+			return self.mergeList(base, versions, path)
+		for o in [base] + versions:
+			if not isinstance(o, _SCALARS + (dict, list, tuple)):
+				raise TypeError("Invalid object: " + repr(o))
+		if any(type(v) is not type(base) for v in changed):
+			kind = Conflict.TYPE
+		else:
+			kind = Conflict.VALUE
+		return self.conflict(kind, path, base, versions, changed[0])
+
+	def mergeEntry(self, base, versions, path):
+		# Like mergeValue() but for dict keys and list items which may be
+		# MISSING in some of the versions or in the base.
+		changed = [ v for v in versions if not _same(v, base) ]
+		if not changed:
+			return base
+		if all(_same(v, changed[0]) for v in changed[1:]):
+			return changed[0]
+		present = [ v for v in versions if v is not MISSING ]
+		if base is MISSING:
+			# added differently, try to combine the additions
+			if all(isinstance(v, dict) for v in present):
+				return self.mergeValue({}, present, path)
+			if all(isinstance(v, (list, tuple)) for v in present):
+				return self.mergeValue([], present, path)
+			return self.conflict(Conflict.ADD, path, base, versions, present[0])
+		if len(present) < len(versions):
+			# modify/delete conflict -> the first version, which is the latest
+			# one by convention, decides
+			if versions[0] is MISSING:
+				result = MISSING
+			else:
+				result = self.mergeValue(base, present, path)
+			return self.conflict(Conflict.DELETE, path, base, versions, result)
+		return self.mergeValue(base, versions, path)
+
+	def mergeDict(self, base, versions, path):
+		keys = base.keys()
+		known = set(keys)
+		for ver in versions:
+			for key in ver:
+				if key not in known:
+					known.add(key)
+					keys.append(key)
+		result = {}
+		for key in keys:
+			value = self.mergeEntry(base.get(key, MISSING),
+				[ ver.get(key, MISSING) for ver in versions ],
+				path + u'/' + key)
+			if value is not MISSING:
+				result[key] = value
+		return result
+
+	def mergeList(self, base, versions, path):
+		baseKeys = [ itemKey(i) for i in base ]
+		baseCount = _countKeys(baseKeys)
+		removed = {}
+		added = []      # [(key, occurrence)]
+		addedItems = {} # (key, occurrence) -> items of each version
+		modified = []   # per version: key -> item of unique keys
+
+		for (n, ver) in enumerate(versions):
+			verKeys = [ itemKey(i) for i in ver ]
+			count = _countKeys(verKeys)
+			for (key, c) in baseCount.iteritems():
+				missing = c - count.get(key, 0)
+				if missing > 0 and missing > removed.get(key, 0):
+					removed[key] = missing
+			seen = {}
+			unique = {}
+			for (key, item) in itertools.izip(verKeys, ver):
+				c = seen[key] = seen.get(key, 0) + 1
+				occurrence = c - baseCount.get(key, 0)
+				if occurrence > 0:
+					items = addedItems.get((key, occurrence))
+					if items is None:
+						items = addedItems[(key, occurrence)] = [MISSING] * len(versions)
+						added.append((key, occurrence))
+					items[n] = item
+				elif count[key] == 1 and baseCount[key] == 1:
+					unique[key] = item
+			modified.append(unique)
+
+		result = []
+		for (key, item) in itertools.izip(baseKeys, base):
+			if baseCount[key] == 1:
+				others = [ m[key] for m in modified if key in m ]
+				if any(not _same(other, item) for other in others):
+					# paths refer to the position in the result
+					itemPath = u'%s#%d' % (path, len(result))
+					if key in removed:
+						del removed[key]
+						item = self.mergeEntry(item, [ m.get(key, MISSING)
+							for m in modified ], itemPath)
+						if item is MISSING:
+							continue
+					else:
+						item = self.mergeValue(item, others, itemPath)
+			if key in removed:
+				removed[key] -= 1
+				if removed[key] == 0:
+					del removed[key]
+				continue
+			result.append(item)
+
+		for key in added:
+			items = addedItems[key]
+			present = [ v for v in items if v is not MISSING ]
+			if all(_same(v, present[0]) for v in present[1:]):
+				item = present[0]
+			else:
+				item = self.conflict(Conflict.ADD, u'%s#%d' % (path, len(result)),
+					MISSING, items, present[0])
+				if item is MISSING:
+					continue
+			result.append(item)
+		return result
@@ -0,0 +1,202 @@
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import
+
+import sys, os, time, math, json, atexit, threading
+
+# Per message statistics of the traffic between the client and the server.
+#
+# Collecting is disabled by default. It is switched on for the whole process
+# by setting the PEERDRIVE_METRICS environment variable to the name of a file
+# where the statistics are written as JSON when the process exits ('-' writes
+# them to stderr). Alternatively enable() starts collecting from code:
+#
+#	from peerdrive import metrics
+#	m = metrics.enable()
+#	...
+#	print m.snapshot()['LOOKUP_DOC_MSG']['latency']['p95']
+
+# Latencies are sorted into logarithmic buckets, starting at 10us with four
+# buckets for each power of two. Up to ~10min fit into the histogram which
+# keeps the percentiles exact to roughly 20%.
+_BUCKET_BASE = 0.00001
+_BUCKETS_PER_OCTAVE = 4
+_BUCKET_COUNT = 4 * 26
+
+
+def _bucket(latency):
+	if latency <= _BUCKET_BASE:
+		return 0
+	i = int(math.log(latency / _BUCKET_BASE, 2) * _BUCKETS_PER_OCTAVE) + 1
+	return min(i, _BUCKET_COUNT - 1)
+
+def _bucketLimit(i):
+	return _BUCKET_BASE * 2.0 ** (float(i) / _BUCKETS_PER_OCTAVE)
+
+
+class _MessageStats(object):
+	__slots__ = ['requests', 'errors', 'indications', 'bytesOut', 'bytesIn',
+		'latencySum', 'latencyMax', 'histogram']
+
+	def __init__(self):
+		self.requests = 0
+		self.errors = 0
+		self.indications = 0
+		self.bytesOut = 0
+		self.bytesIn = 0
+		self.latencySum = 0.0
+		self.latencyMax = 0.0
+		self.histogram = [0] * _BUCKET_COUNT
+
+	def percentile(self, p):
+		total = sum(self.histogram)
+		if total == 0:
+			return None
+		rank = p * total
+		seen = 0
+		for (i, count) in enumerate(self.histogram):
+			seen += count
+			if seen >= rank:
+				return min(_bucketLimit(i), self.latencyMax)
+		return self.latencyMax
+
+	def dump(self):
+		confirmed = sum(self.histogram)
+		return {
+			'requests'    : self.requests,
+			'errors'      : self.errors,
+			'indications' : self.indications,
+			'bytes_out'   : self.bytesOut,
+			'bytes_in'    : self.bytesIn,
+			'latency'     : {
+				'count' : confirmed,
+				'mean'  : self.latencySum / confirmed if confirmed else None,
+				'max'   : self.latencyMax if confirmed else None,
+				'p50'   : self.percentile(0.50),
+				'p95'   : self.percentile(0.95),
+				'p99'   : self.percentile(0.99),
+			}
+		}
+
+
+class RpcMetrics(object):
+	"""Counters, byte totals and latency histograms of each message type.
+
+	The connectors report every request when it is sent and its confirmation
+	when it arrives, no matter if the request was issued synchronously, with
+	a callback or through a Pipeline. All connectors of the process share one
+	instance. Latencies are measured in seconds.
+	"""
+
+	def __init__(self):
+		self.__lock = threading.Lock()
+		self.__started = time.time()
+		self.__stats = {}
+
+	def __get(self, msg):
+		stats = self.__stats.get(msg)
+		if stats is None:
+			stats = self.__stats[msg] = _MessageStats()
+		return stats
+
+	def request(self, msg, size):
+		with self.__lock:
+			stats = self.__get(msg)
+			stats.requests += 1
+			stats.bytesOut += size
+
+	def confirm(self, msg, size, latency, error=False):
+		with self.__lock:
+			stats = self.__get(msg)
+			stats.bytesIn += size
+			if error:
+				stats.errors += 1
+			stats.latencySum += latency
+			if latency > stats.latencyMax:
+				stats.latencyMax = latency
+			stats.histogram[_bucket(latency)] += 1
+
+	def indication(self, msg, size):
+		with self.__lock:
+			stats = self.__get(msg)
+			stats.indications += 1
+			stats.bytesIn += size
+
+	def reset(self):
+		with self.__lock:
+			self.__started = time.time()
+			self.__stats = {}
+
+	def snapshot(self):
+		"""Return the statistics as dict, keyed by the message name."""
+		from .connector import _requestNames
+		with self.__lock:
+			return dict((_requestNames.get(msg, hex(msg)), stats.dump())
+				for (msg, stats) in self.__stats.items())
+
+	def dump(self, f):
+		"""Write the statistics as JSON into the file object 'f'."""
+		data = {
+			'duration' : time.time() - self.__started,
+			'messages' : self.snapshot()
+		}
+		json.dump(data, f, indent=1, sort_keys=True)
+		f.write('\n')
+
+
+_metrics = None
+_metricsLock = threading.Lock()
+
+def get():
+	"""Return the RpcMetrics of the process or None if they are disabled."""
+	return _metrics
+
+def enable(path=None):
+	"""Start collecting statistics and return the RpcMetrics.
+
+	If 'path' is given the statistics are written there as JSON when the
+	process exits. '-' denotes stderr.
+	"""
+	global _metrics
+	with _metricsLock:
+		if _metrics is None:
+			_metrics = RpcMetrics()
+		if path:
+			atexit.register(__DumpMetrics, path)
+	return _metrics
+
+def disable():
+	global _metrics
+	with _metricsLock:
+		_metrics = None
+
+def __DumpMetrics(path):
+	if _metrics is None:
+		return
+	if path == '-':
+		_metrics.dump(sys.stderr)
+	else:
+		try:
+			with open(path, 'w') as f:
+				_metrics.dump(f)
+		except IOError, e:
+			print >>sys.stderr, "Could not write metrics:", e
+
+if os.getenv('PEERDRIVE_METRICS'):
+	enable(os.getenv('PEERDRIVE_METRICS'))
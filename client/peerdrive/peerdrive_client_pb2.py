@@ -0,0 +1,5251 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: peerdrive_client.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='peerdrive_client.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x16peerdrive_client.proto\"%\n\x08\x45rrorCnf\x12\x19\n\x05\x65rror\x18\x01 \x02(\x0e\x32\n.ErrorCode\"9\n\x07InitReq\x12\r\n\x05major\x18\x01 \x02(\r\x12\r\n\x05minor\x18\x02 \x02(\r\x12\x10\n\x06\x63ookie\x18\x03 \x01(\x0c:\x00\"F\n\x07InitCnf\x12\r\n\x05major\x18\x01 \x02(\r\x12\r\n\x05minor\x18\x02 \x02(\r\x12\x1d\n\x0fmax_packet_size\x18\x03 \x01(\r:\x04\x34\x30\x39\x36\"\x9f\x01\n\x07\x45numCnf\x12!\n\tsys_store\x18\x01 \x02(\x0b\x32\x0e.EnumCnf.Store\x12\x1e\n\x06stores\x18\x02 \x03(\x0b\x32\x0e.EnumCnf.Store\x1aQ\n\x05Store\x12\x0b\n\x03sid\x18\x01 \x02(\x0c\x12\x0b\n\x03src\x18\x02 \x02(\t\x12\x0c\n\x04type\x18\x03 \x02(\t\x12\r\n\x05label\x18\x04 \x02(\t\x12\x11\n\x07options\x18\x05 \x01(\t:\x00\"+\n\x0cLookupDocReq\x12\x0b\n\x03\x64oc\x18\x01 \x02(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"\x81\x01\n\x0cLookupDocCnf\x12\"\n\x04revs\x18\x01 \x03(\x0b\x32\x14.LookupDocCnf.RevMap\x12&\n\x08pre_revs\x18\x02 \x03(\x0b\x32\x14.LookupDocCnf.RevMap\x1a%\n\x06RevMap\x12\x0b\n\x03rid\x18\x01 \x02(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"-\n\rLookupManyReq\x12\x0c\n\x04\x64ocs\x18\x01 \x03(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"/\n\rLookupManyCnf\x12\x1e\n\x07results\x18\x01 \x03(\x0b\x32\r.LookupDocCnf\"+\n\x0cLookupRevReq\x12\x0b\n\x03rev\x18\x01 \x02(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"\x1e\n\x0cLookupRevCnf\x12\x0e\n\x06stores\x18\x01 \x03(\x0c\"&\n\x07StatReq\x12\x0b\n\x03rev\x18\x01 \x02(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"\xc6\x02\n\x07StatCnf\x12\r\n\x05\x66lags\x18\x01 \x02(\r\x12\x1b\n\x04\x64\x61ta\x18\x02 \x02(\x0b\x32\r.StatCnf.Data\x12(\n\x0b\x61ttachments\x18\x03 \x03(\x0b\x32\x13.StatCnf.Attachment\x12\x0f\n\x07parents\x18\x04 \x03(\x0c\x12\x0e\n\x06\x63rtime\x18\x05 \x02(\x04\x12\r\n\x05mtime\x18\x06 \x02(\x04\x12\x11\n\ttype_code\x18\x07 \x02(\t\x12\x14\n\x0c\x63reator_code\x18\x08 \x02(\t\x12\x11\n\x07\x63omment\x18\t \x01(\t:\x00\x1a\"\n\x04\x44\x61ta\x12\x0c\n\x04size\x18\x01 \x02(\x04\x12\x0c\n\x04hash\x18\x02 \x02(\x0c\x1aU\n\nAttachment\x12\x0c\n\x04name\x18\x01 \x02(\x0c\x12\x0c\n\x04size\x18\x02 \x02(\x04\x12\x0c\n\x04hash\x18\x03 \x02(\x0c\x12\x0e\n\x06\x63rtime\x18\x04 \x02(\x04\x12\r\n\x05mtime\x18\x05 \x02(\x04\"+\n\x0bStatManyReq\x12\x0c\n\x04revs\x18\x01 \x03(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"p\n\x0bStatManyCnf\x12$\n\x07results\x18\x01 \x03(\x0b\x32\x13.StatManyCnf.Result\x1a;\n\x06Result\x12\x16\n\x04stat\x18\x01 \x01(\x0b\x32\x08.StatCnf\x12\x19\n\x05\x65rror\x18\x02 \x01(\x0e\x32\n.ErrorCode\"*\n\x0bGetLinksReq\x12\x0b\n\x03rev\x18\x01 \x02(\x0c\x12\x0e\n\x06stores\x18\x02 \x03(\x0c\"3\n\x0bGetLinksCnf\x12\x11\n\tdoc_links\x18\x01 \x03(\x0c\x12\x11\n\trev_links\x18\x02 \x03(\x0c\"%\n\x07PeekReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03rev\x18\x02 \x02(\x0c\"\x19\n\x07PeekCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\"C\n\tCreateReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x11\n\ttype_code\x18\x02 \x02(\t\x12\x14\n\x0c\x63reator_code\x18\x03 \x02(\t\"(\n\tCreateCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\";\n\x07\x46orkReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03rev\x18\x02 \x02(\x0c\x12\x14\n\x0c\x63reator_code\x18\x03 \x02(\t\"&\n\x07\x46orkCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\"J\n\tUpdateReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\x12\x0b\n\x03rev\x18\x03 \x02(\x0c\x12\x14\n\x0c\x63reator_code\x18\x04 \x01(\t\"\x1b\n\tUpdateCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\"J\n\tResumeReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\x12\x0b\n\x03rev\x18\x03 \x02(\x0c\x12\x14\n\x0c\x63reator_code\x18\x04 \x01(\t\"\x1b\n\tResumeCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\"0\n\nGetDataReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x12\n\x08selector\x18\x02 \x01(\t:\x00\"\x1a\n\nGetDataCnf\x12\x0c\n\x04\x64\x61ta\x18\x01 \x02(\x0c\"j\n\rGetRevDataReq\x12\"\n\x05items\x18\x01 \x03(\x0b\x32\x13.GetRevDataReq.Item\x1a\x35\n\x04Item\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03rev\x18\x02 \x02(\x0c\x12\x11\n\tselectors\x18\x03 \x03(\t\"\xb4\x01\n\rGetRevDataCnf\x12&\n\x07results\x18\x01 \x03(\x0b\x32\x15.GetRevDataCnf.Result\x1a\x30\n\x05Value\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\x19\n\x05\x65rror\x18\x02 \x01(\x0e\x32\n.ErrorCode\x1aI\n\x06Result\x12$\n\x06values\x18\x01 \x03(\x0b\x32\x14.GetRevDataCnf.Value\x12\x19\n\x05\x65rror\x18\x02 \x01(\x0e\x32\n.ErrorCode\">\n\nSetDataReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x12\n\x08selector\x18\x02 \x01(\t:\x00\x12\x0c\n\x04\x64\x61ta\x18\x03 \x02(\x0c\"G\n\x07ReadReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0c\n\x04part\x18\x02 \x02(\x0c\x12\x0e\n\x06offset\x18\x03 \x02(\x04\x12\x0e\n\x06length\x18\x04 \x02(\r\"\x17\n\x07ReadCnf\x12\x0c\n\x04\x64\x61ta\x18\x01 \x02(\x0c\"8\n\x08TruncReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0c\n\x04part\x18\x02 \x02(\x0c\x12\x0e\n\x06offset\x18\x03 \x02(\x04\"<\n\x0eWriteBufferReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0c\n\x04part\x18\x02 \x02(\x0c\x12\x0c\n\x04\x64\x61ta\x18\x03 \x02(\x0c\"L\n\x0eWriteCommitReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0c\n\x04part\x18\x02 \x02(\x0c\x12\x0e\n\x06offset\x18\x03 \x02(\x04\x12\x0c\n\x04\x64\x61ta\x18\x04 \x02(\x0c\"\x1a\n\x08\x46StatReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\",\n\x0bSetFlagsReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\r\n\x05\x66lags\x18\x02 \x02(\r\"/\n\nSetTypeReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x11\n\ttype_code\x18\x02 \x02(\t\"@\n\x0bSetMTimeReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x12\n\nattachment\x18\x02 \x02(\x0c\x12\r\n\x05mtime\x18\x03 \x02(\x04\"]\n\x08MergeReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\r\n\x05store\x18\x02 \x02(\x0c\x12\x0b\n\x03rev\x18\x03 \x02(\x0c\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x04\x12\x16\n\x07verbose\x18\x05 \x01(\x08:\x05\x66\x61lse\"(\n\tRebaseReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0b\n\x03rev\x18\x02 \x02(\x0c\",\n\tCommitReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0f\n\x07\x63omment\x18\x02 \x01(\t\"\x18\n\tCommitCnf\x12\x0b\n\x03rev\x18\x01 \x02(\x0c\"-\n\nSuspendReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\x12\x0f\n\x07\x63omment\x18\x02 \x01(\t\"\x19\n\nSuspendCnf\x12\x0b\n\x03rev\x18\x01 \x02(\x0c\"\x1a\n\x08\x43loseReq\x12\x0e\n\x06handle\x18\x01 \x02(\r\"Y\n\x0bWatchAddReq\x12\x1f\n\x04type\x18\x01 \x02(\x0e\x32\x11.WatchAddReq.Type\x12\x0f\n\x07\x65lement\x18\x02 \x02(\x0c\"\x18\n\x04Type\x12\x07\n\x03\x64oc\x10\x00\x12\x07\n\x03rev\x10\x01\"Y\n\x0bWatchRemReq\x12\x1f\n\x04type\x18\x01 \x02(\x0e\x32\x11.WatchRemReq.Type\x12\x0f\n\x07\x65lement\x18\x02 \x02(\x0c\"\x18\n\x04Type\x12\x07\n\x03\x64oc\x10\x00\x12\x07\n\x03rev\x10\x01\"D\n\x0cWatchManyReq\x12\x19\n\x03\x61\x64\x64\x18\x01 \x03(\x0b\x32\x0c.WatchAddReq\x12\x19\n\x03rem\x18\x02 \x03(\x0b\x32\x0c.WatchRemReq\"\"\n\x10WatchProgressReq\x12\x0e\n\x06\x65nable\x18\x01 \x02(\x08\"4\n\tForgetReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\x12\x0b\n\x03rev\x18\x03 \x02(\x0c\"7\n\x0c\x44\x65leteDocReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\x12\x0b\n\x03rev\x18\x03 \x02(\x0c\"*\n\x0c\x44\x65leteRevReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03rev\x18\x02 \x02(\x0c\"\x87\x01\n\rForwardDocReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\x12\x10\n\x08\x66rom_rev\x18\x03 \x02(\x0c\x12\x0e\n\x06to_rev\x18\x04 \x02(\x0c\x12\x11\n\tsrc_store\x18\x05 \x02(\x0c\x12\r\n\x05\x64\x65pth\x18\x06 \x01(\x04\x12\x16\n\x07verbose\x18\x07 \x01(\x08:\x05\x66\x61lse\"k\n\x0fReplicateDocReq\x12\x11\n\tsrc_store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x02(\x0c\x12\x11\n\tdst_store\x18\x03 \x02(\x0c\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x04\x12\x16\n\x07verbose\x18\x05 \x01(\x08:\x05\x66\x61lse\"!\n\x0fReplicateDocCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\"k\n\x0fReplicateRevReq\x12\x11\n\tsrc_store\x18\x01 \x02(\x0c\x12\x0b\n\x03rev\x18\x02 \x02(\x0c\x12\x11\n\tdst_store\x18\x03 \x02(\x0c\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x04\x12\x16\n\x07verbose\x18\x05 \x01(\x08:\x05\x66\x61lse\"!\n\x0fReplicateRevCnf\x12\x0e\n\x06handle\x18\x01 \x02(\r\"^\n\x08MountReq\x12\x0b\n\x03src\x18\x01 \x02(\t\x12\x0c\n\x04type\x18\x02 \x02(\t\x12\r\n\x05label\x18\x03 \x02(\t\x12\x11\n\x07options\x18\x04 \x01(\t:\x00\x12\x15\n\x0b\x63redentials\x18\x05 \x01(\t:\x00\"\x17\n\x08MountCnf\x12\x0b\n\x03sid\x18\x01 \x02(\x0c\"\x19\n\nUnmountReq\x12\x0b\n\x03sid\x18\x01 \x02(\x0c\";\n\nGetPathReq\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0e\n\x06object\x18\x02 \x02(\x0c\x12\x0e\n\x06is_rev\x18\x03 \x02(\x08\"\x1a\n\nGetPathCnf\x12\x0c\n\x04path\x18\x01 \x02(\t\"\xd8\x01\n\x08WatchInd\x12\x1e\n\x05\x65vent\x18\x01 \x02(\x0e\x32\x0f.WatchInd.Event\x12\x1c\n\x04type\x18\x02 \x02(\x0e\x32\x0e.WatchInd.Type\x12\r\n\x05store\x18\x03 \x02(\x0c\x12\x0f\n\x07\x65lement\x18\x04 \x02(\x0c\"T\n\x05\x45vent\x12\x0c\n\x08modified\x10\x00\x12\x0c\n\x08\x61ppeared\x10\x01\x12\x0e\n\nreplicated\x10\x02\x12\x0e\n\ndiminished\x10\x03\x12\x0f\n\x0b\x64isappeared\x10\x04\"\x18\n\x04Type\x12\x07\n\x03\x64oc\x10\x00\x12\x07\n\x03rev\x10\x01\"\x9d\x01\n\x10ProgressStartInd\x12\x0b\n\x03tag\x18\x01 \x02(\r\x12$\n\x04type\x18\x02 \x02(\x0e\x32\x16.ProgressStartInd.Type\x12\x0e\n\x06source\x18\x03 \x02(\x0c\x12\x0c\n\x04\x64\x65st\x18\x04 \x02(\x0c\x12\x0c\n\x04item\x18\x05 \x01(\x0c\"*\n\x04Type\x12\x08\n\x04sync\x10\x00\x12\x0b\n\x07rep_doc\x10\x01\x12\x0b\n\x07rep_rev\x10\x02\"4\n\x10ProgressStartReq\x12\x0b\n\x03tag\x18\x01 \x02(\r\x12\x13\n\x04skip\x18\x02 \x01(\x08:\x05\x66\x61lse\"\xbc\x01\n\x0bProgressInd\x12\x0b\n\x03tag\x18\x01 \x02(\r\x12\x10\n\x08progress\x18\x02 \x02(\r\x12!\n\x05state\x18\x03 \x02(\x0e\x32\x12.ProgressInd.State\x12\x1c\n\x08\x65rr_code\x18\x04 \x01(\x0e\x32\n.ErrorCode\x12\x0f\n\x07\x65rr_doc\x18\x05 \x01(\x0c\x12\x0f\n\x07\x65rr_rev\x18\x06 \x01(\x0c\"+\n\x05State\x12\x0b\n\x07running\x10\x00\x12\n\n\x06paused\x10\x01\x12\t\n\x05\x65rror\x10\x02\"\x1d\n\x0eProgressEndInd\x12\x0b\n\x03tag\x18\x01 \x02(\r\",\n\x0eProgressEndReq\x12\x0b\n\x03tag\x18\x01 \x02(\r\x12\r\n\x05pause\x18\x02 \x02(\x08\"\x7f\n\x10ProgressQueryCnf\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.ProgressQueryCnf.Item\x1a\x44\n\x04Item\x12\x1f\n\x04item\x18\x01 \x02(\x0b\x32\x11.ProgressStartInd\x12\x1b\n\x05state\x18\x02 \x02(\x0b\x32\x0c.ProgressInd\"0\n\x0bWalkPathReq\x12\x0c\n\x04path\x18\x01 \x02(\t\x12\x13\n\x0bmax_results\x18\x02 \x01(\r\"`\n\x0bWalkPathCnf\x12 \n\x05items\x18\x01 \x03(\x0b\x32\x11.WalkPathCnf.Item\x1a/\n\x04Item\x12\r\n\x05store\x18\x01 \x02(\x0c\x12\x0b\n\x03\x64oc\x18\x02 \x01(\x0c\x12\x0b\n\x03rev\x18\x03 \x01(\x0c*\xdd\x0e\n\tErrorCode\x12\r\n\teconflict\x10\x00\x12\t\n\x05\x65\x32\x62ig\x10\x01\x12\n\n\x06\x65\x61\x63\x63\x65s\x10\x02\x12\x0e\n\neaddrinuse\x10\x03\x12\x11\n\readdrnotavail\x10\x04\x12\x08\n\x04\x65\x61\x64v\x10\x05\x12\x10\n\x0c\x65\x61\x66nosupport\x10\x06\x12\n\n\x06\x65\x61gain\x10\x07\x12\n\n\x06\x65\x61lign\x10\x08\x12\x0c\n\x08\x65\x61lready\x10\t\x12\t\n\x05\x65\x62\x61\x64\x65\x10\n\x12\t\n\x05\x65\x62\x61\x64\x66\x10\x0b\x12\n\n\x06\x65\x62\x61\x64\x66\x64\x10\x0c\x12\x0b\n\x07\x65\x62\x61\x64msg\x10\r\x12\t\n\x05\x65\x62\x61\x64r\x10\x0e\x12\x0b\n\x07\x65\x62\x61\x64rpc\x10\x0f\x12\x0b\n\x07\x65\x62\x61\x64rqc\x10\x10\x12\x0b\n\x07\x65\x62\x61\x64slt\x10\x11\x12\n\n\x06\x65\x62\x66ont\x10\x12\x12\t\n\x05\x65\x62usy\x10\x13\x12\n\n\x06\x65\x63hild\x10\x14\x12\n\n\x06\x65\x63hrng\x10\x15\x12\t\n\x05\x65\x63omm\x10\x16\x12\x10\n\x0c\x65\x63onnaborted\x10\x17\x12\x10\n\x0c\x65\x63onnrefused\x10\x18\x12\x0e\n\neconnreset\x10\x19\x12\x0b\n\x07\x65\x64\x65\x61\x64lk\x10\x1a\x12\r\n\tedeadlock\x10\x1b\x12\x10\n\x0c\x65\x64\x65staddrreq\x10\x1c\x12\n\n\x06\x65\x64irty\x10\x1d\x12\x08\n\x04\x65\x64om\x10\x1e\x12\x0b\n\x07\x65\x64otdot\x10\x1f\x12\n\n\x06\x65\x64quot\x10 \x12\x0b\n\x07\x65\x64uppkg\x10!\x12\n\n\x06\x65\x65xist\x10\"\x12\n\n\x06\x65\x66\x61ult\x10#\x12\t\n\x05\x65\x66\x62ig\x10$\x12\r\n\tehostdown\x10%\x12\x10\n\x0c\x65hostunreach\x10&\x12\t\n\x05\x65idrm\x10\'\x12\t\n\x05\x65init\x10(\x12\x0f\n\x0b\x65inprogress\x10)\x12\t\n\x05\x65intr\x10*\x12\n\n\x06\x65inval\x10+\x12\x07\n\x03\x65io\x10,\x12\x0b\n\x07\x65isconn\x10-\x12\n\n\x06\x65isdir\x10.\x12\n\n\x06\x65isnam\x10/\x12\t\n\x05\x65lbin\x10\x30\x12\n\n\x06\x65l2hlt\x10\x31\x12\x0c\n\x08\x65l2nsync\x10\x32\x12\n\n\x06\x65l3hlt\x10\x33\x12\n\n\x06\x65l3rst\x10\x34\x12\x0b\n\x07\x65libacc\x10\x35\x12\x0b\n\x07\x65libbad\x10\x36\x12\x0c\n\x08\x65libexec\x10\x37\x12\x0b\n\x07\x65libmax\x10\x38\x12\x0b\n\x07\x65libscn\x10\x39\x12\n\n\x06\x65lnrng\x10:\x12\t\n\x05\x65loop\x10;\x12\n\n\x06\x65mfile\x10<\x12\n\n\x06\x65mlink\x10=\x12\x0c\n\x08\x65msgsize\x10>\x12\r\n\temultihop\x10?\x12\x10\n\x0c\x65nametoolong\x10@\x12\x0b\n\x07\x65navail\x10\x41\x12\x08\n\x04\x65net\x10\x42\x12\x0c\n\x08\x65netdown\x10\x43\x12\r\n\tenetreset\x10\x44\x12\x0f\n\x0b\x65netunreach\x10\x45\x12\n\n\x06\x65nfile\x10\x46\x12\n\n\x06\x65noano\x10G\x12\x0b\n\x07\x65nobufs\x10H\x12\n\n\x06\x65nocsi\x10I\x12\x0b\n\x07\x65nodata\x10J\x12\n\n\x06\x65nodev\x10K\x12\n\n\x06\x65noent\x10L\x12\x0b\n\x07\x65noexec\x10M\x12\n\n\x06\x65nolck\x10N\x12\x0b\n\x07\x65nolink\x10O\x12\n\n\x06\x65nomem\x10P\x12\n\n\x06\x65nomsg\x10Q\x12\n\n\x06\x65nonet\x10R\x12\n\n\x06\x65nopkg\x10S\x12\x0f\n\x0b\x65noprotoopt\x10T\x12\n\n\x06\x65nospc\x10U\x12\t\n\x05\x65nosr\x10V\x12\n\n\x06\x65nosym\x10W\x12\n\n\x06\x65nosys\x10X\x12\x0b\n\x07\x65notblk\x10Y\x12\x0c\n\x08\x65notconn\x10Z\x12\x0b\n\x07\x65notdir\x10[\x12\r\n\tenotempty\x10\\\x12\x0b\n\x07\x65notnam\x10]\x12\x0c\n\x08\x65notsock\x10^\x12\x0b\n\x07\x65notsup\x10_\x12\n\n\x06\x65notty\x10`\x12\x0c\n\x08\x65notuniq\x10\x61\x12\t\n\x05\x65nxio\x10\x62\x12\x0e\n\neopnotsupp\x10\x63\x12\t\n\x05\x65perm\x10\x64\x12\x10\n\x0c\x65pfnosupport\x10\x65\x12\t\n\x05\x65pipe\x10\x66\x12\x0c\n\x08\x65proclim\x10g\x12\x10\n\x0c\x65procunavail\x10h\x12\x11\n\reprogmismatch\x10i\x12\x10\n\x0c\x65progunavail\x10j\x12\n\n\x06\x65proto\x10k\x12\x13\n\x0f\x65protonosupport\x10l\x12\x0e\n\neprototype\x10m\x12\n\n\x06\x65range\x10n\x12\x0c\n\x08\x65refused\x10o\x12\x0b\n\x07\x65remchg\x10p\x12\x0b\n\x07\x65remdev\x10q\x12\x0b\n\x07\x65remote\x10r\x12\r\n\teremoteio\x10s\x12\x12\n\x0e\x65remoterelease\x10t\x12\t\n\x05\x65rofs\x10u\x12\x10\n\x0c\x65rpcmismatch\x10v\x12\x0c\n\x08\x65rremote\x10w\x12\r\n\teshutdown\x10x\x12\x13\n\x0f\x65socktnosupport\x10y\x12\n\n\x06\x65spipe\x10z\x12\t\n\x05\x65srch\x10{\x12\n\n\x06\x65srmnt\x10|\x12\n\n\x06\x65stale\x10}\x12\x0c\n\x08\x65success\x10~\x12\t\n\x05\x65time\x10\x7f\x12\x0e\n\tetimedout\x10\x80\x01\x12\x11\n\x0c\x65toomanyrefs\x10\x81\x01\x12\x0c\n\x07\x65txtbsy\x10\x82\x01\x12\x0c\n\x07\x65uclean\x10\x83\x01\x12\x0c\n\x07\x65unatch\x10\x84\x01\x12\x0b\n\x06\x65users\x10\x85\x01\x12\r\n\x08\x65version\x10\x86\x01\x12\x10\n\x0b\x65wouldblock\x10\x87\x01\x12\n\n\x05\x65xdev\x10\x88\x01\x12\x0b\n\x06\x65xfull\x10\x89\x01\x12\r\n\x08nxdomain\x10\x8a\x01'
+)
+
+_ERRORCODE = _descriptor.EnumDescriptor(
+  name='ErrorCode',
+  full_name='ErrorCode',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='econflict', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='e2big', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eacces', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eaddrinuse', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eaddrnotavail', index=4, number=4,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eadv', index=5, number=5,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eafnosupport', index=6, number=6,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eagain', index=7, number=7,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ealign', index=8, number=8,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ealready', index=9, number=9,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebade', index=10, number=10,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadf', index=11, number=11,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadfd', index=12, number=12,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadmsg', index=13, number=13,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadr', index=14, number=14,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadrpc', index=15, number=15,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadrqc', index=16, number=16,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebadslt', index=17, number=17,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebfont', index=18, number=18,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ebusy', index=19, number=19,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='echild', index=20, number=20,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='echrng', index=21, number=21,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ecomm', index=22, number=22,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='econnaborted', index=23, number=23,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='econnrefused', index=24, number=24,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='econnreset', index=25, number=25,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edeadlk', index=26, number=26,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edeadlock', index=27, number=27,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edestaddrreq', index=28, number=28,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edirty', index=29, number=29,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edom', index=30, number=30,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edotdot', index=31, number=31,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='edquot', index=32, number=32,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eduppkg', index=33, number=33,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eexist', index=34, number=34,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='efault', index=35, number=35,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='efbig', index=36, number=36,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ehostdown', index=37, number=37,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ehostunreach', index=38, number=38,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eidrm', index=39, number=39,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='einit', index=40, number=40,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='einprogress', index=41, number=41,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eintr', index=42, number=42,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='einval', index=43, number=43,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eio', index=44, number=44,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eisconn', index=45, number=45,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eisdir', index=46, number=46,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eisnam', index=47, number=47,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elbin', index=48, number=48,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='el2hlt', index=49, number=49,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='el2nsync', index=50, number=50,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='el3hlt', index=51, number=51,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='el3rst', index=52, number=52,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elibacc', index=53, number=53,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elibbad', index=54, number=54,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elibexec', index=55, number=55,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elibmax', index=56, number=56,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elibscn', index=57, number=57,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='elnrng', index=58, number=58,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eloop', index=59, number=59,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='emfile', index=60, number=60,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='emlink', index=61, number=61,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='emsgsize', index=62, number=62,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='emultihop', index=63, number=63,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enametoolong', index=64, number=64,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enavail', index=65, number=65,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enet', index=66, number=66,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enetdown', index=67, number=67,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enetreset', index=68, number=68,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enetunreach', index=69, number=69,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enfile', index=70, number=70,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enoano', index=71, number=71,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enobufs', index=72, number=72,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enocsi', index=73, number=73,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enodata', index=74, number=74,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enodev', index=75, number=75,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enoent', index=76, number=76,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enoexec', index=77, number=77,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enolck', index=78, number=78,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enolink', index=79, number=79,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enomem', index=80, number=80,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enomsg', index=81, number=81,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enonet', index=82, number=82,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enopkg', index=83, number=83,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enoprotoopt', index=84, number=84,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enospc', index=85, number=85,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enosr', index=86, number=86,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enosym', index=87, number=87,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enosys', index=88, number=88,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotblk', index=89, number=89,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotconn', index=90, number=90,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotdir', index=91, number=91,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotempty', index=92, number=92,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotnam', index=93, number=93,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotsock', index=94, number=94,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotsup', index=95, number=95,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotty', index=96, number=96,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enotuniq', index=97, number=97,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='enxio', index=98, number=98,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eopnotsupp', index=99, number=99,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eperm', index=100, number=100,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='epfnosupport', index=101, number=101,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='epipe', index=102, number=102,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eproclim', index=103, number=103,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eprocunavail', index=104, number=104,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eprogmismatch', index=105, number=105,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eprogunavail', index=106, number=106,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eproto', index=107, number=107,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eprotonosupport', index=108, number=108,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eprototype', index=109, number=109,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='erange', index=110, number=110,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='erefused', index=111, number=111,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eremchg', index=112, number=112,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eremdev', index=113, number=113,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eremote', index=114, number=114,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eremoteio', index=115, number=115,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eremoterelease', index=116, number=116,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='erofs', index=117, number=117,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='erpcmismatch', index=118, number=118,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='erremote', index=119, number=119,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eshutdown', index=120, number=120,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='esocktnosupport', index=121, number=121,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='espipe', index=122, number=122,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='esrch', index=123, number=123,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='esrmnt', index=124, number=124,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='estale', index=125, number=125,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='esuccess', index=126, number=126,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='etime', index=127, number=127,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='etimedout', index=128, number=128,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='etoomanyrefs', index=129, number=129,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='etxtbsy', index=130, number=130,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='euclean', index=131, number=131,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eunatch', index=132, number=132,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eusers', index=133, number=133,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='eversion', index=134, number=134,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ewouldblock', index=135, number=135,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='exdev', index=136, number=136,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='exfull', index=137, number=137,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='nxdomain', index=138, number=138,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=5135,
+  serialized_end=7020,
+)
+_sym_db.RegisterEnumDescriptor(_ERRORCODE)
+
+ErrorCode = enum_type_wrapper.EnumTypeWrapper(_ERRORCODE)
+econflict = 0
+e2big = 1
+eacces = 2
+eaddrinuse = 3
+eaddrnotavail = 4
+eadv = 5
+eafnosupport = 6
+eagain = 7
+ealign = 8
+ealready = 9
+ebade = 10
+ebadf = 11
+ebadfd = 12
+ebadmsg = 13
+ebadr = 14
+ebadrpc = 15
+ebadrqc = 16
+ebadslt = 17
+ebfont = 18
+ebusy = 19
+echild = 20
+echrng = 21
+ecomm = 22
+econnaborted = 23
+econnrefused = 24
+econnreset = 25
+edeadlk = 26
+edeadlock = 27
+edestaddrreq = 28
+edirty = 29
+edom = 30
+edotdot = 31
+edquot = 32
+eduppkg = 33
+eexist = 34
+efault = 35
+efbig = 36
+ehostdown = 37
+ehostunreach = 38
+eidrm = 39
+einit = 40
+einprogress = 41
+eintr = 42
+einval = 43
+eio = 44
+eisconn = 45
+eisdir = 46
+eisnam = 47
+elbin = 48
+el2hlt = 49
+el2nsync = 50
+el3hlt = 51
+el3rst = 52
+elibacc = 53
+elibbad = 54
+elibexec = 55
+elibmax = 56
+elibscn = 57
+elnrng = 58
+eloop = 59
+emfile = 60
+emlink = 61
+emsgsize = 62
+emultihop = 63
+enametoolong = 64
+enavail = 65
+enet = 66
+enetdown = 67
+enetreset = 68
+enetunreach = 69
+enfile = 70
+enoano = 71
+enobufs = 72
+enocsi = 73
+enodata = 74
+enodev = 75
+enoent = 76
+enoexec = 77
+enolck = 78
+enolink = 79
+enomem = 80
+enomsg = 81
+enonet = 82
+enopkg = 83
+enoprotoopt = 84
+enospc = 85
+enosr = 86
+enosym = 87
+enosys = 88
+enotblk = 89
+enotconn = 90
+enotdir = 91
+enotempty = 92
+enotnam = 93
+enotsock = 94
+enotsup = 95
+enotty = 96
+enotuniq = 97
+enxio = 98
+eopnotsupp = 99
+eperm = 100
+epfnosupport = 101
+epipe = 102
+eproclim = 103
+eprocunavail = 104
+eprogmismatch = 105
+eprogunavail = 106
+eproto = 107
+eprotonosupport = 108
+eprototype = 109
+erange = 110
+erefused = 111
+eremchg = 112
+eremdev = 113
+eremote = 114
+eremoteio = 115
+eremoterelease = 116
+erofs = 117
+erpcmismatch = 118
+erremote = 119
+eshutdown = 120
+esocktnosupport = 121
+espipe = 122
+esrch = 123
+esrmnt = 124
+estale = 125
+esuccess = 126
+etime = 127
+etimedout = 128
+etoomanyrefs = 129
+etxtbsy = 130
+euclean = 131
+eunatch = 132
+eusers = 133
+eversion = 134
+ewouldblock = 135
+exdev = 136
+exfull = 137
+nxdomain = 138
+
+
+_WATCHADDREQ_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='WatchAddReq.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='doc', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='rev', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3115,
+  serialized_end=3139,
+)
+_sym_db.RegisterEnumDescriptor(_WATCHADDREQ_TYPE)
+
+_WATCHREMREQ_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='WatchRemReq.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='doc', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='rev', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3115,
+  serialized_end=3139,
+)
+_sym_db.RegisterEnumDescriptor(_WATCHREMREQ_TYPE)
+
+_WATCHIND_EVENT = _descriptor.EnumDescriptor(
+  name='Event',
+  full_name='WatchInd.Event',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='modified', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='appeared', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='replicated', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='diminished', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='disappeared', index=4, number=4,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=4263,
+  serialized_end=4347,
+)
+_sym_db.RegisterEnumDescriptor(_WATCHIND_EVENT)
+
+_WATCHIND_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='WatchInd.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='doc', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='rev', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3115,
+  serialized_end=3139,
+)
+_sym_db.RegisterEnumDescriptor(_WATCHIND_TYPE)
+
+_PROGRESSSTARTIND_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='ProgressStartInd.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='sync', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='rep_doc', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='rep_rev', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=4491,
+  serialized_end=4533,
+)
+_sym_db.RegisterEnumDescriptor(_PROGRESSSTARTIND_TYPE)
+
+_PROGRESSIND_STATE = _descriptor.EnumDescriptor(
+  name='State',
+  full_name='ProgressInd.State',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='running', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='paused', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='error', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=4735,
+  serialized_end=4778,
+)
+_sym_db.RegisterEnumDescriptor(_PROGRESSIND_STATE)
+
+
+_ERRORCNF = _descriptor.Descriptor(
+  name='ErrorCnf',
+  full_name='ErrorCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='error', full_name='ErrorCnf.error', index=0,
+      number=1, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=26,
+  serialized_end=63,
+)
+
+
+_INITREQ = _descriptor.Descriptor(
+  name='InitReq',
+  full_name='InitReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='major', full_name='InitReq.major', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='minor', full_name='InitReq.minor', index=1,
+      number=2, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cookie', full_name='InitReq.cookie', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=65,
+  serialized_end=122,
+)
+
+
+_INITCNF = _descriptor.Descriptor(
+  name='InitCnf',
+  full_name='InitCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='major', full_name='InitCnf.major', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='minor', full_name='InitCnf.minor', index=1,
+      number=2, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_packet_size', full_name='InitCnf.max_packet_size', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=True, default_value=4096,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=124,
+  serialized_end=194,
+)
+
+
+_ENUMCNF_STORE = _descriptor.Descriptor(
+  name='Store',
+  full_name='EnumCnf.Store',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sid', full_name='EnumCnf.Store.sid', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='src', full_name='EnumCnf.Store.src', index=1,
+      number=2, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='EnumCnf.Store.type', index=2,
+      number=3, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='label', full_name='EnumCnf.Store.label', index=3,
+      number=4, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='EnumCnf.Store.options', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=275,
+  serialized_end=356,
+)
+
+_ENUMCNF = _descriptor.Descriptor(
+  name='EnumCnf',
+  full_name='EnumCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sys_store', full_name='EnumCnf.sys_store', index=0,
+      number=1, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='EnumCnf.stores', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_ENUMCNF_STORE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=197,
+  serialized_end=356,
+)
+
+
+_LOOKUPDOCREQ = _descriptor.Descriptor(
+  name='LookupDocReq',
+  full_name='LookupDocReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='LookupDocReq.doc', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='LookupDocReq.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=358,
+  serialized_end=401,
+)
+
+
+_LOOKUPDOCCNF_REVMAP = _descriptor.Descriptor(
+  name='RevMap',
+  full_name='LookupDocCnf.RevMap',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rid', full_name='LookupDocCnf.RevMap.rid', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='LookupDocCnf.RevMap.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=496,
+  serialized_end=533,
+)
+
+_LOOKUPDOCCNF = _descriptor.Descriptor(
+  name='LookupDocCnf',
+  full_name='LookupDocCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='revs', full_name='LookupDocCnf.revs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pre_revs', full_name='LookupDocCnf.pre_revs', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_LOOKUPDOCCNF_REVMAP, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=404,
+  serialized_end=533,
+)
+
+
+_LOOKUPMANYREQ = _descriptor.Descriptor(
+  name='LookupManyReq',
+  full_name='LookupManyReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='LookupManyReq.docs', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='LookupManyReq.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=535,
+  serialized_end=580,
+)
+
+
+_LOOKUPMANYCNF = _descriptor.Descriptor(
+  name='LookupManyCnf',
+  full_name='LookupManyCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='LookupManyCnf.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=582,
+  serialized_end=629,
+)
+
+
+_LOOKUPREVREQ = _descriptor.Descriptor(
+  name='LookupRevReq',
+  full_name='LookupRevReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='LookupRevReq.rev', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='LookupRevReq.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=631,
+  serialized_end=674,
+)
+
+
+_LOOKUPREVCNF = _descriptor.Descriptor(
+  name='LookupRevCnf',
+  full_name='LookupRevCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='LookupRevCnf.stores', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=676,
+  serialized_end=706,
+)
+
+
+_STATREQ = _descriptor.Descriptor(
+  name='StatReq',
+  full_name='StatReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='StatReq.rev', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='StatReq.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=708,
+  serialized_end=746,
+)
+
+
+_STATCNF_DATA = _descriptor.Descriptor(
+  name='Data',
+  full_name='StatCnf.Data',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='size', full_name='StatCnf.Data.size', index=0,
+      number=1, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='StatCnf.Data.hash', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=954,
+  serialized_end=988,
+)
+
+_STATCNF_ATTACHMENT = _descriptor.Descriptor(
+  name='Attachment',
+  full_name='StatCnf.Attachment',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='StatCnf.Attachment.name', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='StatCnf.Attachment.size', index=1,
+      number=2, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='StatCnf.Attachment.hash', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='crtime', full_name='StatCnf.Attachment.crtime', index=3,
+      number=4, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mtime', full_name='StatCnf.Attachment.mtime', index=4,
+      number=5, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=990,
+  serialized_end=1075,
+)
+
+_STATCNF = _descriptor.Descriptor(
+  name='StatCnf',
+  full_name='StatCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='flags', full_name='StatCnf.flags', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='StatCnf.data', index=1,
+      number=2, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='attachments', full_name='StatCnf.attachments', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='parents', full_name='StatCnf.parents', index=3,
+      number=4, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='crtime', full_name='StatCnf.crtime', index=4,
+      number=5, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mtime', full_name='StatCnf.mtime', index=5,
+      number=6, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type_code', full_name='StatCnf.type_code', index=6,
+      number=7, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='creator_code', full_name='StatCnf.creator_code', index=7,
+      number=8, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='comment', full_name='StatCnf.comment', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_STATCNF_DATA, _STATCNF_ATTACHMENT, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=749,
+  serialized_end=1075,
+)
+
+
+_STATMANYREQ = _descriptor.Descriptor(
+  name='StatManyReq',
+  full_name='StatManyReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='revs', full_name='StatManyReq.revs', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='StatManyReq.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1077,
+  serialized_end=1120,
+)
+
+
+_STATMANYCNF_RESULT = _descriptor.Descriptor(
+  name='Result',
+  full_name='StatManyCnf.Result',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='stat', full_name='StatManyCnf.Result.stat', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='StatManyCnf.Result.error', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1175,
+  serialized_end=1234,
+)
+
+_STATMANYCNF = _descriptor.Descriptor(
+  name='StatManyCnf',
+  full_name='StatManyCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='StatManyCnf.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_STATMANYCNF_RESULT, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1122,
+  serialized_end=1234,
+)
+
+
+_GETLINKSREQ = _descriptor.Descriptor(
+  name='GetLinksReq',
+  full_name='GetLinksReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='GetLinksReq.rev', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stores', full_name='GetLinksReq.stores', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1236,
+  serialized_end=1278,
+)
+
+
+_GETLINKSCNF = _descriptor.Descriptor(
+  name='GetLinksCnf',
+  full_name='GetLinksCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='doc_links', full_name='GetLinksCnf.doc_links', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev_links', full_name='GetLinksCnf.rev_links', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1280,
+  serialized_end=1331,
+)
+
+
+_PEEKREQ = _descriptor.Descriptor(
+  name='PeekReq',
+  full_name='PeekReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='PeekReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='PeekReq.rev', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1333,
+  serialized_end=1370,
+)
+
+
+_PEEKCNF = _descriptor.Descriptor(
+  name='PeekCnf',
+  full_name='PeekCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='PeekCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1372,
+  serialized_end=1397,
+)
+
+
+_CREATEREQ = _descriptor.Descriptor(
+  name='CreateReq',
+  full_name='CreateReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='CreateReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type_code', full_name='CreateReq.type_code', index=1,
+      number=2, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='creator_code', full_name='CreateReq.creator_code', index=2,
+      number=3, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1399,
+  serialized_end=1466,
+)
+
+
+_CREATECNF = _descriptor.Descriptor(
+  name='CreateCnf',
+  full_name='CreateCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='CreateCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='CreateCnf.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1468,
+  serialized_end=1508,
+)
+
+
+_FORKREQ = _descriptor.Descriptor(
+  name='ForkReq',
+  full_name='ForkReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='ForkReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='ForkReq.rev', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='creator_code', full_name='ForkReq.creator_code', index=2,
+      number=3, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1510,
+  serialized_end=1569,
+)
+
+
+_FORKCNF = _descriptor.Descriptor(
+  name='ForkCnf',
+  full_name='ForkCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='ForkCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ForkCnf.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1571,
+  serialized_end=1609,
+)
+
+
+_UPDATEREQ = _descriptor.Descriptor(
+  name='UpdateReq',
+  full_name='UpdateReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='UpdateReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='UpdateReq.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='UpdateReq.rev', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='creator_code', full_name='UpdateReq.creator_code', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1611,
+  serialized_end=1685,
+)
+
+
+_UPDATECNF = _descriptor.Descriptor(
+  name='UpdateCnf',
+  full_name='UpdateCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='UpdateCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1687,
+  serialized_end=1714,
+)
+
+
+_RESUMEREQ = _descriptor.Descriptor(
+  name='ResumeReq',
+  full_name='ResumeReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='ResumeReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ResumeReq.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='ResumeReq.rev', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='creator_code', full_name='ResumeReq.creator_code', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1716,
+  serialized_end=1790,
+)
+
+
+_RESUMECNF = _descriptor.Descriptor(
+  name='ResumeCnf',
+  full_name='ResumeCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='ResumeCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1792,
+  serialized_end=1819,
+)
+
+
+_GETDATAREQ = _descriptor.Descriptor(
+  name='GetDataReq',
+  full_name='GetDataReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='GetDataReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='selector', full_name='GetDataReq.selector', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1821,
+  serialized_end=1869,
+)
+
+
+_GETDATACNF = _descriptor.Descriptor(
+  name='GetDataCnf',
+  full_name='GetDataCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='GetDataCnf.data', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1871,
+  serialized_end=1897,
+)
+
+
+_GETREVDATAREQ_ITEM = _descriptor.Descriptor(
+  name='Item',
+  full_name='GetRevDataReq.Item',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='GetRevDataReq.Item.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='GetRevDataReq.Item.rev', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='selectors', full_name='GetRevDataReq.Item.selectors', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1952,
+  serialized_end=2005,
+)
+
+_GETREVDATAREQ = _descriptor.Descriptor(
+  name='GetRevDataReq',
+  full_name='GetRevDataReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='GetRevDataReq.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETREVDATAREQ_ITEM, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1899,
+  serialized_end=2005,
+)
+
+
+_GETREVDATACNF_VALUE = _descriptor.Descriptor(
+  name='Value',
+  full_name='GetRevDataCnf.Value',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='GetRevDataCnf.Value.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='GetRevDataCnf.Value.error', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2065,
+  serialized_end=2113,
+)
+
+_GETREVDATACNF_RESULT = _descriptor.Descriptor(
+  name='Result',
+  full_name='GetRevDataCnf.Result',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='values', full_name='GetRevDataCnf.Result.values', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='GetRevDataCnf.Result.error', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2115,
+  serialized_end=2188,
+)
+
+_GETREVDATACNF = _descriptor.Descriptor(
+  name='GetRevDataCnf',
+  full_name='GetRevDataCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='GetRevDataCnf.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETREVDATACNF_VALUE, _GETREVDATACNF_RESULT, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2008,
+  serialized_end=2188,
+)
+
+
+_SETDATAREQ = _descriptor.Descriptor(
+  name='SetDataReq',
+  full_name='SetDataReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='SetDataReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='selector', full_name='SetDataReq.selector', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='SetDataReq.data', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2190,
+  serialized_end=2252,
+)
+
+
+_READREQ = _descriptor.Descriptor(
+  name='ReadReq',
+  full_name='ReadReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='ReadReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='part', full_name='ReadReq.part', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ReadReq.offset', index=2,
+      number=3, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='ReadReq.length', index=3,
+      number=4, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2254,
+  serialized_end=2325,
+)
+
+
+_READCNF = _descriptor.Descriptor(
+  name='ReadCnf',
+  full_name='ReadCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='ReadCnf.data', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2327,
+  serialized_end=2350,
+)
+
+
+_TRUNCREQ = _descriptor.Descriptor(
+  name='TruncReq',
+  full_name='TruncReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='TruncReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='part', full_name='TruncReq.part', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='TruncReq.offset', index=2,
+      number=3, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2352,
+  serialized_end=2408,
+)
+
+
+_WRITEBUFFERREQ = _descriptor.Descriptor(
+  name='WriteBufferReq',
+  full_name='WriteBufferReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='WriteBufferReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='part', full_name='WriteBufferReq.part', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='WriteBufferReq.data', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2410,
+  serialized_end=2470,
+)
+
+
+_WRITECOMMITREQ = _descriptor.Descriptor(
+  name='WriteCommitReq',
+  full_name='WriteCommitReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='WriteCommitReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='part', full_name='WriteCommitReq.part', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='WriteCommitReq.offset', index=2,
+      number=3, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='WriteCommitReq.data', index=3,
+      number=4, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2472,
+  serialized_end=2548,
+)
+
+
+_FSTATREQ = _descriptor.Descriptor(
+  name='FStatReq',
+  full_name='FStatReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='FStatReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2550,
+  serialized_end=2576,
+)
+
+
+_SETFLAGSREQ = _descriptor.Descriptor(
+  name='SetFlagsReq',
+  full_name='SetFlagsReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='SetFlagsReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='flags', full_name='SetFlagsReq.flags', index=1,
+      number=2, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2578,
+  serialized_end=2622,
+)
+
+
+_SETTYPEREQ = _descriptor.Descriptor(
+  name='SetTypeReq',
+  full_name='SetTypeReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='SetTypeReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type_code', full_name='SetTypeReq.type_code', index=1,
+      number=2, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2624,
+  serialized_end=2671,
+)
+
+
+_SETMTIMEREQ = _descriptor.Descriptor(
+  name='SetMTimeReq',
+  full_name='SetMTimeReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='SetMTimeReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='attachment', full_name='SetMTimeReq.attachment', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mtime', full_name='SetMTimeReq.mtime', index=2,
+      number=3, type=4, cpp_type=4, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2673,
+  serialized_end=2737,
+)
+
+
+_MERGEREQ = _descriptor.Descriptor(
+  name='MergeReq',
+  full_name='MergeReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='MergeReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='store', full_name='MergeReq.store', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='MergeReq.rev', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='depth', full_name='MergeReq.depth', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='verbose', full_name='MergeReq.verbose', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2739,
+  serialized_end=2832,
+)
+
+
+_REBASEREQ = _descriptor.Descriptor(
+  name='RebaseReq',
+  full_name='RebaseReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='RebaseReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='RebaseReq.rev', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2834,
+  serialized_end=2874,
+)
+
+
+_COMMITREQ = _descriptor.Descriptor(
+  name='CommitReq',
+  full_name='CommitReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='CommitReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='comment', full_name='CommitReq.comment', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2876,
+  serialized_end=2920,
+)
+
+
+_COMMITCNF = _descriptor.Descriptor(
+  name='CommitCnf',
+  full_name='CommitCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='CommitCnf.rev', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2922,
+  serialized_end=2946,
+)
+
+
+_SUSPENDREQ = _descriptor.Descriptor(
+  name='SuspendReq',
+  full_name='SuspendReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='SuspendReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='comment', full_name='SuspendReq.comment', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2948,
+  serialized_end=2993,
+)
+
+
+_SUSPENDCNF = _descriptor.Descriptor(
+  name='SuspendCnf',
+  full_name='SuspendCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='SuspendCnf.rev', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2995,
+  serialized_end=3020,
+)
+
+
+_CLOSEREQ = _descriptor.Descriptor(
+  name='CloseReq',
+  full_name='CloseReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='CloseReq.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3022,
+  serialized_end=3048,
+)
+
+
+_WATCHADDREQ = _descriptor.Descriptor(
+  name='WatchAddReq',
+  full_name='WatchAddReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='WatchAddReq.type', index=0,
+      number=1, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='element', full_name='WatchAddReq.element', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _WATCHADDREQ_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3050,
+  serialized_end=3139,
+)
+
+
+_WATCHREMREQ = _descriptor.Descriptor(
+  name='WatchRemReq',
+  full_name='WatchRemReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='WatchRemReq.type', index=0,
+      number=1, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='element', full_name='WatchRemReq.element', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _WATCHREMREQ_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3141,
+  serialized_end=3230,
+)
+
+
+_WATCHMANYREQ = _descriptor.Descriptor(
+  name='WatchManyReq',
+  full_name='WatchManyReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='add', full_name='WatchManyReq.add', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rem', full_name='WatchManyReq.rem', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3232,
+  serialized_end=3300,
+)
+
+
+_WATCHPROGRESSREQ = _descriptor.Descriptor(
+  name='WatchProgressReq',
+  full_name='WatchProgressReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='enable', full_name='WatchProgressReq.enable', index=0,
+      number=1, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3302,
+  serialized_end=3336,
+)
+
+
+_FORGETREQ = _descriptor.Descriptor(
+  name='ForgetReq',
+  full_name='ForgetReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='ForgetReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ForgetReq.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='ForgetReq.rev', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3338,
+  serialized_end=3390,
+)
+
+
+_DELETEDOCREQ = _descriptor.Descriptor(
+  name='DeleteDocReq',
+  full_name='DeleteDocReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='DeleteDocReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='DeleteDocReq.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='DeleteDocReq.rev', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3392,
+  serialized_end=3447,
+)
+
+
+_DELETEREVREQ = _descriptor.Descriptor(
+  name='DeleteRevReq',
+  full_name='DeleteRevReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='DeleteRevReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='DeleteRevReq.rev', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3449,
+  serialized_end=3491,
+)
+
+
+_FORWARDDOCREQ = _descriptor.Descriptor(
+  name='ForwardDocReq',
+  full_name='ForwardDocReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='ForwardDocReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ForwardDocReq.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='from_rev', full_name='ForwardDocReq.from_rev', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='to_rev', full_name='ForwardDocReq.to_rev', index=3,
+      number=4, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='src_store', full_name='ForwardDocReq.src_store', index=4,
+      number=5, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='depth', full_name='ForwardDocReq.depth', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='verbose', full_name='ForwardDocReq.verbose', index=6,
+      number=7, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3494,
+  serialized_end=3629,
+)
+
+
+_REPLICATEDOCREQ = _descriptor.Descriptor(
+  name='ReplicateDocReq',
+  full_name='ReplicateDocReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='src_store', full_name='ReplicateDocReq.src_store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ReplicateDocReq.doc', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dst_store', full_name='ReplicateDocReq.dst_store', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='depth', full_name='ReplicateDocReq.depth', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='verbose', full_name='ReplicateDocReq.verbose', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3631,
+  serialized_end=3738,
+)
+
+
+_REPLICATEDOCCNF = _descriptor.Descriptor(
+  name='ReplicateDocCnf',
+  full_name='ReplicateDocCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='ReplicateDocCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3740,
+  serialized_end=3773,
+)
+
+
+_REPLICATEREVREQ = _descriptor.Descriptor(
+  name='ReplicateRevReq',
+  full_name='ReplicateRevReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='src_store', full_name='ReplicateRevReq.src_store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='ReplicateRevReq.rev', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dst_store', full_name='ReplicateRevReq.dst_store', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='depth', full_name='ReplicateRevReq.depth', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='verbose', full_name='ReplicateRevReq.verbose', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3775,
+  serialized_end=3882,
+)
+
+
+_REPLICATEREVCNF = _descriptor.Descriptor(
+  name='ReplicateRevCnf',
+  full_name='ReplicateRevCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='handle', full_name='ReplicateRevCnf.handle', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3884,
+  serialized_end=3917,
+)
+
+
+_MOUNTREQ = _descriptor.Descriptor(
+  name='MountReq',
+  full_name='MountReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='src', full_name='MountReq.src', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='MountReq.type', index=1,
+      number=2, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='label', full_name='MountReq.label', index=2,
+      number=3, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='MountReq.options', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='credentials', full_name='MountReq.credentials', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=True, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3919,
+  serialized_end=4013,
+)
+
+
+_MOUNTCNF = _descriptor.Descriptor(
+  name='MountCnf',
+  full_name='MountCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sid', full_name='MountCnf.sid', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4015,
+  serialized_end=4038,
+)
+
+
+_UNMOUNTREQ = _descriptor.Descriptor(
+  name='UnmountReq',
+  full_name='UnmountReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sid', full_name='UnmountReq.sid', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4040,
+  serialized_end=4065,
+)
+
+
+_GETPATHREQ = _descriptor.Descriptor(
+  name='GetPathReq',
+  full_name='GetPathReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='GetPathReq.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='object', full_name='GetPathReq.object', index=1,
+      number=2, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='is_rev', full_name='GetPathReq.is_rev', index=2,
+      number=3, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4067,
+  serialized_end=4126,
+)
+
+
+_GETPATHCNF = _descriptor.Descriptor(
+  name='GetPathCnf',
+  full_name='GetPathCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='path', full_name='GetPathCnf.path', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4128,
+  serialized_end=4154,
+)
+
+
+_WATCHIND = _descriptor.Descriptor(
+  name='WatchInd',
+  full_name='WatchInd',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='event', full_name='WatchInd.event', index=0,
+      number=1, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='WatchInd.type', index=1,
+      number=2, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='store', full_name='WatchInd.store', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='element', full_name='WatchInd.element', index=3,
+      number=4, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _WATCHIND_EVENT,
+    _WATCHIND_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4157,
+  serialized_end=4373,
+)
+
+
+_PROGRESSSTARTIND = _descriptor.Descriptor(
+  name='ProgressStartInd',
+  full_name='ProgressStartInd',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='ProgressStartInd.tag', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ProgressStartInd.type', index=1,
+      number=2, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='source', full_name='ProgressStartInd.source', index=2,
+      number=3, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dest', full_name='ProgressStartInd.dest', index=3,
+      number=4, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='item', full_name='ProgressStartInd.item', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PROGRESSSTARTIND_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4376,
+  serialized_end=4533,
+)
+
+
+_PROGRESSSTARTREQ = _descriptor.Descriptor(
+  name='ProgressStartReq',
+  full_name='ProgressStartReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='ProgressStartReq.tag', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='skip', full_name='ProgressStartReq.skip', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=True, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4535,
+  serialized_end=4587,
+)
+
+
+_PROGRESSIND = _descriptor.Descriptor(
+  name='ProgressInd',
+  full_name='ProgressInd',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='ProgressInd.tag', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='progress', full_name='ProgressInd.progress', index=1,
+      number=2, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ProgressInd.state', index=2,
+      number=3, type=14, cpp_type=8, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='err_code', full_name='ProgressInd.err_code', index=3,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='err_doc', full_name='ProgressInd.err_doc', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='err_rev', full_name='ProgressInd.err_rev', index=5,
+      number=6, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PROGRESSIND_STATE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4590,
+  serialized_end=4778,
+)
+
+
+_PROGRESSENDIND = _descriptor.Descriptor(
+  name='ProgressEndInd',
+  full_name='ProgressEndInd',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='ProgressEndInd.tag', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4780,
+  serialized_end=4809,
+)
+
+
+_PROGRESSENDREQ = _descriptor.Descriptor(
+  name='ProgressEndReq',
+  full_name='ProgressEndReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tag', full_name='ProgressEndReq.tag', index=0,
+      number=1, type=13, cpp_type=3, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pause', full_name='ProgressEndReq.pause', index=1,
+      number=2, type=8, cpp_type=7, label=2,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4811,
+  serialized_end=4855,
+)
+
+
+_PROGRESSQUERYCNF_ITEM = _descriptor.Descriptor(
+  name='Item',
+  full_name='ProgressQueryCnf.Item',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='item', full_name='ProgressQueryCnf.Item.item', index=0,
+      number=1, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ProgressQueryCnf.Item.state', index=1,
+      number=2, type=11, cpp_type=10, label=2,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4916,
+  serialized_end=4984,
+)
+
+_PROGRESSQUERYCNF = _descriptor.Descriptor(
+  name='ProgressQueryCnf',
+  full_name='ProgressQueryCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ProgressQueryCnf.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROGRESSQUERYCNF_ITEM, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4857,
+  serialized_end=4984,
+)
+
+
+_WALKPATHREQ = _descriptor.Descriptor(
+  name='WalkPathReq',
+  full_name='WalkPathReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='path', full_name='WalkPathReq.path', index=0,
+      number=1, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_results', full_name='WalkPathReq.max_results', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4986,
+  serialized_end=5034,
+)
+
+
+_WALKPATHCNF_ITEM = _descriptor.Descriptor(
+  name='Item',
+  full_name='WalkPathCnf.Item',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='WalkPathCnf.Item.store', index=0,
+      number=1, type=12, cpp_type=9, label=2,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='WalkPathCnf.Item.doc', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rev', full_name='WalkPathCnf.Item.rev', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5085,
+  serialized_end=5132,
+)
+
+_WALKPATHCNF = _descriptor.Descriptor(
+  name='WalkPathCnf',
+  full_name='WalkPathCnf',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='WalkPathCnf.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_WALKPATHCNF_ITEM, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5036,
+  serialized_end=5132,
+)
+
+_ERRORCNF.fields_by_name['error'].enum_type = _ERRORCODE
+_ENUMCNF_STORE.containing_type = _ENUMCNF
+_ENUMCNF.fields_by_name['sys_store'].message_type = _ENUMCNF_STORE
+_ENUMCNF.fields_by_name['stores'].message_type = _ENUMCNF_STORE
+_LOOKUPDOCCNF_REVMAP.containing_type = _LOOKUPDOCCNF
+_LOOKUPDOCCNF.fields_by_name['revs'].message_type = _LOOKUPDOCCNF_REVMAP
+_LOOKUPDOCCNF.fields_by_name['pre_revs'].message_type = _LOOKUPDOCCNF_REVMAP
+_LOOKUPMANYCNF.fields_by_name['results'].message_type = _LOOKUPDOCCNF
+_STATCNF_DATA.containing_type = _STATCNF
+_STATCNF_ATTACHMENT.containing_type = _STATCNF
+_STATCNF.fields_by_name['data'].message_type = _STATCNF_DATA
+_STATCNF.fields_by_name['attachments'].message_type = _STATCNF_ATTACHMENT
+_STATMANYCNF_RESULT.fields_by_name['stat'].message_type = _STATCNF
+_STATMANYCNF_RESULT.fields_by_name['error'].enum_type = _ERRORCODE
+_STATMANYCNF_RESULT.containing_type = _STATMANYCNF
+_STATMANYCNF.fields_by_name['results'].message_type = _STATMANYCNF_RESULT
+_GETREVDATAREQ_ITEM.containing_type = _GETREVDATAREQ
+_GETREVDATAREQ.fields_by_name['items'].message_type = _GETREVDATAREQ_ITEM
+_GETREVDATACNF_VALUE.fields_by_name['error'].enum_type = _ERRORCODE
+_GETREVDATACNF_VALUE.containing_type = _GETREVDATACNF
+_GETREVDATACNF_RESULT.fields_by_name['values'].message_type = _GETREVDATACNF_VALUE
+_GETREVDATACNF_RESULT.fields_by_name['error'].enum_type = _ERRORCODE
+_GETREVDATACNF_RESULT.containing_type = _GETREVDATACNF
+_GETREVDATACNF.fields_by_name['results'].message_type = _GETREVDATACNF_RESULT
+_WATCHADDREQ.fields_by_name['type'].enum_type = _WATCHADDREQ_TYPE
+_WATCHADDREQ_TYPE.containing_type = _WATCHADDREQ
+_WATCHREMREQ.fields_by_name['type'].enum_type = _WATCHREMREQ_TYPE
+_WATCHREMREQ_TYPE.containing_type = _WATCHREMREQ
+_WATCHMANYREQ.fields_by_name['add'].message_type = _WATCHADDREQ
+_WATCHMANYREQ.fields_by_name['rem'].message_type = _WATCHREMREQ
+_WATCHIND.fields_by_name['event'].enum_type = _WATCHIND_EVENT
+_WATCHIND.fields_by_name['type'].enum_type = _WATCHIND_TYPE
+_WATCHIND_EVENT.containing_type = _WATCHIND
+_WATCHIND_TYPE.containing_type = _WATCHIND
+_PROGRESSSTARTIND.fields_by_name['type'].enum_type = _PROGRESSSTARTIND_TYPE
+_PROGRESSSTARTIND_TYPE.containing_type = _PROGRESSSTARTIND
+_PROGRESSIND.fields_by_name['state'].enum_type = _PROGRESSIND_STATE
+_PROGRESSIND.fields_by_name['err_code'].enum_type = _ERRORCODE
+_PROGRESSIND_STATE.containing_type = _PROGRESSIND
+_PROGRESSQUERYCNF_ITEM.fields_by_name['item'].message_type = _PROGRESSSTARTIND
+_PROGRESSQUERYCNF_ITEM.fields_by_name['state'].message_type = _PROGRESSIND
+_PROGRESSQUERYCNF_ITEM.containing_type = _PROGRESSQUERYCNF
+_PROGRESSQUERYCNF.fields_by_name['items'].message_type = _PROGRESSQUERYCNF_ITEM
+_WALKPATHCNF_ITEM.containing_type = _WALKPATHCNF
+_WALKPATHCNF.fields_by_name['items'].message_type = _WALKPATHCNF_ITEM
+DESCRIPTOR.message_types_by_name['ErrorCnf'] = _ERRORCNF
+DESCRIPTOR.message_types_by_name['InitReq'] = _INITREQ
+DESCRIPTOR.message_types_by_name['InitCnf'] = _INITCNF
+DESCRIPTOR.message_types_by_name['EnumCnf'] = _ENUMCNF
+DESCRIPTOR.message_types_by_name['LookupDocReq'] = _LOOKUPDOCREQ
+DESCRIPTOR.message_types_by_name['LookupDocCnf'] = _LOOKUPDOCCNF
+DESCRIPTOR.message_types_by_name['LookupManyReq'] = _LOOKUPMANYREQ
+DESCRIPTOR.message_types_by_name['LookupManyCnf'] = _LOOKUPMANYCNF
+DESCRIPTOR.message_types_by_name['LookupRevReq'] = _LOOKUPREVREQ
+DESCRIPTOR.message_types_by_name['LookupRevCnf'] = _LOOKUPREVCNF
+DESCRIPTOR.message_types_by_name['StatReq'] = _STATREQ
+DESCRIPTOR.message_types_by_name['StatCnf'] = _STATCNF
+DESCRIPTOR.message_types_by_name['StatManyReq'] = _STATMANYREQ
+DESCRIPTOR.message_types_by_name['StatManyCnf'] = _STATMANYCNF
+DESCRIPTOR.message_types_by_name['GetLinksReq'] = _GETLINKSREQ
+DESCRIPTOR.message_types_by_name['GetLinksCnf'] = _GETLINKSCNF
+DESCRIPTOR.message_types_by_name['PeekReq'] = _PEEKREQ
+DESCRIPTOR.message_types_by_name['PeekCnf'] = _PEEKCNF
+DESCRIPTOR.message_types_by_name['CreateReq'] = _CREATEREQ
+DESCRIPTOR.message_types_by_name['CreateCnf'] = _CREATECNF
+DESCRIPTOR.message_types_by_name['ForkReq'] = _FORKREQ
+DESCRIPTOR.message_types_by_name['ForkCnf'] = _FORKCNF
+DESCRIPTOR.message_types_by_name['UpdateReq'] = _UPDATEREQ
+DESCRIPTOR.message_types_by_name['UpdateCnf'] = _UPDATECNF
+DESCRIPTOR.message_types_by_name['ResumeReq'] = _RESUMEREQ
+DESCRIPTOR.message_types_by_name['ResumeCnf'] = _RESUMECNF
+DESCRIPTOR.message_types_by_name['GetDataReq'] = _GETDATAREQ
+DESCRIPTOR.message_types_by_name['GetDataCnf'] = _GETDATACNF
+DESCRIPTOR.message_types_by_name['GetRevDataReq'] = _GETREVDATAREQ
+DESCRIPTOR.message_types_by_name['GetRevDataCnf'] = _GETREVDATACNF
+DESCRIPTOR.message_types_by_name['SetDataReq'] = _SETDATAREQ
+DESCRIPTOR.message_types_by_name['ReadReq'] = _READREQ
+DESCRIPTOR.message_types_by_name['ReadCnf'] = _READCNF
+DESCRIPTOR.message_types_by_name['TruncReq'] = _TRUNCREQ
+DESCRIPTOR.message_types_by_name['WriteBufferReq'] = _WRITEBUFFERREQ
+DESCRIPTOR.message_types_by_name['WriteCommitReq'] = _WRITECOMMITREQ
+DESCRIPTOR.message_types_by_name['FStatReq'] = _FSTATREQ
+DESCRIPTOR.message_types_by_name['SetFlagsReq'] = _SETFLAGSREQ
+DESCRIPTOR.message_types_by_name['SetTypeReq'] = _SETTYPEREQ
+DESCRIPTOR.message_types_by_name['SetMTimeReq'] = _SETMTIMEREQ
+DESCRIPTOR.message_types_by_name['MergeReq'] = _MERGEREQ
+DESCRIPTOR.message_types_by_name['RebaseReq'] = _REBASEREQ
+DESCRIPTOR.message_types_by_name['CommitReq'] = _COMMITREQ
+DESCRIPTOR.message_types_by_name['CommitCnf'] = _COMMITCNF
+DESCRIPTOR.message_types_by_name['SuspendReq'] = _SUSPENDREQ
+DESCRIPTOR.message_types_by_name['SuspendCnf'] = _SUSPENDCNF
+DESCRIPTOR.message_types_by_name['CloseReq'] = _CLOSEREQ
+DESCRIPTOR.message_types_by_name['WatchAddReq'] = _WATCHADDREQ
+DESCRIPTOR.message_types_by_name['WatchRemReq'] = _WATCHREMREQ
+DESCRIPTOR.message_types_by_name['WatchManyReq'] = _WATCHMANYREQ
+DESCRIPTOR.message_types_by_name['WatchProgressReq'] = _WATCHPROGRESSREQ
+DESCRIPTOR.message_types_by_name['ForgetReq'] = _FORGETREQ
+DESCRIPTOR.message_types_by_name['DeleteDocReq'] = _DELETEDOCREQ
+DESCRIPTOR.message_types_by_name['DeleteRevReq'] = _DELETEREVREQ
+DESCRIPTOR.message_types_by_name['ForwardDocReq'] = _FORWARDDOCREQ
+DESCRIPTOR.message_types_by_name['ReplicateDocReq'] = _REPLICATEDOCREQ
+DESCRIPTOR.message_types_by_name['ReplicateDocCnf'] = _REPLICATEDOCCNF
+DESCRIPTOR.message_types_by_name['ReplicateRevReq'] = _REPLICATEREVREQ
+DESCRIPTOR.message_types_by_name['ReplicateRevCnf'] = _REPLICATEREVCNF
+DESCRIPTOR.message_types_by_name['MountReq'] = _MOUNTREQ
+DESCRIPTOR.message_types_by_name['MountCnf'] = _MOUNTCNF
+DESCRIPTOR.message_types_by_name['UnmountReq'] = _UNMOUNTREQ
+DESCRIPTOR.message_types_by_name['GetPathReq'] = _GETPATHREQ
+DESCRIPTOR.message_types_by_name['GetPathCnf'] = _GETPATHCNF
+DESCRIPTOR.message_types_by_name['WatchInd'] = _WATCHIND
+DESCRIPTOR.message_types_by_name['ProgressStartInd'] = _PROGRESSSTARTIND
+DESCRIPTOR.message_types_by_name['ProgressStartReq'] = _PROGRESSSTARTREQ
+DESCRIPTOR.message_types_by_name['ProgressInd'] = _PROGRESSIND
+DESCRIPTOR.message_types_by_name['ProgressEndInd'] = _PROGRESSENDIND
+DESCRIPTOR.message_types_by_name['ProgressEndReq'] = _PROGRESSENDREQ
+DESCRIPTOR.message_types_by_name['ProgressQueryCnf'] = _PROGRESSQUERYCNF
+DESCRIPTOR.message_types_by_name['WalkPathReq'] = _WALKPATHREQ
+DESCRIPTOR.message_types_by_name['WalkPathCnf'] = _WALKPATHCNF
+DESCRIPTOR.enum_types_by_name['ErrorCode'] = _ERRORCODE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ErrorCnf = _reflection.GeneratedProtocolMessageType('ErrorCnf', (_message.Message,), {
+  'DESCRIPTOR' : _ERRORCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ErrorCnf)
+  })
+_sym_db.RegisterMessage(ErrorCnf)
+
+InitReq = _reflection.GeneratedProtocolMessageType('InitReq', (_message.Message,), {
+  'DESCRIPTOR' : _INITREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:InitReq)
+  })
+_sym_db.RegisterMessage(InitReq)
+
+InitCnf = _reflection.GeneratedProtocolMessageType('InitCnf', (_message.Message,), {
+  'DESCRIPTOR' : _INITCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:InitCnf)
+  })
+_sym_db.RegisterMessage(InitCnf)
+
+EnumCnf = _reflection.GeneratedProtocolMessageType('EnumCnf', (_message.Message,), {
+
+  'Store' : _reflection.GeneratedProtocolMessageType('Store', (_message.Message,), {
+    'DESCRIPTOR' : _ENUMCNF_STORE,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:EnumCnf.Store)
+    })
+  ,
+  'DESCRIPTOR' : _ENUMCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:EnumCnf)
+  })
+_sym_db.RegisterMessage(EnumCnf)
+_sym_db.RegisterMessage(EnumCnf.Store)
+
+LookupDocReq = _reflection.GeneratedProtocolMessageType('LookupDocReq', (_message.Message,), {
+  'DESCRIPTOR' : _LOOKUPDOCREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:LookupDocReq)
+  })
+_sym_db.RegisterMessage(LookupDocReq)
+
+LookupDocCnf = _reflection.GeneratedProtocolMessageType('LookupDocCnf', (_message.Message,), {
+
+  'RevMap' : _reflection.GeneratedProtocolMessageType('RevMap', (_message.Message,), {
+    'DESCRIPTOR' : _LOOKUPDOCCNF_REVMAP,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:LookupDocCnf.RevMap)
+    })
+  ,
+  'DESCRIPTOR' : _LOOKUPDOCCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:LookupDocCnf)
+  })
+_sym_db.RegisterMessage(LookupDocCnf)
+_sym_db.RegisterMessage(LookupDocCnf.RevMap)
+
+LookupManyReq = _reflection.GeneratedProtocolMessageType('LookupManyReq', (_message.Message,), {
+  'DESCRIPTOR' : _LOOKUPMANYREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:LookupManyReq)
+  })
+_sym_db.RegisterMessage(LookupManyReq)
+
+LookupManyCnf = _reflection.GeneratedProtocolMessageType('LookupManyCnf', (_message.Message,), {
+  'DESCRIPTOR' : _LOOKUPMANYCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:LookupManyCnf)
+  })
+_sym_db.RegisterMessage(LookupManyCnf)
+
+LookupRevReq = _reflection.GeneratedProtocolMessageType('LookupRevReq', (_message.Message,), {
+  'DESCRIPTOR' : _LOOKUPREVREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:LookupRevReq)
+  })
+_sym_db.RegisterMessage(LookupRevReq)
+
+LookupRevCnf = _reflection.GeneratedProtocolMessageType('LookupRevCnf', (_message.Message,), {
+  'DESCRIPTOR' : _LOOKUPREVCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:LookupRevCnf)
+  })
+_sym_db.RegisterMessage(LookupRevCnf)
+
+StatReq = _reflection.GeneratedProtocolMessageType('StatReq', (_message.Message,), {
+  'DESCRIPTOR' : _STATREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:StatReq)
+  })
+_sym_db.RegisterMessage(StatReq)
+
+StatCnf = _reflection.GeneratedProtocolMessageType('StatCnf', (_message.Message,), {
+
+  'Data' : _reflection.GeneratedProtocolMessageType('Data', (_message.Message,), {
+    'DESCRIPTOR' : _STATCNF_DATA,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:StatCnf.Data)
+    })
+  ,
+
+  'Attachment' : _reflection.GeneratedProtocolMessageType('Attachment', (_message.Message,), {
+    'DESCRIPTOR' : _STATCNF_ATTACHMENT,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:StatCnf.Attachment)
+    })
+  ,
+  'DESCRIPTOR' : _STATCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:StatCnf)
+  })
+_sym_db.RegisterMessage(StatCnf)
+_sym_db.RegisterMessage(StatCnf.Data)
+_sym_db.RegisterMessage(StatCnf.Attachment)
+
+StatManyReq = _reflection.GeneratedProtocolMessageType('StatManyReq', (_message.Message,), {
+  'DESCRIPTOR' : _STATMANYREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:StatManyReq)
+  })
+_sym_db.RegisterMessage(StatManyReq)
+
+StatManyCnf = _reflection.GeneratedProtocolMessageType('StatManyCnf', (_message.Message,), {
+
+  'Result' : _reflection.GeneratedProtocolMessageType('Result', (_message.Message,), {
+    'DESCRIPTOR' : _STATMANYCNF_RESULT,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:StatManyCnf.Result)
+    })
+  ,
+  'DESCRIPTOR' : _STATMANYCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:StatManyCnf)
+  })
+_sym_db.RegisterMessage(StatManyCnf)
+_sym_db.RegisterMessage(StatManyCnf.Result)
+
+GetLinksReq = _reflection.GeneratedProtocolMessageType('GetLinksReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETLINKSREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetLinksReq)
+  })
+_sym_db.RegisterMessage(GetLinksReq)
+
+GetLinksCnf = _reflection.GeneratedProtocolMessageType('GetLinksCnf', (_message.Message,), {
+  'DESCRIPTOR' : _GETLINKSCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetLinksCnf)
+  })
+_sym_db.RegisterMessage(GetLinksCnf)
+
+PeekReq = _reflection.GeneratedProtocolMessageType('PeekReq', (_message.Message,), {
+  'DESCRIPTOR' : _PEEKREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:PeekReq)
+  })
+_sym_db.RegisterMessage(PeekReq)
+
+PeekCnf = _reflection.GeneratedProtocolMessageType('PeekCnf', (_message.Message,), {
+  'DESCRIPTOR' : _PEEKCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:PeekCnf)
+  })
+_sym_db.RegisterMessage(PeekCnf)
+
+CreateReq = _reflection.GeneratedProtocolMessageType('CreateReq', (_message.Message,), {
+  'DESCRIPTOR' : _CREATEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:CreateReq)
+  })
+_sym_db.RegisterMessage(CreateReq)
+
+CreateCnf = _reflection.GeneratedProtocolMessageType('CreateCnf', (_message.Message,), {
+  'DESCRIPTOR' : _CREATECNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:CreateCnf)
+  })
+_sym_db.RegisterMessage(CreateCnf)
+
+ForkReq = _reflection.GeneratedProtocolMessageType('ForkReq', (_message.Message,), {
+  'DESCRIPTOR' : _FORKREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ForkReq)
+  })
+_sym_db.RegisterMessage(ForkReq)
+
+ForkCnf = _reflection.GeneratedProtocolMessageType('ForkCnf', (_message.Message,), {
+  'DESCRIPTOR' : _FORKCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ForkCnf)
+  })
+_sym_db.RegisterMessage(ForkCnf)
+
+UpdateReq = _reflection.GeneratedProtocolMessageType('UpdateReq', (_message.Message,), {
+  'DESCRIPTOR' : _UPDATEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:UpdateReq)
+  })
+_sym_db.RegisterMessage(UpdateReq)
+
+UpdateCnf = _reflection.GeneratedProtocolMessageType('UpdateCnf', (_message.Message,), {
+  'DESCRIPTOR' : _UPDATECNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:UpdateCnf)
+  })
+_sym_db.RegisterMessage(UpdateCnf)
+
+ResumeReq = _reflection.GeneratedProtocolMessageType('ResumeReq', (_message.Message,), {
+  'DESCRIPTOR' : _RESUMEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ResumeReq)
+  })
+_sym_db.RegisterMessage(ResumeReq)
+
+ResumeCnf = _reflection.GeneratedProtocolMessageType('ResumeCnf', (_message.Message,), {
+  'DESCRIPTOR' : _RESUMECNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ResumeCnf)
+  })
+_sym_db.RegisterMessage(ResumeCnf)
+
+GetDataReq = _reflection.GeneratedProtocolMessageType('GetDataReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETDATAREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetDataReq)
+  })
+_sym_db.RegisterMessage(GetDataReq)
+
+GetDataCnf = _reflection.GeneratedProtocolMessageType('GetDataCnf', (_message.Message,), {
+  'DESCRIPTOR' : _GETDATACNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetDataCnf)
+  })
+_sym_db.RegisterMessage(GetDataCnf)
+
+GetRevDataReq = _reflection.GeneratedProtocolMessageType('GetRevDataReq', (_message.Message,), {
+
+  'Item' : _reflection.GeneratedProtocolMessageType('Item', (_message.Message,), {
+    'DESCRIPTOR' : _GETREVDATAREQ_ITEM,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:GetRevDataReq.Item)
+    })
+  ,
+  'DESCRIPTOR' : _GETREVDATAREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetRevDataReq)
+  })
+_sym_db.RegisterMessage(GetRevDataReq)
+_sym_db.RegisterMessage(GetRevDataReq.Item)
+
+GetRevDataCnf = _reflection.GeneratedProtocolMessageType('GetRevDataCnf', (_message.Message,), {
+
+  'Value' : _reflection.GeneratedProtocolMessageType('Value', (_message.Message,), {
+    'DESCRIPTOR' : _GETREVDATACNF_VALUE,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:GetRevDataCnf.Value)
+    })
+  ,
+
+  'Result' : _reflection.GeneratedProtocolMessageType('Result', (_message.Message,), {
+    'DESCRIPTOR' : _GETREVDATACNF_RESULT,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:GetRevDataCnf.Result)
+    })
+  ,
+  'DESCRIPTOR' : _GETREVDATACNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetRevDataCnf)
+  })
+_sym_db.RegisterMessage(GetRevDataCnf)
+_sym_db.RegisterMessage(GetRevDataCnf.Value)
+_sym_db.RegisterMessage(GetRevDataCnf.Result)
+
+SetDataReq = _reflection.GeneratedProtocolMessageType('SetDataReq', (_message.Message,), {
+  'DESCRIPTOR' : _SETDATAREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:SetDataReq)
+  })
+_sym_db.RegisterMessage(SetDataReq)
+
+ReadReq = _reflection.GeneratedProtocolMessageType('ReadReq', (_message.Message,), {
+  'DESCRIPTOR' : _READREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ReadReq)
+  })
+_sym_db.RegisterMessage(ReadReq)
+
+ReadCnf = _reflection.GeneratedProtocolMessageType('ReadCnf', (_message.Message,), {
+  'DESCRIPTOR' : _READCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ReadCnf)
+  })
+_sym_db.RegisterMessage(ReadCnf)
+
+TruncReq = _reflection.GeneratedProtocolMessageType('TruncReq', (_message.Message,), {
+  'DESCRIPTOR' : _TRUNCREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:TruncReq)
+  })
+_sym_db.RegisterMessage(TruncReq)
+
+WriteBufferReq = _reflection.GeneratedProtocolMessageType('WriteBufferReq', (_message.Message,), {
+  'DESCRIPTOR' : _WRITEBUFFERREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WriteBufferReq)
+  })
+_sym_db.RegisterMessage(WriteBufferReq)
+
+WriteCommitReq = _reflection.GeneratedProtocolMessageType('WriteCommitReq', (_message.Message,), {
+  'DESCRIPTOR' : _WRITECOMMITREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WriteCommitReq)
+  })
+_sym_db.RegisterMessage(WriteCommitReq)
+
+FStatReq = _reflection.GeneratedProtocolMessageType('FStatReq', (_message.Message,), {
+  'DESCRIPTOR' : _FSTATREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:FStatReq)
+  })
+_sym_db.RegisterMessage(FStatReq)
+
+SetFlagsReq = _reflection.GeneratedProtocolMessageType('SetFlagsReq', (_message.Message,), {
+  'DESCRIPTOR' : _SETFLAGSREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:SetFlagsReq)
+  })
+_sym_db.RegisterMessage(SetFlagsReq)
+
+SetTypeReq = _reflection.GeneratedProtocolMessageType('SetTypeReq', (_message.Message,), {
+  'DESCRIPTOR' : _SETTYPEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:SetTypeReq)
+  })
+_sym_db.RegisterMessage(SetTypeReq)
+
+SetMTimeReq = _reflection.GeneratedProtocolMessageType('SetMTimeReq', (_message.Message,), {
+  'DESCRIPTOR' : _SETMTIMEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:SetMTimeReq)
+  })
+_sym_db.RegisterMessage(SetMTimeReq)
+
+MergeReq = _reflection.GeneratedProtocolMessageType('MergeReq', (_message.Message,), {
+  'DESCRIPTOR' : _MERGEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:MergeReq)
+  })
+_sym_db.RegisterMessage(MergeReq)
+
+RebaseReq = _reflection.GeneratedProtocolMessageType('RebaseReq', (_message.Message,), {
+  'DESCRIPTOR' : _REBASEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:RebaseReq)
+  })
+_sym_db.RegisterMessage(RebaseReq)
+
+CommitReq = _reflection.GeneratedProtocolMessageType('CommitReq', (_message.Message,), {
+  'DESCRIPTOR' : _COMMITREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:CommitReq)
+  })
+_sym_db.RegisterMessage(CommitReq)
+
+CommitCnf = _reflection.GeneratedProtocolMessageType('CommitCnf', (_message.Message,), {
+  'DESCRIPTOR' : _COMMITCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:CommitCnf)
+  })
+_sym_db.RegisterMessage(CommitCnf)
+
+SuspendReq = _reflection.GeneratedProtocolMessageType('SuspendReq', (_message.Message,), {
+  'DESCRIPTOR' : _SUSPENDREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:SuspendReq)
+  })
+_sym_db.RegisterMessage(SuspendReq)
+
+SuspendCnf = _reflection.GeneratedProtocolMessageType('SuspendCnf', (_message.Message,), {
+  'DESCRIPTOR' : _SUSPENDCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:SuspendCnf)
+  })
+_sym_db.RegisterMessage(SuspendCnf)
+
+CloseReq = _reflection.GeneratedProtocolMessageType('CloseReq', (_message.Message,), {
+  'DESCRIPTOR' : _CLOSEREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:CloseReq)
+  })
+_sym_db.RegisterMessage(CloseReq)
+
+WatchAddReq = _reflection.GeneratedProtocolMessageType('WatchAddReq', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHADDREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WatchAddReq)
+  })
+_sym_db.RegisterMessage(WatchAddReq)
+
+WatchRemReq = _reflection.GeneratedProtocolMessageType('WatchRemReq', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHREMREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WatchRemReq)
+  })
+_sym_db.RegisterMessage(WatchRemReq)
+
+WatchManyReq = _reflection.GeneratedProtocolMessageType('WatchManyReq', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHMANYREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WatchManyReq)
+  })
+_sym_db.RegisterMessage(WatchManyReq)
+
+WatchProgressReq = _reflection.GeneratedProtocolMessageType('WatchProgressReq', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHPROGRESSREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WatchProgressReq)
+  })
+_sym_db.RegisterMessage(WatchProgressReq)
+
+ForgetReq = _reflection.GeneratedProtocolMessageType('ForgetReq', (_message.Message,), {
+  'DESCRIPTOR' : _FORGETREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ForgetReq)
+  })
+_sym_db.RegisterMessage(ForgetReq)
+
+DeleteDocReq = _reflection.GeneratedProtocolMessageType('DeleteDocReq', (_message.Message,), {
+  'DESCRIPTOR' : _DELETEDOCREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:DeleteDocReq)
+  })
+_sym_db.RegisterMessage(DeleteDocReq)
+
+DeleteRevReq = _reflection.GeneratedProtocolMessageType('DeleteRevReq', (_message.Message,), {
+  'DESCRIPTOR' : _DELETEREVREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:DeleteRevReq)
+  })
+_sym_db.RegisterMessage(DeleteRevReq)
+
+ForwardDocReq = _reflection.GeneratedProtocolMessageType('ForwardDocReq', (_message.Message,), {
+  'DESCRIPTOR' : _FORWARDDOCREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ForwardDocReq)
+  })
+_sym_db.RegisterMessage(ForwardDocReq)
+
+ReplicateDocReq = _reflection.GeneratedProtocolMessageType('ReplicateDocReq', (_message.Message,), {
+  'DESCRIPTOR' : _REPLICATEDOCREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ReplicateDocReq)
+  })
+_sym_db.RegisterMessage(ReplicateDocReq)
+
+ReplicateDocCnf = _reflection.GeneratedProtocolMessageType('ReplicateDocCnf', (_message.Message,), {
+  'DESCRIPTOR' : _REPLICATEDOCCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ReplicateDocCnf)
+  })
+_sym_db.RegisterMessage(ReplicateDocCnf)
+
+ReplicateRevReq = _reflection.GeneratedProtocolMessageType('ReplicateRevReq', (_message.Message,), {
+  'DESCRIPTOR' : _REPLICATEREVREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ReplicateRevReq)
+  })
+_sym_db.RegisterMessage(ReplicateRevReq)
+
+ReplicateRevCnf = _reflection.GeneratedProtocolMessageType('ReplicateRevCnf', (_message.Message,), {
+  'DESCRIPTOR' : _REPLICATEREVCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ReplicateRevCnf)
+  })
+_sym_db.RegisterMessage(ReplicateRevCnf)
+
+MountReq = _reflection.GeneratedProtocolMessageType('MountReq', (_message.Message,), {
+  'DESCRIPTOR' : _MOUNTREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:MountReq)
+  })
+_sym_db.RegisterMessage(MountReq)
+
+MountCnf = _reflection.GeneratedProtocolMessageType('MountCnf', (_message.Message,), {
+  'DESCRIPTOR' : _MOUNTCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:MountCnf)
+  })
+_sym_db.RegisterMessage(MountCnf)
+
+UnmountReq = _reflection.GeneratedProtocolMessageType('UnmountReq', (_message.Message,), {
+  'DESCRIPTOR' : _UNMOUNTREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:UnmountReq)
+  })
+_sym_db.RegisterMessage(UnmountReq)
+
+GetPathReq = _reflection.GeneratedProtocolMessageType('GetPathReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETPATHREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetPathReq)
+  })
+_sym_db.RegisterMessage(GetPathReq)
+
+GetPathCnf = _reflection.GeneratedProtocolMessageType('GetPathCnf', (_message.Message,), {
+  'DESCRIPTOR' : _GETPATHCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:GetPathCnf)
+  })
+_sym_db.RegisterMessage(GetPathCnf)
+
+WatchInd = _reflection.GeneratedProtocolMessageType('WatchInd', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHIND,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WatchInd)
+  })
+_sym_db.RegisterMessage(WatchInd)
+
+ProgressStartInd = _reflection.GeneratedProtocolMessageType('ProgressStartInd', (_message.Message,), {
+  'DESCRIPTOR' : _PROGRESSSTARTIND,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ProgressStartInd)
+  })
+_sym_db.RegisterMessage(ProgressStartInd)
+
+ProgressStartReq = _reflection.GeneratedProtocolMessageType('ProgressStartReq', (_message.Message,), {
+  'DESCRIPTOR' : _PROGRESSSTARTREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ProgressStartReq)
+  })
+_sym_db.RegisterMessage(ProgressStartReq)
+
+ProgressInd = _reflection.GeneratedProtocolMessageType('ProgressInd', (_message.Message,), {
+  'DESCRIPTOR' : _PROGRESSIND,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ProgressInd)
+  })
+_sym_db.RegisterMessage(ProgressInd)
+
+ProgressEndInd = _reflection.GeneratedProtocolMessageType('ProgressEndInd', (_message.Message,), {
+  'DESCRIPTOR' : _PROGRESSENDIND,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ProgressEndInd)
+  })
+_sym_db.RegisterMessage(ProgressEndInd)
+
+ProgressEndReq = _reflection.GeneratedProtocolMessageType('ProgressEndReq', (_message.Message,), {
+  'DESCRIPTOR' : _PROGRESSENDREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ProgressEndReq)
+  })
+_sym_db.RegisterMessage(ProgressEndReq)
+
+ProgressQueryCnf = _reflection.GeneratedProtocolMessageType('ProgressQueryCnf', (_message.Message,), {
+
+  'Item' : _reflection.GeneratedProtocolMessageType('Item', (_message.Message,), {
+    'DESCRIPTOR' : _PROGRESSQUERYCNF_ITEM,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:ProgressQueryCnf.Item)
+    })
+  ,
+  'DESCRIPTOR' : _PROGRESSQUERYCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:ProgressQueryCnf)
+  })
+_sym_db.RegisterMessage(ProgressQueryCnf)
+_sym_db.RegisterMessage(ProgressQueryCnf.Item)
+
+WalkPathReq = _reflection.GeneratedProtocolMessageType('WalkPathReq', (_message.Message,), {
+  'DESCRIPTOR' : _WALKPATHREQ,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WalkPathReq)
+  })
+_sym_db.RegisterMessage(WalkPathReq)
+
+WalkPathCnf = _reflection.GeneratedProtocolMessageType('WalkPathCnf', (_message.Message,), {
+
+  'Item' : _reflection.GeneratedProtocolMessageType('Item', (_message.Message,), {
+    'DESCRIPTOR' : _WALKPATHCNF_ITEM,
+    '__module__' : 'peerdrive_client_pb2'
+    # @@protoc_insertion_point(class_scope:WalkPathCnf.Item)
+    })
+  ,
+  'DESCRIPTOR' : _WALKPATHCNF,
+  '__module__' : 'peerdrive_client_pb2'
+  # @@protoc_insertion_point(class_scope:WalkPathCnf)
+  })
+_sym_db.RegisterMessage(WalkPathCnf)
+_sym_db.RegisterMessage(WalkPathCnf.Item)
+
+
+# @@protoc_insertion_point(module_scope)
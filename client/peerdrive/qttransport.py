@@ -0,0 +1,76 @@
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from __future__ import absolute_import
+
+from PyQt4 import QtCore, QtNetwork
+
+class QtTransport(QtCore.QObject):
+	"""Transport based on QTcpSocket.
+
+	Incoming data is processed from the Qt event loop as soon as it arrives.
+	Deferred work is delivered through a queued signal.
+	"""
+
+	deferredReady = QtCore.pyqtSignal()
+
+	def __init__(self, host, port, received, deferred):
+		super(QtTransport, self).__init__()
+		self.__received = received
+		self.__socket = QtNetwork.QTcpSocket()
+		self.__socket.readyRead.connect(self.__readReady)
+		self.__socket.connectToHost(host, port)
+		if not self.__socket.waitForConnected(1000):
+			raise IOError("Could not connect to server!")
+		self.__socket.setSocketOption(QtNetwork.QAbstractSocket.LowDelayOption, 1)
+		self.deferredReady.connect(deferred, QtCore.Qt.QueuedConnection)
+
+	def send(self, data):
+		if self.__socket.write(data) == -1:
+			raise IOError("Could not send request to server: "
+				+ str(self.__socket.errorString()))
+
+	def wait(self, timeout):
+		if self.__socket.waitForReadyRead(timeout):
+			self.__readReady()
+			return True
+		else:
+			return False
+
+	def flush(self):
+		while self.__socket.flush():
+			self.__socket.waitForBytesWritten(10000)
+
+	def defer(self, delay=0):
+		if delay > 0:
+			QtCore.QTimer.singleShot(int(delay * 1000) + 1, self.deferredReady.emit)
+		else:
+			self.deferredReady.emit()
+
+	def close(self):
+		self.__socket.disconnectFromHost()
+
+	def errorString(self):
+		return str(self.__socket.errorString())
+
+	def __readReady(self):
+		data = str(self.__socket.readAll())
+		if data:
+			self.__received(data)
+
@@ -0,0 +1,207 @@
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import
+
+import struct, time, threading
+
+# Recording of the raw traffic between a connector and the server.
+#
+# A recording starts with MAGIC and is followed by one record for every packet
+# that was sent and for every chunk of data that was received:
+#
+#	kind:8 (SENT or RECEIVED), timestamp:float64, length:32, data
+#
+# Sent packets are complete frames. Received chunks are recorded exactly as
+# the transport delivered them and may contain partial frames.
+
+MAGIC = 'PDREC1\n'
+SENT = 0
+RECEIVED = 1
+
+_record = struct.Struct('>BdL')
+_frame = struct.Struct('>HLH')
+_IND_REF = 0xffffffff
+
+
+class Recorder(object):
+	"""Write the traffic of a connector into the file object 'f'.
+
+	See _Connector.record(). The file is not closed by the recorder.
+	"""
+
+	def __init__(self, f):
+		self.__file = f
+		self.__lock = threading.Lock()
+		f.write(MAGIC)
+
+	def sent(self, data):
+		self.__write(SENT, data)
+
+	def received(self, data):
+		self.__write(RECEIVED, data)
+
+	def flush(self):
+		with self.__lock:
+			self.__file.flush()
+
+	def __write(self, kind, data):
+		with self.__lock:
+			self.__file.write(_record.pack(kind, time.time(), len(data)))
+			self.__file.write(data)
+
+
+def load(f):
+	"""Read a recording and return a list of (kind, timestamp, data)."""
+	if f.read(len(MAGIC)) != MAGIC:
+		raise IOError('Not a traffic recording')
+	records = []
+	while True:
+		header = f.read(_record.size)
+		if not header:
+			break
+		if len(header) < _record.size:
+			raise IOError('Truncated traffic recording')
+		(kind, timestamp, length) = _record.unpack(header)
+		data = f.read(length)
+		if len(data) < length:
+			raise IOError('Truncated traffic recording')
+		records.append((kind, timestamp, data))
+	return records
+
+
+def frames(records):
+	"""Split a recording into (kind, ref, msg, flags, body) tuples.
+
+	The received chunks are joined and cut into complete frames. 'msg' is the
+	message type without the flags.
+	"""
+	result = []
+	buf = ''
+	for (kind, timestamp, data) in records:
+		if kind == SENT:
+			(length, ref, msg) = _frame.unpack_from(data)
+			result.append((SENT, ref, msg >> 4, msg & 3, data[8:]))
+		else:
+			buf += data
+			pos = 0
+			while len(buf) - pos >= 8:
+				(length, ref, msg) = _frame.unpack_from(buf, pos)
+				end = pos + length + 2
+				if end > len(buf):
+					break
+				result.append((RECEIVED, ref, msg >> 4, msg & 3, buf[pos+8:end]))
+				pos = end
+			buf = buf[pos:]
+	return result
+
+
+class ReplayTransport(object):
+	"""Transport that answers a connector from a recording.
+
+	The recorded requests must be sent again in the same order. For every
+	request the transport delivers the frames which the server sent after it
+	in the recording, up to the next recorded request. References of the
+	confirmations are translated so the replay may start with any reference.
+	Nothing is delayed, so the traffic is processed at full speed.
+
+	Create it with bind() and pass the result as the transport of a
+	_Connector. The most recently created instance is available as
+	ReplayTransport.last. Requests which do not match the recording are
+	answered with an empty confirmation and counted in 'mismatches'. The
+	same happens to all requests while 'synthetic' is set, which allows to
+	set up watches and progress handlers before the replay.
+	"""
+
+	last = None
+
+	def __init__(self, host, port, received, deferred, frames):
+		self.__received = received
+		self.__frames = frames
+		self.__pos = 0
+		self.__refs = {}
+		self.synthetic = False
+		self.mismatches = 0
+		self.__skipOrphans()
+		ReplayTransport.last = self
+
+	@staticmethod
+	def bind(frames):
+		return lambda host, port, received, deferred: ReplayTransport(host,
+			port, received, deferred, frames)
+
+	def done(self):
+		return self.__pos >= len(self.__frames)
+
+	def send(self, data):
+		from .connector import _Connector
+		from . import peerdrive_client_pb2 as pb
+
+		(length, ref, msg) = _frame.unpack_from(data)
+		msg = msg >> 4
+		frames = self.__frames
+		if (not self.synthetic and self.__pos < len(frames) and
+				frames[self.__pos][2] == msg):
+			self.__refs[frames[self.__pos][1]] = ref
+			self.__pos += 1
+		else:
+			if msg == _Connector.INIT_MSG:
+				reply = pb.InitCnf(major=2, minor=0,
+					max_packet_size=0x1000).SerializeToString()
+			else:
+				self.mismatches += 1
+				reply = ''
+			self.__deliver([ (ref, msg, _Connector.FLAG_CNF, reply) ])
+			return
+
+		pending = []
+		while self.__pos < len(frames) and frames[self.__pos][0] == RECEIVED:
+			(kind, oldRef, msg, flags, body) = frames[self.__pos]
+			self.__pos += 1
+			if oldRef == _IND_REF:
+				pending.append((oldRef, msg, flags, body))
+			elif oldRef in self.__refs:
+				pending.append((self.__refs.pop(oldRef), msg, flags, body))
+		self.__deliver(pending)
+
+	def wait(self, timeout):
+		return False
+
+	def flush(self):
+		pass
+
+	def defer(self, delay=0):
+		# process() dispatches everything which is left over
+		pass
+
+	def close(self):
+		pass
+
+	def errorString(self):
+		return 'End of recording'
+
+	def __skipOrphans(self):
+		# A recording which was started in the middle of a session may begin
+		# with confirmations of requests that were never recorded.
+		while self.__pos < len(self.__frames) and self.__frames[self.__pos][0] == RECEIVED:
+			self.__pos += 1
+
+	def __deliver(self, pending):
+		if pending:
+			self.__received(''.join([ _frame.pack(len(body) + 6, ref,
+				(msg << 4) | flags) + body for (ref, msg, flags, body) in pending ]))
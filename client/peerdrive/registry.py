@@ -36,8 +36,8 @@ class _Registry(connector.Watch):
 
 	def loadRegistry(self):
 		self.__regLink.update()
-		with self.connection.peek(self.__regLink.store(), self.__regLink.rev()) as r:
-			self.registry = r.getData('/org.peerdrive.registry')
+		[self.registry] = self.connection.getRevData(self.__regLink.store(),
+			self.__regLink.rev(), ['/org.peerdrive.registry'])
 
 	def triggered(self, event, store):
 		if event == connector.Watch.EVENT_MODIFIED:
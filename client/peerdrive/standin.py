@@ -0,0 +1,938 @@
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import
+
+import sys, os, os.path, socket, struct, threading, time, hashlib, random
+import cPickle, Queue, optparse
+from . import peerdrive_client_pb2 as pb
+from .connector import _Connector, loadPDSD, dumpPDSD, DocLink, RevLink
+
+# Stand-in for the PeerDrive daemon, written in Python.
+#
+# It speaks the client protocol over a local TCP socket. This is enough to
+# run the client library, benchmarks and tests without the Erlang server and
+# without mounted stores:
+#
+#	server = standin.Server(['user'], latency=0.005)
+#	server.start()
+#	Connector(server.address())
+#
+# To run it on its own, start it as a module from the client directory,
+# which prints the address for the PEERDRIVE environment variable:
+#
+#	python -m peerdrive.standin --latency 5 user
+#
+# The stores live in memory or, if a directory is given, are persisted there.
+# Only the core of the protocol is implemented: INIT, ENUM, LOOKUP, STAT,
+# GET_LINKS, PEEK, CREATE, FORK, UPDATE, GET/SET_DATA, GET_REV_DATA, READ,
+# WRITE, TRUNC, FSTAT, SET_FLAGS, SET_TYPE, COMMIT, CLOSE, DELETE_DOC,
+# WALK_PATH and watches. Everything else is answered with ENOSYS. There is
+# no merging, no replication and no garbage collection.
+
+_header = struct.Struct('>HLH')
+_IND_REF = 0xffffffff
+
+FLAG_STICKY = 1 << 0
+
+WATCH_MODIFIED = pb.WatchInd.modified
+WATCH_APPEARED = pb.WatchInd.appeared
+WATCH_DISAPPEARED = pb.WatchInd.disappeared
+
+
+class _Error(Exception):
+	def __init__(self, code):
+		super(_Error, self).__init__(code)
+		self.code = code
+
+
+def _now():
+	return int(time.time() * 1000000)
+
+def _hash(data):
+	return hashlib.md5(data).digest()
+
+
+class Revision(object):
+	"""Immutable revision. Parts are stored by their hash in the Store."""
+
+	def __init__(self, flags, data, attachments, parents, crtime, mtime,
+	             typ, creator, comment):
+		self.flags = flags
+		self.data = data               # hash of the PDSD part
+		self.attachments = attachments # name -> (hash, crtime, mtime)
+		self.parents = parents
+		self.crtime = crtime
+		self.mtime = mtime
+		self.type = typ
+		self.creator = creator
+		self.comment = comment
+
+	def rid(self):
+		return _hash(repr((self.flags, self.data, sorted(self.attachments.items()),
+			self.parents, self.crtime, self.mtime, self.type, self.creator,
+			self.comment)))
+
+
+class Store(object):
+	"""Documents, revisions and parts of one store.
+
+	If 'path' is given the store is loaded from and written to this
+	directory. Otherwise it only lives in memory. Commits and deletions are
+	appended to a journal, which is folded into the snapshot on the next
+	load, so that a commit does not write the whole store again.
+	"""
+
+	def __init__(self, label, path=None):
+		self.label = label
+		self.path = path
+		self.sid = None
+		self.docs = {}  # doc -> rev
+		self.revs = {}  # rev -> Revision
+		self.parts = {} # hash -> data
+		if path and os.path.exists(os.path.join(path, 'store.pickle')):
+			with open(os.path.join(path, 'store.pickle'), 'rb') as f:
+				(self.sid, self.docs, self.revs, self.parts) = cPickle.load(f)
+			journal = os.path.join(path, 'store.journal')
+			if os.path.exists(journal):
+				with open(journal, 'rb') as f:
+					self.__replay(f)
+				self.save()
+		else:
+			self.sid = os.urandom(16)
+			self.__createRoot()
+			self.save()
+
+	def __createRoot(self):
+		data = dumpPDSD({
+			u'org.peerdrive.folder' : [],
+			u'org.peerdrive.annotation' : { u'title' : unicode(self.label) }
+		})
+		now = _now()
+		rev = Revision(FLAG_STICKY, self.putPart(data), {}, [], now, now,
+			'org.peerdrive.store', 'org.peerdrive.standin', '')
+		rid = rev.rid()
+		self.revs[rid] = rev
+		self.docs[self.sid] = rid
+
+	def putPart(self, data):
+		h = _hash(data)
+		self.parts[h] = data
+		return h
+
+	def save(self):
+		if not self.path:
+			return
+		if not os.path.isdir(self.path):
+			os.makedirs(self.path)
+		name = os.path.join(self.path, 'store.pickle')
+		with open(name + '.tmp', 'wb') as f:
+			cPickle.dump((self.sid, self.docs, self.revs, self.parts), f,
+				cPickle.HIGHEST_PROTOCOL)
+		os.rename(name + '.tmp', name)
+		# replaying the journal again would be harmless if we stop here
+		journal = os.path.join(self.path, 'store.journal')
+		if os.path.exists(journal):
+			os.remove(journal)
+
+	def commit(self, doc, rev):
+		rid = rev.rid()
+		self.revs[rid] = rev
+		self.docs[doc] = rid
+		parts = [rev.data] + [ h for (h, crtime, mtime) in rev.attachments.values() ]
+		self.__log(('commit', doc, rid, rev,
+			dict((h, self.parts[h]) for h in parts)))
+		return rid
+
+	def deleteDoc(self, doc):
+		del self.docs[doc]
+		self.__log(('delete', doc))
+
+	def __log(self, record):
+		if not self.path:
+			return
+		with open(os.path.join(self.path, 'store.journal'), 'ab') as f:
+			cPickle.dump(record, f, cPickle.HIGHEST_PROTOCOL)
+
+	def __replay(self, f):
+		while True:
+			try:
+				record = cPickle.load(f)
+			except (EOFError, cPickle.UnpicklingError):
+				# end of the journal or a record which was cut off
+				break
+			if record[0] == 'commit':
+				(op, doc, rid, rev, parts) = record
+				self.parts.update(parts)
+				self.revs[rid] = rev
+				self.docs[doc] = rid
+			else:
+				self.docs.pop(record[1], None)
+
+
+class _Handle(object):
+	"""Open document or revision of a connection."""
+
+	def __init__(self, store, doc, rev, readonly, creator=None):
+		self.store = store
+		self.doc = doc
+		self.rev = rev
+		self.readonly = readonly
+		self.buffers = {}
+		if rev:
+			r = store.revs[rev]
+			self.flags = r.flags
+			self.data = store.parts[r.data]
+			self.attachments = dict((name, (bytearray(store.parts[h]), crtime,
+				mtime)) for (name, (h, crtime, mtime)) in r.attachments.items())
+			self.parents = [rev]
+			self.crtime = r.crtime
+			self.type = r.type
+			self.creator = creator or r.creator
+		else:
+			self.flags = 0
+			self.data = dumpPDSD({})
+			self.attachments = {}
+			self.parents = []
+			self.crtime = _now()
+			self.type = ''
+			self.creator = creator
+
+	def getPart(self, part):
+		if part in self.attachments:
+			return self.attachments[part][0]
+		raise _Error(pb.enoent)
+
+	def writePart(self, part, offset, data):
+		self.__checkWritable()
+		if part not in self.attachments:
+			now = _now()
+			self.attachments[part] = (bytearray(), now, now)
+		(content, crtime, mtime) = self.attachments[part]
+		if offset > len(content):
+			content.extend('\0' * (offset - len(content)))
+		content[offset:offset+len(data)] = data
+		self.attachments[part] = (content, crtime, _now())
+
+	def truncPart(self, part, offset):
+		self.__checkWritable()
+		if part not in self.attachments:
+			now = _now()
+			self.attachments[part] = (bytearray(), now, now)
+		(content, crtime, mtime) = self.attachments[part]
+		if offset > len(content):
+			content.extend('\0' * (offset - len(content)))
+		else:
+			del content[offset:]
+		self.attachments[part] = (content, crtime, _now())
+
+	def setData(self, selector, data):
+		self.__checkWritable()
+		self.data = _update(self.store.sid, self.data, selector, data)
+
+	def revision(self, comment=''):
+		store = self.store
+		attachments = dict((name, (store.putPart(str(content)), crtime, mtime))
+			for (name, (content, crtime, mtime)) in self.attachments.items())
+		return Revision(self.flags, store.putPart(self.data), attachments,
+			self.parents[:], self.crtime, _now(), self.type, self.creator,
+			comment)
+
+	def stat(self):
+		# like _stat() but without storing the parts
+		cnf = pb.StatCnf()
+		cnf.flags = self.flags
+		cnf.data.size = len(self.data)
+		cnf.data.hash = _hash(self.data)
+		for (name, (content, crtime, mtime)) in sorted(self.attachments.items()):
+			a = cnf.attachments.add()
+			a.name = name
+			a.size = len(content)
+			a.hash = _hash(str(content))
+			a.crtime = crtime
+			a.mtime = mtime
+		cnf.parents.extend(self.parents)
+		cnf.crtime = self.crtime
+		cnf.mtime = _now()
+		cnf.type_code = self.type
+		cnf.creator_code = self.creator
+		return cnf
+
+	def __checkWritable(self):
+		if self.readonly:
+			raise _Error(pb.ebadf)
+
+
+def _stat(store, rev, cnf=None):
+	if cnf is None:
+		cnf = pb.StatCnf()
+	cnf.flags = rev.flags
+	cnf.data.hash = rev.data
+	cnf.data.size = len(store.parts[rev.data])
+	for (name, (h, crtime, mtime)) in sorted(rev.attachments.items()):
+		a = cnf.attachments.add()
+		a.name = name
+		a.size = len(store.parts[h])
+		a.hash = h
+		a.crtime = crtime
+		a.mtime = mtime
+	cnf.parents.extend(rev.parents)
+	cnf.crtime = rev.crtime
+	cnf.mtime = rev.mtime
+	cnf.type_code = rev.type
+	cnf.creator_code = rev.creator
+	cnf.comment = rev.comment
+	return cnf
+
+
+def _parseSelector(selector):
+	# '/key#3/other' -> [u'key', 3, u'other'], '#+' appends to a list
+	ops = []
+	selector = selector.decode('utf-8') if isinstance(selector, str) else selector
+	i = 0
+	while i < len(selector):
+		op = selector[i]
+		j = i + 1
+		while j < len(selector) and selector[j] not in u'/#':
+			j += 1
+		spec = selector[i+1:j]
+		if op == u'/':
+			ops.append(spec)
+		elif op == u'#' and spec == u'+':
+			ops.append(None)
+		elif op == u'#':
+			try:
+				ops.append(int(spec))
+			except ValueError:
+				raise _Error(pb.einval)
+		else:
+			raise _Error(pb.einval)
+		i = j
+	return ops
+
+def _extract(store, data, selector):
+	if not selector:
+		return data
+	value = loadPDSD(store, data)
+	for op in _parseSelector(selector):
+		if isinstance(op, int) and isinstance(value, list):
+			if op >= len(value):
+				raise _Error(pb.einval)
+			value = value[op]
+		elif isinstance(op, unicode) and isinstance(value, dict):
+			if op not in value:
+				raise _Error(pb.enoent)
+			value = value[op]
+		else:
+			raise _Error(pb.einval)
+	return dumpPDSD(value)
+
+def _update(store, data, selector, update):
+	if not selector:
+		return update
+
+	def step(value, ops):
+		if not ops:
+			return loadPDSD(store, update)
+		(op, rest) = (ops[0], ops[1:])
+		if rest and isinstance(rest[0], unicode):
+			empty = {}
+		else:
+			empty = []
+		if isinstance(op, int) and isinstance(value, list):
+			if op >= len(value):
+				raise _Error(pb.enoent)
+			value[op] = step(value[op], rest)
+		elif isinstance(op, unicode) and isinstance(value, dict):
+			value[op] = step(value.get(op, empty), rest)
+		elif op is None and isinstance(value, list):
+			value.append(step(empty, rest))
+		else:
+			raise _Error(pb.einval)
+		return value
+
+	return dumpPDSD(step(loadPDSD(store, data), _parseSelector(selector)))
+
+def _links(store, data):
+	docs = set()
+	revs = set()
+	todo = [loadPDSD(store, data)]
+	while todo:
+		value = todo.pop()
+		if isinstance(value, dict):
+			todo.extend(value.values())
+		elif isinstance(value, list):
+			todo.extend(value)
+		elif isinstance(value, DocLink):
+			docs.add(value.doc())
+		elif isinstance(value, RevLink):
+			revs.add(value.rev())
+	return (docs, revs)
+
+
+class Server(object):
+	"""PeerDrive protocol server with one system store and regular stores.
+
+	'stores' is a list of labels of the regular stores. With 'path' all
+	stores are persisted in sub-directories named by their label. Every
+	confirmation and indication is delayed by 'latency' seconds plus a
+	random 'jitter'. Delaying does not block the processing of further
+	requests, just like the real server.
+	"""
+
+	def __init__(self, stores=['user'], path=None, latency=0.0, jitter=0.0,
+	             port=0):
+		def mkStore(label):
+			return Store(label, os.path.join(path, label) if path else None)
+		self.latency = latency
+		self.jitter = jitter
+		self.cookie = os.urandom(8)
+		self.sysStore = mkStore('sys')
+		self.stores = [ mkStore(label) for label in stores ]
+		self.requests = 0
+		self.__lock = threading.RLock()
+		self.__connections = []
+		self.__socket = socket.socket()
+		self.__socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+		self.__socket.bind(('127.0.0.1', port))
+		self.__socket.listen(5)
+		self.__thread = None
+
+	def address(self):
+		return 'tcp://127.0.0.1:%d/%s' % (self.__socket.getsockname()[1],
+			self.cookie.encode('hex'))
+
+	def start(self):
+		self.__thread = threading.Thread(target=self.serve)
+		self.__thread.daemon = True
+		self.__thread.start()
+		return self
+
+	def serve(self):
+		while True:
+			try:
+				(sock, addr) = self.__socket.accept()
+			except socket.error:
+				return
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+			conn = _Connection(self, sock)
+			with self.__lock:
+				self.__connections.append(conn)
+			conn.start()
+
+	def stop(self):
+		self.__socket.close()
+		with self.__lock:
+			connections = self.__connections[:]
+		for conn in connections:
+			conn.close()
+		# let the threads finish before the interpreter tears down their modules
+		for conn in connections:
+			conn.join(1.0)
+
+	def allStores(self):
+		return [self.sysStore] + self.stores
+
+	def getStore(self, sid):
+		for store in self.allStores():
+			if store.sid == sid:
+				return store
+		raise _Error(pb.enoent)
+
+	def selectStores(self, sids):
+		if sids:
+			return [ self.getStore(sid) for sid in sids ]
+		else:
+			return self.allStores()
+
+	def _lock(self):
+		return self.__lock
+
+	def _dropConnection(self, conn):
+		with self.__lock:
+			if conn in self.__connections:
+				self.__connections.remove(conn)
+
+	def notify(self, event, typ, store, element):
+		ind = pb.WatchInd(event=event, type=typ, store=store.sid,
+			element=element).SerializeToString()
+		with self.__lock:
+			connections = self.__connections[:]
+		for conn in connections:
+			conn.indicate(_Connector.WATCH_MSG, typ, element, ind)
+
+	def delay(self):
+		if self.jitter:
+			return self.latency + random.uniform(0, self.jitter)
+		else:
+			return self.latency
+
+
+class _Connection(object):
+	"""Client connection. Requests are handled in order by a reader thread,
+	replies are sent by a writer thread once their latency is over."""
+
+	def __init__(self, server, sock):
+		self.__server = server
+		self.__socket = sock
+		self.__outgoing = Queue.Queue()
+		self.__handles = {}
+		self.__nextHandle = 0
+		self.__watches = set()
+		self.__initialized = False
+		self.__threads = []
+		self.__dispatch = {
+			_Connector.INIT_MSG          : self.__init,
+			_Connector.ENUM_MSG          : self.__enum,
+			_Connector.LOOKUP_DOC_MSG    : self.__lookupDoc,
+			_Connector.LOOKUP_MANY_MSG   : self.__lookupMany,
+			_Connector.LOOKUP_REV_MSG    : self.__lookupRev,
+			_Connector.STAT_MSG          : self.__stat,
+			_Connector.STAT_MANY_MSG     : self.__statMany,
+			_Connector.GET_LINKS_MSG     : self.__getLinks,
+			_Connector.PEEK_MSG          : self.__peek,
+			_Connector.CREATE_MSG        : self.__create,
+			_Connector.FORK_MSG          : self.__fork,
+			_Connector.UPDATE_MSG        : self.__update,
+			_Connector.GET_DATA_MSG      : self.__getData,
+			_Connector.SET_DATA_MSG      : self.__setData,
+			_Connector.GET_REV_DATA_MSG  : self.__getRevData,
+			_Connector.READ_MSG          : self.__read,
+			_Connector.TRUNC_MSG         : self.__trunc,
+			_Connector.WRITE_BUFFER_MSG  : self.__writeBuffer,
+			_Connector.WRITE_COMMIT_MSG  : self.__writeCommit,
+			_Connector.FSTAT_MSG         : self.__fstat,
+			_Connector.SET_FLAGS_MSG     : self.__setFlags,
+			_Connector.SET_TYPE_MSG      : self.__setType,
+			_Connector.COMMIT_MSG        : self.__commit,
+			_Connector.CLOSE_MSG         : self.__close,
+			_Connector.DELETE_DOC_MSG    : self.__deleteDoc,
+			_Connector.WALK_PATH_MSG     : self.__walkPath,
+			_Connector.WATCH_ADD_MSG     : self.__watchAdd,
+			_Connector.WATCH_REM_MSG     : self.__watchRem,
+			_Connector.WATCH_MANY_MSG    : self.__watchMany,
+			_Connector.WATCH_PROGRESS_MSG: self.__ignore,
+			_Connector.PROGRESS_QUERY_MSG: self.__ignore,
+		}
+
+	def start(self):
+		for target in [self.__reader, self.__writer]:
+			thread = threading.Thread(target=target)
+			thread.daemon = True
+			thread.start()
+			self.__threads.append(thread)
+
+	def join(self, timeout=None):
+		for thread in self.__threads:
+			if thread is not threading.current_thread():
+				thread.join(timeout)
+
+	def close(self):
+		try:
+			self.__socket.shutdown(socket.SHUT_RDWR)
+		except socket.error:
+			pass
+		self.__socket.close()
+
+	def indicate(self, msg, typ, element, ind):
+		if (typ, element) in self.__watches:
+			self.__queue(_IND_REF, msg, _Connector.FLAG_IND, ind)
+
+	def __queue(self, ref, msg, flag, body):
+		packet = _header.pack(len(body) + 6, ref, (msg << 4) | flag) + body
+		self.__outgoing.put((time.time() + self.__server.delay(), packet))
+
+	def __reader(self):
+		buf = ''
+		try:
+			while True:
+				data = self.__socket.recv(0x10000)
+				if not data:
+					break
+				buf += data
+				pos = 0
+				while len(buf) - pos >= 8:
+					(length, ref, msg) = _header.unpack_from(buf, pos)
+					end = pos + length + 2
+					if end > len(buf):
+						break
+					self.__handle(ref, msg >> 4, buf[pos+8:end])
+					pos = end
+				buf = buf[pos:]
+		except socket.error:
+			pass
+		finally:
+			self.__outgoing.put(None)
+			self.__server._dropConnection(self)
+
+	def __writer(self):
+		while True:
+			item = self.__outgoing.get()
+			if item is None:
+				break
+			(due, packet) = item
+			wait = due - time.time()
+			if wait > 0:
+				time.sleep(wait)
+			try:
+				self.__socket.sendall(packet)
+			except socket.error:
+				break
+
+	def __handle(self, ref, msg, body):
+		server = self.__server
+		handler = self.__dispatch.get(msg)
+		try:
+			if not self.__initialized and msg != _Connector.INIT_MSG:
+				raise _Error(pb.einit)
+			if handler is None:
+				raise _Error(pb.enosys)
+			with server._lock():
+				server.requests += 1
+				reply = handler(body)
+			# like the server, which cannot frame bigger packets
+			if len(reply) > _Connector.MAX_REPLY_SIZE:
+				raise _Error(pb.e2big)
+		except _Error, e:
+			self.__queue(ref, _Connector.ERROR_MSG, _Connector.FLAG_CNF,
+				pb.ErrorCnf(error=e.code).SerializeToString())
+		else:
+			self.__queue(ref, msg, _Connector.FLAG_CNF, reply)
+
+	def __getHandle(self, handle):
+		try:
+			return self.__handles[handle]
+		except KeyError:
+			raise _Error(pb.ebadf)
+
+	def __newHandle(self, handle):
+		h = self.__nextHandle
+		self.__nextHandle += 1
+		self.__handles[h] = handle
+		return h
+
+	# message handlers
+
+	def __ignore(self, body):
+		return ''
+
+	def __init(self, body):
+		req = pb.InitReq.FromString(body)
+		if req.major != 2:
+			raise _Error(pb.erpcmismatch)
+		if req.cookie != self.__server.cookie:
+			raise _Error(pb.eacces)
+		self.__initialized = True
+		return pb.InitCnf(major=2, minor=0,
+			max_packet_size=0x4000).SerializeToString()
+
+	def __enum(self, body):
+		cnf = pb.EnumCnf()
+		def fill(item, store):
+			item.sid = store.sid
+			item.src = store.path or 'memory'
+			item.type = 'standin'
+			item.label = store.label
+		fill(cnf.sys_store, self.__server.sysStore)
+		for store in self.__server.stores:
+			fill(cnf.stores.add(), store)
+		return cnf.SerializeToString()
+
+	def __lookup(self, doc, sids, cnf):
+		revs = {}
+		for store in self.__server.selectStores(sids):
+			rev = store.docs.get(doc)
+			if rev is not None:
+				revs.setdefault(rev, []).append(store.sid)
+		for (rev, stores) in revs.items():
+			item = cnf.revs.add()
+			item.rid = rev
+			item.stores.extend(stores)
+		return cnf
+
+	def __lookupDoc(self, body):
+		req = pb.LookupDocReq.FromString(body)
+		return self.__lookup(req.doc, req.stores, pb.LookupDocCnf()).SerializeToString()
+
+	def __lookupMany(self, body):
+		req = pb.LookupManyReq.FromString(body)
+		cnf = pb.LookupManyCnf()
+		for doc in req.docs:
+			self.__lookup(doc, req.stores, cnf.results.add())
+		return cnf.SerializeToString()
+
+	def __lookupRev(self, body):
+		req = pb.LookupRevReq.FromString(body)
+		cnf = pb.LookupRevCnf()
+		cnf.stores.extend([ store.sid for store in self.__server.selectStores(req.stores)
+			if req.rev in store.revs ])
+		return cnf.SerializeToString()
+
+	def __walkPath(self, body):
+		# 'label:dir/file', entries are matched by the title of the document
+		req = pb.WalkPathReq.FromString(body)
+		(label, sep, path) = req.path.partition(':')
+		if not sep:
+			raise _Error(pb.einval)
+		stores = [ s for s in self.__server.stores + [self.__server.sysStore]
+			if s.label == label ]
+		if not stores:
+			raise _Error(pb.enoent)
+		store = stores[0]
+		doc = store.sid
+		for step in (path.split('/') if path else []):
+			doc = self.__findEntry(store, doc, step.decode('utf-8'))
+		cnf = pb.WalkPathCnf()
+		cnf.items.add(store=store.sid, doc=doc)
+		return cnf.SerializeToString()
+
+	def __findEntry(self, store, folder, name):
+		try:
+			entries = loadPDSD(store.sid, store.parts[store.revs[
+				store.docs[folder]].data])[u'org.peerdrive.folder']
+		except (KeyError, TypeError):
+			raise _Error(pb.enoent)
+		for entry in entries:
+			link = entry.get(u'') if isinstance(entry, dict) else None
+			if not isinstance(link, DocLink) or link.doc() not in store.docs:
+				continue
+			data = loadPDSD(store.sid, store.parts[store.revs[
+				store.docs[link.doc()]].data])
+			try:
+				if data[u'org.peerdrive.annotation'][u'title'] == name:
+					return link.doc()
+			except (KeyError, TypeError):
+				pass
+		raise _Error(pb.enoent)
+
+	def __findRev(self, rev, sids):
+		for store in self.__server.selectStores(sids):
+			if rev in store.revs:
+				return (store, store.revs[rev])
+		raise _Error(pb.enoent)
+
+	def __stat(self, body):
+		req = pb.StatReq.FromString(body)
+		(store, rev) = self.__findRev(req.rev, req.stores)
+		return _stat(store, rev).SerializeToString()
+
+	def __statMany(self, body):
+		req = pb.StatManyReq.FromString(body)
+		cnf = pb.StatManyCnf()
+		for rev in req.revs:
+			result = cnf.results.add()
+			try:
+				(store, r) = self.__findRev(rev, req.stores)
+				_stat(store, r, result.stat)
+			except _Error, e:
+				result.error = e.code
+		return cnf.SerializeToString()
+
+	def __getLinks(self, body):
+		req = pb.GetLinksReq.FromString(body)
+		(store, rev) = self.__findRev(req.rev, req.stores)
+		(docs, revs) = _links(store.sid, store.parts[rev.data])
+		cnf = pb.GetLinksCnf()
+		cnf.doc_links.extend(docs)
+		cnf.rev_links.extend(revs)
+		return cnf.SerializeToString()
+
+	def __peek(self, body):
+		req = pb.PeekReq.FromString(body)
+		store = self.__server.getStore(req.store)
+		if req.rev not in store.revs:
+			raise _Error(pb.enoent)
+		h = self.__newHandle(_Handle(store, None, req.rev, True))
+		return pb.PeekCnf(handle=h).SerializeToString()
+
+	def __create(self, body):
+		req = pb.CreateReq.FromString(body)
+		store = self.__server.getStore(req.store)
+		handle = _Handle(store, os.urandom(16), None, False, req.creator_code)
+		handle.type = req.type_code
+		h = self.__newHandle(handle)
+		return pb.CreateCnf(handle=h, doc=handle.doc).SerializeToString()
+
+	def __fork(self, body):
+		req = pb.ForkReq.FromString(body)
+		store = self.__server.getStore(req.store)
+		if req.rev not in store.revs:
+			raise _Error(pb.enoent)
+		handle = _Handle(store, os.urandom(16), req.rev, False, req.creator_code)
+		h = self.__newHandle(handle)
+		return pb.ForkCnf(handle=h, doc=handle.doc).SerializeToString()
+
+	def __update(self, body):
+		req = pb.UpdateReq.FromString(body)
+		store = self.__server.getStore(req.store)
+		if store.docs.get(req.doc) != req.rev:
+			raise _Error(pb.enoent if req.doc not in store.docs else pb.econflict)
+		creator = req.creator_code if req.HasField('creator_code') else None
+		h = self.__newHandle(_Handle(store, req.doc, req.rev, False, creator))
+		return pb.UpdateCnf(handle=h).SerializeToString()
+
+	def __getData(self, body):
+		req = pb.GetDataReq.FromString(body)
+		handle = self.__getHandle(req.handle)
+		data = _extract(handle.store.sid, handle.data, req.selector)
+		return pb.GetDataCnf(data=data).SerializeToString()
+
+	def __setData(self, body):
+		req = pb.SetDataReq.FromString(body)
+		self.__getHandle(req.handle).setData(req.selector, req.data)
+		return ''
+
+	def __getRevData(self, body):
+		req = pb.GetRevDataReq.FromString(body)
+		cnf = pb.GetRevDataCnf()
+		for item in req.items:
+			result = cnf.results.add()
+			try:
+				store = self.__server.getStore(item.store)
+				if item.rev not in store.revs:
+					raise _Error(pb.enoent)
+				data = store.parts[store.revs[item.rev].data]
+				for selector in item.selectors:
+					value = result.values.add()
+					try:
+						value.data = _extract(store.sid, data, selector)
+					except _Error, e:
+						value.error = e.code
+			except _Error, e:
+				result.error = e.code
+		return cnf.SerializeToString()
+
+	def __read(self, body):
+		req = pb.ReadReq.FromString(body)
+		content = self.__getHandle(req.handle).getPart(req.part)
+		data = str(content[req.offset:req.offset+req.length])
+		return pb.ReadCnf(data=data).SerializeToString()
+
+	def __trunc(self, body):
+		req = pb.TruncReq.FromString(body)
+		self.__getHandle(req.handle).truncPart(req.part, req.offset)
+		return ''
+
+	def __writeBuffer(self, body):
+		req = pb.WriteBufferReq.FromString(body)
+		handle = self.__getHandle(req.handle)
+		handle.buffers.setdefault(req.part, []).append(req.data)
+		return ''
+
+	def __writeCommit(self, body):
+		req = pb.WriteCommitReq.FromString(body)
+		handle = self.__getHandle(req.handle)
+		data = ''.join(handle.buffers.pop(req.part, [])) + req.data
+		handle.writePart(req.part, req.offset, data)
+		return ''
+
+	def __fstat(self, body):
+		req = pb.FStatReq.FromString(body)
+		return self.__getHandle(req.handle).stat().SerializeToString()
+
+	def __setFlags(self, body):
+		req = pb.SetFlagsReq.FromString(body)
+		self.__getHandle(req.handle).flags = req.flags
+		return ''
+
+	def __setType(self, body):
+		req = pb.SetTypeReq.FromString(body)
+		self.__getHandle(req.handle).type = req.type_code
+		return ''
+
+	def __commit(self, body):
+		req = pb.CommitReq.FromString(body)
+		handle = self.__getHandle(req.handle)
+		if handle.readonly:
+			raise _Error(pb.ebadf)
+		store = handle.store
+		head = store.docs.get(handle.doc)
+		if head is not None and head not in handle.parents:
+			raise _Error(pb.econflict)
+		rev = handle.revision(req.comment if req.HasField('comment') else '')
+		rid = store.commit(handle.doc, rev)
+		handle.rev = rid
+		handle.parents = [rid]
+		handle.readonly = True
+		server = self.__server
+		server.notify(WATCH_APPEARED, pb.WatchInd.rev, store, rid)
+		if head is None:
+			server.notify(WATCH_APPEARED, pb.WatchInd.doc, store, handle.doc)
+		else:
+			server.notify(WATCH_MODIFIED, pb.WatchInd.doc, store, handle.doc)
+		return pb.CommitCnf(rev=rid).SerializeToString()
+
+	def __close(self, body):
+		req = pb.CloseReq.FromString(body)
+		self.__getHandle(req.handle)
+		del self.__handles[req.handle]
+		return ''
+
+	def __deleteDoc(self, body):
+		req = pb.DeleteDocReq.FromString(body)
+		store = self.__server.getStore(req.store)
+		if req.doc not in store.docs:
+			raise _Error(pb.enoent)
+		if store.docs[req.doc] != req.rev:
+			raise _Error(pb.econflict)
+		store.deleteDoc(req.doc)
+		self.__server.notify(WATCH_DISAPPEARED, pb.WatchInd.doc, store, req.doc)
+		return ''
+
+	def __watchAdd(self, body):
+		req = pb.WatchAddReq.FromString(body)
+		self.__watches.add((req.type, req.element))
+		return ''
+
+	def __watchRem(self, body):
+		req = pb.WatchRemReq.FromString(body)
+		self.__watches.discard((req.type, req.element))
+		return ''
+
+	def __watchMany(self, body):
+		req = pb.WatchManyReq.FromString(body)
+		for item in req.rem:
+			self.__watches.discard((item.type, item.element))
+		for item in req.add:
+			self.__watches.add((item.type, item.element))
+		return ''
+
+
+if __name__ == '__main__':
+	# Must be run with 'python -m peerdrive.standin'. As a plain script the
+	# relative imports fail and struct.py would shadow the standard module.
+	parser = optparse.OptionParser(
+		usage="usage: python -m peerdrive.standin [options] [store...]")
+	parser.add_option("-p", "--port", dest="port", type="int", default=0,
+		help="TCP port to listen on (default: random)")
+	parser.add_option("-d", "--dir", dest="path",
+		help="Persist the stores in this directory")
+	parser.add_option("-l", "--latency", dest="latency", type="float",
+		default=0.0, help="Delay of every reply in milliseconds")
+	parser.add_option("-j", "--jitter", dest="jitter", type="float",
+		default=0.0, help="Additional random delay in milliseconds")
+	(options, args) = parser.parse_args()
+
+	server = Server(args or ['user'], options.path, options.latency / 1000.0,
+		options.jitter / 1000.0, options.port)
+	print "PEERDRIVE=%s" % server.address()
+	sys.stdout.flush()
+	try:
+		server.serve()
+	except KeyboardInterrupt:
+		server.stop()
@@ -18,111 +18,14 @@
 
 from __future__ import absolute_import
 
-import struct, copy
+import struct, copy, collections
 
-from . import connector
+from . import connector, merger
 
-# returns (result, conflicts)
+# returns (result, conflicts), see merger.merge() for the conflict report
 def merge(base, versions):
-	baseType = type(base)
-	if any([not isinstance(o, baseType) for o in versions]):
-		# the type changed -> unmergable
-		return (versions[0], True)
-
-	if isinstance(base, dict):
-		return __mergeDict(base, versions)
-	elif isinstance(base, (list, tuple)):
-		return __mergeList(base, versions)
-	elif (isinstance(base, basestring)
-			or isinstance(base, bool)
-			or isinstance(base, connector.RevLink)
-			or isinstance(base, connector.DocLink)
-			or isinstance(base, float)
-			or isinstance(base, (int, long))):
-		changes = [o for o in versions if o != base]
-		count = len(set(changes))
-		if count > 1:
-			# take the latest change
-			return (changes[0], True)
-		elif count == 1:
-			return (changes[0], False)
-		else:
-			return (base, False)
-	else:
-		raise TypeError("Invalid object: " + repr(o))
-
-
-def __mergeDict(base, versions):
-	baseKeys = set(base.keys())
-	conflict = False
-	added = { }
-	removed = set()
-
-	# get differences
-	for ver in versions:
-		verKeys = set(ver.keys())
-		# removed keys
-		removed.update(baseKeys - verKeys)
-		# added keys
-		newKeys = verKeys - baseKeys
-		for key in newKeys:
-			if key in added:
-				# already added; the same?
-				if ver[key] != added[key]:
-					conflict = True
-			else:
-				added[key] = ver[key]
-
-	# construct new dict
-	newDict = {}
-	for (key, oldValue) in base.items():
-		if key in removed:
-			# modify/delete conflict?
-			remainingValues = [d[key] for d in versions if (key in d)]
-			if any([other != oldValue for other in remainingValues]):
-				conflict = True
-				# yes :( -> take the latest version
-				if key in versions[0]:
-					# the latest version still has it.. retain
-					(newValue, newConflict) = merge(oldValue, remainingValues)
-					newDict[key] = newValue
-				else:
-					# the latest version deleted it.. bye bye
-					pass
-		else:
-			# descend
-			(newValue, newConflict) = merge(oldValue, [d[key] for d in versions])
-			conflict = conflict or newConflict
-			newDict[key] = newValue
-	for (key, newValue) in added.items():
-		newDict[key] = newValue
-
-	# return new dict
-	return (newDict, conflict)
-
-
-def __mergeList(base, versions):
-	added   = []
-	removed = []
-	for ver in versions:
-		# check for removed items
-		for item in base:
-			if item not in ver:
-				if item not in removed:
-					removed.append(item)
-		# check for added items
-		for item in ver:
-			if item not in base:
-				if item not in added:
-					added.append(item)
-
-	# apply diff
-	newList = base[:]
-	for item in removed:
-		newList.remove(item)
-	for item in added:
-		newList.append(item)
-	return (newList, False)
+	(result, conflicts) = merger.merge(base, versions)
+	return (result, len(conflicts) > 0)
 
 
 ###############################################################################
@@ -132,8 +35,14 @@ def __mergeList(base, versions):
 class Folder(object):
 	UTIs = ["org.peerdrive.folder", "org.peerdrive.store"]
 
+	# attempts to commit the pending changes if the head keeps moving
+	SAVE_RETRIES = 3
+
 	def __init__(self, link = None):
 		self.__didCache = False
+		self.__names = None
+		self.__added = []   # entries appended since the last load or save
+		self.__removed = [] # loaded entries which were removed since then
 		if link:
 			link.update()
 			self.__rev = link.rev()
@@ -152,16 +61,22 @@ class Folder(object):
 		uti = connector.Connector().stat(self.__rev, [self.__store]).type()
 		if uti not in Folder.UTIs:
 			raise IOError("Not a folder: "+uti)
-		with connector.Connector().peek(self.__store, self.__rev) as r:
-			self.__meta = r.getData('/org.peerdrive.annotation')
-			content = r.getData('/org.peerdrive.folder')
+		(self.__meta, content) = connector.Connector().getRevData(self.__store,
+			self.__rev, ['/org.peerdrive.annotation', '/org.peerdrive.folder'])
 		self.__content = [ (None, l) for l in content ]
 
 	def __doCache(self):
 		if not self.__didCache:
-			self.__content = [ (readTitle(i['']), i) for (t, i) in
-				self.__content ]
+			connector.DocLink.updateMany([ i[''] for (t, i) in self.__content
+				if isinstance(i[''], connector.DocLink) ])
+			titles = readTitles([ i[''] for (t, i) in self.__content ])
+			self.__content = [ (title, i) for (title, (t, i)) in
+				zip(titles, self.__content) ]
 			self.__didCache = True
+			# position of the first entry of each title
+			self.__names = {}
+			for (i, (title, item)) in enumerate(self.__content):
+				self.__names.setdefault(title, i)
 
 	def create(self, store, name=None):
 		if self.__rev or self.__doc:
@@ -184,22 +99,83 @@ class Folder(object):
 			w.commit()
 			self.__rev = w.getRev()
 			self.__doc = w.getDoc()
+			self.__added = []
+			self.__removed = []
 			return w
 		except:
 			w.close()
 			raise
 
 	def save(self):
-		if self.__rev and self.__doc and self.__store:
-			content = [ item for (descr, item) in self.__content ]
-			with connector.Connector().update(self.__store, self.__doc, self.__rev) as w:
-				w.setData('', {
-					"org.peerdrive.folder" : content,
-					"org.peerdrive.annotation" : self.__meta
-				})
-				self.__rev = w.commit()
-		else:
+		"""Commit the entries which were appended and removed since loading.
+
+		Only appended entries are sent if nothing was removed. If the folder
+		was changed by someone else in the meantime the pending changes are
+		applied to the current head instead of overwriting it.
+		"""
+		if not (self.__rev and self.__doc and self.__store):
 			raise IOError('Not writable')
+		if not self.__added and not self.__removed:
+			return
+
+		c = connector.Connector()
+		for attempt in xrange(Folder.SAVE_RETRIES):
+			# after a conflict the cached head may still be the old one
+			head = c.lookupDoc(self.__doc, cached=(attempt == 0)).rev(self.__store)
+			if head != self.__rev:
+				self.__rebase(head)
+			try:
+				with c.update(self.__store, self.__doc, self.__rev) as w:
+					if self.__removed:
+						w.setData('/org.peerdrive.folder',
+							[ item for (title, item) in self.__content ])
+					else:
+						with c.pipeline() as p:
+							for item in self.__added:
+								p.setData(w, '/org.peerdrive.folder#+', item)
+					w.commit()
+					self.__rev = w.getRev()
+				break
+			except IOError as e:
+				# Only if the head moved before the commit it makes sense to try
+				# again on the new one. Other errors will not go away.
+				if e.args[0] != 'ECONFLICT' or attempt == Folder.SAVE_RETRIES - 1:
+					raise
+		self.__added = []
+		self.__removed = []
+
+	def __rebase(self, head):
+		# Apply the pending changes to the entries of 'head'. Entries are
+		# matched by the document or revision they link to. If the head gained
+		# the same entries that we appended they are not added a second time,
+		# but entries which we appended several times are kept.
+		[content] = connector.Connector().getRevData(self.__store, head,
+			['/org.peerdrive.folder'])
+		Counter = collections.Counter
+		removed = Counter(merger.itemKey(i) for i in self.__removed)
+		appended = Counter(merger.itemKey(i) for i in self.__added)
+		loaded = (Counter(merger.itemKey(i) for (t, i) in self.__content) -
+			appended) + removed
+		gained = Counter(merger.itemKey(i) for i in content) - loaded
+		base = []
+		for item in content:
+			key = merger.itemKey(item)
+			if removed[key] > 0:
+				removed[key] -= 1
+			else:
+				base.append(item)
+		added = []
+		for item in self.__added:
+			key = merger.itemKey(item)
+			if gained[key] > 0:
+				gained[key] -= 1
+			else:
+				added.append(item)
+		self.__rev = head
+		self.__content = [ (None, i) for i in base + added ]
+		self.__didCache = False
+		self.__names = None
+		self.__added = added
 
 	def title(self):
 		if "title" in self.__meta:
@@ -207,16 +183,31 @@ class Folder(object):
 		return "Unnamed folder"
 
 	def __index(self, title, fail=True):
-		i = 0
-		for (key, item) in self.__content:
-			if key == title:
-				return i
-			else:
-				i += 1
-		if fail:
+		i = self.__names.get(title)
+		if i is None and fail:
 			raise IndexError(title)
+		return i
+
+	def __removeAt(self, i):
+		(title, item) = self.__content.pop(i)
+		for (j, added) in enumerate(self.__added):
+			if added is item:
+				del self.__added[j]
+				break
 		else:
-			return None
+			self.__removed.append(item)
+		names = self.__names
+		if names is not None:
+			# Entries behind the removed one move down by one. If it was the
+			# first entry of its title the next one with that title takes over.
+			if names.get(title) == i:
+				del names[title]
+			content = self.__content
+			for j in xrange(i, len(content)):
+				t = content[j][0]
+				pos = names.get(t)
+				if pos is None or pos == j+1:
+					names[t] = j
 
 	def __len__(self):
 		return len(self.__content)
@@ -227,11 +218,13 @@ class Folder(object):
 			i = self.__index(i)
 		return self.__content[i][1]['']
 
-	def __delitem__(self, select):
+	def __delitem__(self, i):
 		if isinstance(i, basestring):
 			self.__doCache()
 			i = self.__index(i)
-		del self.__content[i]
+		elif i < 0:
+			i += len(self.__content)
+		self.__removeAt(i)
 
 	def __contains__(self, name):
 		self.__doCache()
@@ -241,7 +234,12 @@ class Folder(object):
 	def append(self, link):
 		if self.__store:
 			link.update(self.__store)
-		self.__content.append( (readTitle(link), { '' : link }) )
+		title = readTitle(link)
+		if self.__names is not None:
+			self.__names.setdefault(title, len(self.__content))
+		item = { '' : link }
+		self.__content.append( (title, item) )
+		self.__added.append(item)
 
 	def get(self, name):
 		self.__doCache()
@@ -257,7 +255,14 @@ class Folder(object):
 
 	def remove(self, name, link):
 		self.__doCache()
-		self.__content.remove((name, {'' : link}))
+		i = self.__index(name, False)
+		if i is not None:
+			content = self.__content
+			for j in xrange(i, len(content)):
+				if content[j][0] == name and content[j][1] == {'' : link}:
+					self.__removeAt(j)
+					return
+		raise ValueError("Folder.remove(x): x not in folder")
 
 	def getDoc(self):
 		return self.__doc
@@ -270,13 +275,28 @@ def readTitle(link, default=None):
 	rev = link.rev()
 	if rev:
 		try:
-			with connector.Connector().peek(link.store(), rev) as r:
-				return r.getData("/org.peerdrive.annotation/title")
+			[title] = connector.Connector().getRevData(link.store(), rev,
+				["/org.peerdrive.annotation/title"])
+			return title
 		except IOError:
 			pass
 
 	return default
 
+def readTitles(links, default=None):
+	titles = [ default ] * len(links)
+	requests = []
+	for (i, link) in enumerate(links):
+		rev = link.rev()
+		if rev:
+			requests.append((i, (link.store(), rev,
+				["/org.peerdrive.annotation/title"])))
+	results = connector.Connector().getRevDataMany([ r for (i, r) in requests ])
+	for ((i, r), result) in zip(requests, results):
+		if not isinstance(result, IOError) and not isinstance(result[0], IOError):
+			titles[i] = result[0]
+	return titles
+
 
 class FSTab(object):
 	def __init__(self):
@@ -284,8 +304,8 @@ class FSTab(object):
 		self.__store = connector.Connector().enum().sysStore().sid
 		self.__doc = Folder(connector.DocLink(self.__store, self.__store))["fstab"].doc()
 		self.__rev = connector.Connector().lookupDoc(self.__doc).rev(self.__store)
-		with connector.Connector().peek(self.__store, self.__rev) as r:
-			self.__fstab = r.getData('/org.peerdrive.fstab')
+		[self.__fstab] = connector.Connector().getRevData(self.__store,
+			self.__rev, ['/org.peerdrive.fstab'])
 
 	def save(self):
 		if not self.__changed:
@@ -331,6 +351,13 @@ def walkPath(path, create=False):
 	docName = steps[-1]
 	steps = steps[1:-1]
 
+	# Let the server resolve the folder. The connector caches the result until
+	# one of the folders along the path changes.
+	try:
+		return __resolveFolder(storeName, steps, docName)
+	except IOError:
+		pass
+
 	# search for store
 	enum = connector.Connector().enum()
 	storeDoc = None
@@ -341,6 +368,11 @@ def walkPath(path, create=False):
 			break
 	if not storeDoc:
 		raise IOError("Store not found")
+	if mount.label != storeName:
+		try:
+			return __resolveFolder(mount.label, steps, docName)
+		except IOError:
+			pass
 
 	# walk the path
 	curFolder = Folder(connector.DocLink(storeDoc, storeDoc, False))
@@ -351,7 +383,7 @@ def walkPath(path, create=False):
 		elif create:
 			handle = Folder().create(storeDoc, step)
 			try:
-				next = DocLink(connector.storeDoc, handle.getDoc())
+				next = connector.DocLink(storeDoc, handle.getDoc())
 				curFolder.append(next)
 				curFolder.save()
 			finally:
@@ -364,6 +396,11 @@ def walkPath(path, create=False):
 	return (storeDoc, curFolder, docName)
 
 
+def __resolveFolder(label, steps, docName):
+	(store, doc) = connector.Connector().resolvePath(label + ':' + '/'.join(steps))
+	return (store, Folder(connector.DocLink(store, doc, False)), docName)
+
+
 def copyDoc(src, dstStore):
 	src.update()
 	if not src.rev():
@@ -0,0 +1,150 @@
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from __future__ import absolute_import
+
+import sys, socket, select, errno, threading
+
+# Transports carry the raw byte stream between the connector and the server.
+# They are created as transport(host, port, received, deferred) where
+# 'received' must be called with every chunk of data that was read from the
+# server and 'deferred' is the callback that should run later from the main
+# loop when defer() is called. Apart from that every transport provides:
+#
+#   send(data)      -- queue data for sending, raises IOError on failure
+#   wait(timeout)   -- wait up to timeout ms (-1: forever) for incoming data;
+#                      returns False on timeout or error
+#   flush()         -- block until all queued data has been sent
+#   defer(delay)    -- schedule the 'deferred' callback in 'delay' seconds
+#   close()         -- disconnect from the server
+#   errorString()   -- description of the last error
+
+def defaultTransport():
+	# Use the Qt event loop if the application runs one. Headless scripts
+	# never load Qt and get the plain socket transport instead.
+	if 'PyQt4.QtCore' in sys.modules:
+		from .qttransport import QtTransport
+		return QtTransport
+	else:
+		return SocketTransport
+
+
+class SocketTransport(object):
+	"""Qt-free transport on top of a non-blocking TCP socket.
+
+	Data is only received while the connector waits for a confirmation or
+	during Connector().process(). Indications which arrive while a request is
+	pending are thus delivered by the next call to process(). The socket is
+	exposed through fileno() so that it can be integrated into a foreign
+	select() loop which calls process(0) when the socket becomes readable.
+
+	One thread may wait() while others send(), the connector makes sure that
+	only one thread reads at a time.
+	"""
+
+	def __init__(self, host, port, received, deferred):
+		try:
+			self.__socket = socket.create_connection((host, port), 1.0)
+		except socket.error:
+			raise IOError("Could not connect to server!")
+		self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		self.__socket.setblocking(False)
+		self.__received = received
+		self.__outgoing = bytearray()
+		self.__writeLock = threading.Lock()
+		self.__error = ''
+
+	def fileno(self):
+		return self.__socket.fileno()
+
+	def send(self, data):
+		with self.__writeLock:
+			self.__outgoing.extend(data)
+		self.__write()
+
+	def wait(self, timeout):
+		if timeout < 0:
+			timeout = None
+		else:
+			timeout = timeout / 1000.0
+		while True:
+			if self.__outgoing:
+				writers = [self.__socket]
+			else:
+				writers = []
+			try:
+				(r, w, x) = select.select([self.__socket], writers, [], timeout)
+			except select.error, e:
+				if e.args[0] == errno.EINTR:
+					continue
+				self.__error = str(e)
+				return False
+			if w:
+				self.__write()
+			if r:
+				return self.__read()
+			if not w:
+				self.__error = 'Timeout'
+				return False
+
+	def flush(self):
+		while self.__outgoing:
+			(r, w, x) = select.select([self.__socket], [self.__socket], [], 10)
+			if w:
+				self.__write()
+			# the server might block until we read its replies
+			if r and not self.__read():
+				raise IOError("Could not send request to server: " + self.__error)
+
+	def defer(self, delay=0):
+		# process() dispatches everything which is left over
+		pass
+
+	def close(self):
+		self.__socket.close()
+
+	def errorString(self):
+		return self.__error
+
+	def __read(self):
+		try:
+			data = self.__socket.recv(0x10000)
+		except socket.error, e:
+			if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+				return True
+			self.__error = str(e)
+			return False
+		if not data:
+			self.__error = 'Connection closed by server'
+			return False
+		self.__received(data)
+		return True
+
+	def __write(self):
+		with self.__writeLock:
+			while self.__outgoing:
+				try:
+					sent = self.__socket.send(self.__outgoing)
+				except socket.error, e:
+					if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+						return
+					self.__error = str(e)
+					raise IOError("Could not send request to server: " + self.__error)
+				del self.__outgoing[:sent]
+
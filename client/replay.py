@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# vim: set fileencoding=utf-8 :
+#
+# PeerDrive
+# Copyright (C) 2011  Jan Klötzke <jan DOT kloetzke AT freenet DOT de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Replay a recorded session without a server. Record a session by running
+# any client with PEERDRIVE_RECORD=<file> in the environment or by calling
+# Connector().record(). The replay sends the recorded requests again in the
+# same order and feeds the recorded replies and indications back into a fresh
+# connector at full speed.
+
+import sys, time, optparse, cProfile, pstats
+from peerdrive import connector, recorder
+from peerdrive import peerdrive_client_pb2 as pb
+
+ADDRESS = 'tcp://127.0.0.1:0/00'
+MiB = 1 << 20
+
+class Sink(connector.Watch):
+	hits = 0
+
+	def triggered(self, event, store):
+		Sink.hits += 1
+
+
+def confirmationTypes():
+	# LOOKUP_DOC_MSG -> pb.LookupDocCnf
+	types = {}
+	for (msg, name) in connector._requestNames.items():
+		name = ''.join(part.capitalize() for part in name.split('_')[:-1])
+		cnf = getattr(pb, name + 'Cnf', None)
+		if cnf is not None:
+			types[msg] = cnf
+	return types
+
+
+def replay(frames, options):
+	c = connector._Connector(ADDRESS, recorder.ReplayTransport.bind(frames))
+	transport = recorder.ReplayTransport.last
+
+	# Watch everything that the server reported to exercise the dispatcher.
+	transport.synthetic = True
+	watched = set((ind.type, ind.element) for ind in [
+		pb.WatchInd.FromString(body) for (kind, ref, msg, flags, body) in frames
+			if kind == recorder.RECEIVED and msg == connector._Connector.WATCH_MSG ])
+	sinks = [ Sink(typ, element) for (typ, element) in watched ]
+	c.watchMany(sinks)
+	progress = []
+	c.regProgressHandler(progress=lambda *args, **kwargs: progress.append(args))
+	transport.synthetic = False
+	mismatches = transport.mismatches
+
+	types = confirmationTypes()
+	requests = [ (msg, body) for (kind, ref, msg, flags, body) in frames
+		if kind == recorder.SENT and msg != connector._Connector.INIT_MSG ]
+	futures = [ (msg, c._request(msg, body)) for (msg, body) in requests ]
+	c.process(0)
+
+	(errors, pending) = (0, 0)
+	for (msg, future) in futures:
+		if not future.ready():
+			pending += 1
+			continue
+		try:
+			reply = future.result()
+			if options.decode and msg in types:
+				types[msg].FromString(reply)
+		except IOError:
+			errors += 1
+
+	return {
+		'requests'   : len(requests),
+		'errors'     : errors,
+		'pending'    : pending,
+		'mismatches' : transport.mismatches - mismatches,
+		'progress'   : len(progress),
+	}
+
+
+if __name__ == '__main__':
+	parser = optparse.OptionParser(usage="usage: %prog [options] recording")
+	parser.add_option("-n", "--repeat", dest="repeat", type="int", default=1,
+		help="Replay the recording N times (default: 1)")
+	parser.add_option("--decode", dest="decode", action="store_true",
+		help="Decode the confirmations too")
+	parser.add_option("--profile", dest="profile", action="store_true",
+		help="Run the replay under cProfile and print the top functions")
+	(options, args) = parser.parse_args()
+	if len(args) != 1:
+		parser.error("no recording given")
+
+	with open(args[0], 'rb') as f:
+		records = recorder.load(f)
+	frames = recorder.frames(records)
+	size = sum(len(data) for (kind, timestamp, data) in records)
+	print "%d records, %d frames, %.1f MiB" % (len(records), len(frames),
+		float(size) / MiB)
+
+	profile = cProfile.Profile() if options.profile else None
+	for i in xrange(options.repeat):
+		Sink.hits = 0
+		start = time.time()
+		if profile:
+			result = profile.runcall(replay, frames, options)
+		else:
+			result = replay(frames, options)
+		duration = time.time() - start
+		print ("run %d: %.3fs, %.1f MiB/s, %d requests, %d watch hits, "
+			"%d progress, %d errors, %d pending, %d mismatches") % (i+1,
+			duration, size / duration / MiB, result['requests'], Sink.hits,
+			result['progress'], result['errors'], result['pending'],
+			result['mismatches'])
+
+	if profile:
+		pstats.Stats(profile).sort_stats('cumulative').print_stats(30)
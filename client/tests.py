@@ -2,9 +2,22 @@ import unittest
 import time
 import subprocess
 import datetime
+import copy
+import gc
+import io
+import sys
+import socket
+import threading
 from peerdrive import Connector
 from peerdrive import connector
 from peerdrive import struct
+from peerdrive import merger
+from peerdrive import metrics
+from peerdrive import recorder
+from peerdrive import standin
+from peerdrive.transport import SocketTransport
+from peerdrive import peerdrive_client_pb2 as pb
+import StringIO
 
 STORE1 = 'rem1'
 STORE2 = 'rem2'
@@ -872,6 +885,995 @@ class TestSynchronization(CommonParts):
 			pdsd = sorted(struct.loads(self.store1, r.readAll('PDSD')))
 			self.assertEqual(pdsd, [{'':2},{'':3}])
 
+class TestPDSD(unittest.TestCase):
+
+	STORE = '\x01' * 16
+
+	def roundTrip(self, value):
+		data = connector.dumpPDSD(value)
+		self.assertEqual(connector.loadPDSD(self.STORE, data), value)
+		return data
+
+	def test_scalars(self):
+		self.assertEqual(self.roundTrip(True), '\x30\x01')
+		self.assertEqual(self.roundTrip(False), '\x30\x00')
+		self.assertEqual(self.roundTrip(1.5), '\x51' + '\x00'*6 + '\xf8\x3f')
+		self.assertEqual(self.roundTrip(u'\xe4'), '\x20\x02\x00\x00\x00\xc3\xa4')
+		self.assertEqual(connector.dumpPDSD('abc'), '\x20\x03\x00\x00\x00abc')
+
+	def test_truncated_utf8(self):
+		self.assertRaises(UnicodeDecodeError, connector.loadPDSD, self.STORE,
+			'\x20\x04\x00\x00\x00abc\xc3')
+		data = connector.dumpPDSD({ u'ab' : 1 }).replace('ab', 'a\xc3')
+		self.assertRaises(UnicodeDecodeError, connector.loadPDSD, self.STORE,
+			data)
+		self.assertRaises(UnicodeDecodeError, lambda:
+			connector.loadPDSD(self.STORE, data, True).keys())
+
+	def test_integers(self):
+		cases = [
+			(0, '\x60\x00'),
+			(255, '\x60\xff'),
+			(-1, '\x61\xff'),
+			(-128, '\x61\x80'),
+			(256, '\x62\x00\x01'),
+			(-129, '\x63\x7f\xff'),
+			(0x10000, '\x64\x00\x00\x01\x00'),
+			(-32769, '\x65\xff\x7f\xff\xff'),
+			(0x100000000, '\x66\x00\x00\x00\x00\x01\x00\x00\x00'),
+			(-0x80000001, '\x67\xff\xff\xff\x7f\xff\xff\xff\xff'),
+		]
+		for (value, data) in cases:
+			self.assertEqual(self.roundTrip(value), data)
+			self.assertEqual(self.roundTrip(long(value)), data)
+
+	def test_containers(self):
+		self.assertEqual(self.roundTrip([]), '\x10\x00\x00\x00\x00')
+		self.assertEqual(self.roundTrip({}), '\x00\x00\x00\x00\x00')
+		self.assertEqual(self.roundTrip({u'a' : [1, u'x']}),
+			'\x00\x01\x00\x00\x00\x01\x00\x00\x00a'
+			'\x10\x02\x00\x00\x00\x60\x01\x20\x01\x00\x00\x00x')
+		self.assertEqual(connector.dumpPDSD((1, 2)), connector.dumpPDSD([1, 2]))
+
+	def test_links(self):
+		doc = '\x02' * 16
+		rev = '\x03' * 16
+		data = self.roundTrip([connector.DocLink(self.STORE, doc, False),
+			connector.RevLink(self.STORE, rev)])
+		self.assertEqual(data, '\x10\x02\x00\x00\x00\x41\x10' + doc +
+			'\x40\x10' + rev)
+		[docLink, revLink] = connector.loadPDSD(self.STORE, data)
+		self.assertEqual(docLink.doc(), doc)
+		self.assertEqual(docLink.store(), self.STORE)
+		self.assertEqual(revLink.rev(), rev)
+
+	def test_nested(self):
+		folder = [ {
+				u'' : connector.DocLink(self.STORE, '\x02' * 16, False),
+				u'org.peerdrive.annotation' : { u'title' : u'Entry %d' % i },
+				u'size' : i * 4099,
+				u'mtime' : 1300000000.5 + i,
+				u'sticky' : (i % 2) == 0,
+			} for i in range(100) ]
+		self.roundTrip({ u'org.peerdrive.folder' : folder, u'empty' : [{}] })
+
+	def test_lazy(self):
+		value = {
+			u'a' : [ {}, [], { u'x' : [1, 2.5, u'y'] } ],
+			u'b' : connector.DocLink(self.STORE, '\x02' * 16, False),
+			u'c' : True,
+		}
+		data = connector.dumpPDSD(value)
+		lazy = connector.loadPDSD(self.STORE, data, lazy=True)
+		self.assertTrue(isinstance(lazy, connector.LazyDict))
+		self.assertEqual(lazy[u'a'][-1][u'x'][2], u'y')
+		self.assertEqual(len(lazy), 3)
+		self.assertFalse(u'd' in lazy)
+		self.assertRaises(KeyError, lambda: lazy[u'd'])
+		self.assertRaises(IndexError, lambda: lazy[u'a'][3])
+		self.assertEqual(lazy, value)
+		self.assertEqual(connector.loadPDSD(self.STORE, connector.dumpPDSD(lazy)),
+			value)
+
+		mutable = copy.deepcopy(lazy)
+		mutable[u'a'].append(3)
+		self.assertEqual(len(lazy[u'a']), 3)
+
+	def test_invalid(self):
+		self.assertRaises(TypeError, connector.dumpPDSD, object())
+		self.assertRaises(TypeError, connector.dumpPDSD, {1 : 2})
+		self.assertRaises(TypeError, connector.loadPDSD, self.STORE, '\x99')
+
+
+class TestMerge(unittest.TestCase):
+
+	STORE = '\x01' * 16
+
+	def entry(self, i, **attrs):
+		item = { u'' : connector.DocLink(self.STORE, '%016d' % i, False) }
+		item.update(attrs)
+		return item
+
+	def test_list(self):
+		self.assertEqual(struct.merge([1, 2, 3], [[1, 2, 3, 4], [2, 3, 5]]),
+			([2, 3, 4, 5], False))
+		self.assertEqual(struct.merge([1, 1, 2], [[1, 2], [1, 1, 2, 1]]),
+			([1, 2, 1], False))
+
+	def test_folder_entries(self):
+		base = [ self.entry(0, x=1), self.entry(1) ]
+		(result, conflict) = struct.merge(base, [
+			[ self.entry(0, x=2), self.entry(1) ],
+			[ self.entry(0, x=1, y=3), self.entry(1), self.entry(2) ] ])
+		self.assertFalse(conflict)
+		self.assertEqual(result, [ self.entry(0, x=2, y=3), self.entry(1),
+			self.entry(2) ])
+
+		(result, conflict) = struct.merge(base, [ [ self.entry(1) ],
+			[ self.entry(0, x=3), self.entry(1) ] ])
+		self.assertTrue(conflict)
+		self.assertEqual(result, [ self.entry(1) ])
+
+	def test_conflicts(self):
+		base = { u'org.peerdrive.annotation' : { u'title' : u'a' }, u'n' : 1 }
+		ours = { u'org.peerdrive.annotation' : { u'title' : u'b' }, u'n' : u'1',
+			u'k' : 1 }
+		theirs = { u'org.peerdrive.annotation' : { u'title' : u'c' }, u'n' : 2,
+			u'k' : 2 }
+		(result, conflicts) = merger.merge(base, [ours, theirs])
+		self.assertEqual(result, ours)
+		self.assertEqual(sorted((c.path, c.kind) for c in conflicts), [
+			(u'/k', merger.Conflict.ADD),
+			(u'/n', merger.Conflict.TYPE),
+			(u'/org.peerdrive.annotation/title', merger.Conflict.VALUE) ])
+		title = [ c for c in conflicts if c.kind == merger.Conflict.VALUE ][0]
+		self.assertEqual((title.base, title.values, title.result),
+			(u'a', [u'b', u'c'], u'b'))
+
+		(result, conflicts) = merger.merge(base, [ours, theirs],
+			lambda c: c.values[-1])
+		self.assertEqual(result, theirs)
+		self.assertEqual(len(conflicts), 3)
+
+	def test_modify_delete(self):
+		(result, conflicts) = merger.merge([ self.entry(0, x=1) ],
+			[ [], [ self.entry(0, x=2) ] ])
+		self.assertEqual(result, [])
+		self.assertEqual([ (c.kind, c.path) for c in conflicts ],
+			[ (merger.Conflict.DELETE, u'#0') ])
+		self.assertEqual(conflicts[0].values, [ merger.MISSING, self.entry(0, x=2) ])
+
+		(result, conflicts) = merger.merge({ u'a' : { u'x' : 1 } },
+			[ { u'a' : { u'x' : 2 } }, {} ], lambda c: merger.MISSING)
+		self.assertEqual(result, {})
+
+	def test_conflict_path(self):
+		base = [ self.entry(0), self.entry(1), self.entry(2, x=1) ]
+		(result, conflicts) = merger.merge(base, [
+			[ self.entry(1), self.entry(2, x=2) ],
+			[ self.entry(0), self.entry(1), self.entry(2, x=3) ] ])
+		self.assertEqual(result, [ self.entry(1), self.entry(2, x=2) ])
+		self.assertEqual([ (c.kind, c.path) for c in conflicts ],
+			[ (merger.Conflict.VALUE, u'#1/x') ])
+
+	def test_invalid(self):
+		self.assertRaises(TypeError, merger.merge, object(), [1, 2])
+
+	def test_large_folder(self):
+		base = [ self.entry(i) for i in xrange(50000) ]
+		ours = base[:100] + base[200:] + [ self.entry(i) for i in xrange(50000, 50500) ]
+		theirs = base[:-300] + [ self.entry(i) for i in xrange(60000, 60500) ]
+		(result, conflict) = struct.merge(base, [ours, theirs])
+		self.assertEqual(len(result), 50600)
+		self.assertEqual(result[:100], base[:100])
+		self.assertEqual(result[-1000:], ours[-500:] + theirs[-500:])
+
+
+class TestRpcMetrics(unittest.TestCase):
+
+	def test_counters(self):
+		m = metrics.RpcMetrics()
+		m.request(connector._Connector.STAT_MSG, 30)
+		m.confirm(connector._Connector.STAT_MSG, 100, 0.001)
+		m.request(connector._Connector.STAT_MSG, 30)
+		m.confirm(connector._Connector.STAT_MSG, 10, 0.002, True)
+		m.indication(connector._Connector.WATCH_MSG, 50)
+		stats = m.snapshot()
+		self.assertEqual(stats['STAT_MSG']['requests'], 2)
+		self.assertEqual(stats['STAT_MSG']['errors'], 1)
+		self.assertEqual(stats['STAT_MSG']['bytes_out'], 60)
+		self.assertEqual(stats['STAT_MSG']['bytes_in'], 110)
+		self.assertEqual(stats['WATCH_MSG']['indications'], 1)
+		self.assertEqual(stats['WATCH_MSG']['latency']['p50'], None)
+
+	def test_percentiles(self):
+		m = metrics.RpcMetrics()
+		for i in xrange(1, 101):
+			m.confirm(connector._Connector.READ_MSG, 0, i * 0.001)
+		latency = m.snapshot()['READ_MSG']['latency']
+		self.assertEqual(latency['count'], 100)
+		self.assertAlmostEqual(latency['max'], 0.1)
+		for (p, expect) in [('p50', 0.050), ('p95', 0.095), ('p99', 0.099)]:
+			self.assertTrue(expect <= latency[p] <= expect * 1.2, (p, latency[p]))
+
+
+class TestRecorder(unittest.TestCase):
+
+	DOC = '\x02' * 16
+	REV = '\x03' * 16
+	STORE = '\x04' * 16
+
+	def record(self):
+		f = StringIO.StringIO()
+		r = recorder.Recorder(f)
+		req = pb.LookupDocReq(doc=self.DOC).SerializeToString()
+		r.sent(connector._packetHeader.pack(len(req) + 6, 7,
+			connector._Connector.LOOKUP_DOC_MSG << 4) + req)
+		cnf = pb.LookupDocCnf()
+		rev = cnf.revs.add()
+		rev.rid = self.REV
+		rev.stores.append(self.STORE)
+		cnf = cnf.SerializeToString()
+		data = connector._packetHeader.pack(len(cnf) + 6, 7,
+			(connector._Connector.LOOKUP_DOC_MSG << 4) | 1) + cnf
+		# split the confirmation to check the reassembly
+		r.received(data[:5])
+		r.received(data[5:])
+		return StringIO.StringIO(f.getvalue())
+
+	def test_load(self):
+		records = recorder.load(self.record())
+		self.assertEqual([ kind for (kind, t, data) in records ],
+			[recorder.SENT, recorder.RECEIVED, recorder.RECEIVED])
+		frames = recorder.frames(records)
+		self.assertEqual([ (kind, ref, msg, flags) for (kind, ref, msg, flags, body)
+			in frames ], [(recorder.SENT, 7, connector._Connector.LOOKUP_DOC_MSG, 0),
+			(recorder.RECEIVED, 7, connector._Connector.LOOKUP_DOC_MSG, 1)])
+		self.assertRaises(IOError, recorder.load, StringIO.StringIO('foo'))
+
+	def test_replay(self):
+		frames = recorder.frames(recorder.load(self.record()))
+		c = connector._Connector('tcp://127.0.0.1:0/00',
+			recorder.ReplayTransport.bind(frames))
+		l = c.lookupDoc(self.DOC)
+		self.assertEqual(l.revs(), [self.REV])
+		self.assertEqual(l.stores(), [self.STORE])
+		self.assertTrue(recorder.ReplayTransport.last.done())
+
+
+	def test_watch_rollback(self):
+		# the failed WATCH_MANY is followed by one which disarms the watches
+		error = pb.ErrorCnf(error=pb.einval).SerializeToString()
+		C = connector._Connector
+		frames = [
+			(recorder.SENT, 1, C.WATCH_MANY_MSG, C.FLAG_REQ, ''),
+			(recorder.RECEIVED, 1, C.ERROR_MSG, C.FLAG_CNF, error),
+			(recorder.SENT, 2, C.WATCH_MANY_MSG, C.FLAG_REQ, ''),
+			(recorder.RECEIVED, 2, C.WATCH_MANY_MSG, C.FLAG_CNF, ''),
+		]
+		c = connector._Connector('tcp://127.0.0.1:0/00',
+			recorder.ReplayTransport.bind(frames))
+		f = StringIO.StringIO()
+		c.record(f)
+		a = connector.Watch(connector.Watch.TYPE_DOC, self.DOC)
+		b = connector.Watch(connector.Watch.TYPE_REV, self.REV)
+		self.assertRaises(IOError, c.watchMany, [a, b])
+		self.assertEqual(c.watchCount(), 0)
+		self.assertTrue(recorder.ReplayTransport.last.done())
+		c.record(None)
+		sent = [ body for (kind, ref, msg, flags, body)
+			in recorder.frames(recorder.load(StringIO.StringIO(f.getvalue())))
+			if kind == recorder.SENT ]
+		rem = pb.WatchManyReq.FromString(sent[1]).rem
+		self.assertEqual(sorted([ (i.type, i.element) for i in rem ]),
+			sorted([a._getRef(), b._getRef()]))
+
+	def test_coalesce(self):
+		C = connector._Connector
+		W = connector.Watch
+		def watch(store):
+			return (recorder.RECEIVED, 0xffffffff, C.WATCH_MSG, C.FLAG_IND,
+				pb.WatchInd(event=W.EVENT_MODIFIED, type=W.TYPE_DOC,
+					element=self.DOC, store=store).SerializeToString())
+		def progress(value, state=C.PROGRESS_RUNNING):
+			return (recorder.RECEIVED, 0xffffffff, C.PROGRESS_MSG, C.FLAG_IND,
+				pb.ProgressInd(tag=1, state=state,
+					progress=value).SerializeToString())
+		frames = [
+			(recorder.SENT, 7, C.LOOKUP_DOC_MSG, C.FLAG_REQ, ''),
+			watch(self.STORE), watch(self.STORE), watch(self.REV),
+			progress(10), progress(20), progress(30, C.PROGRESS_PAUSED),
+			progress(40), progress(50),
+			(recorder.RECEIVED, 7, C.LOOKUP_DOC_MSG, C.FLAG_CNF, ''),
+		]
+		c = connector._Connector('tcp://127.0.0.1:0/00',
+			recorder.ReplayTransport.bind(frames))
+
+		stores = []
+		reports = []
+		class Hit(W):
+			def triggered(self, cause, store):
+				stores.append(store)
+		w = Hit(W.TYPE_DOC, self.DOC)
+		recorder.ReplayTransport.last.synthetic = True
+		c.watch(w)
+		c.regProgressHandler(progress=lambda tag, state, progress, **kwargs:
+			reports.append((state, progress)))
+		recorder.ReplayTransport.last.synthetic = False
+
+		c.lookupDoc(self.DOC, cached=False)
+		c.process(0)
+		self.assertTrue(recorder.ReplayTransport.last.done())
+		self.assertEqual(stores, [self.STORE, self.REV])
+		self.assertEqual(reports, [(C.PROGRESS_PAUSED, 30),
+			(C.PROGRESS_RUNNING, 50)])
+		self.assertEqual(c.indicationInfo(), (4, 1, 3))
+
+
+class TestTransport(unittest.TestCase):
+
+	def setUp(self):
+		self.listener = socket.socket()
+		self.listener.bind(('127.0.0.1', 0))
+		self.listener.listen(1)
+		self.address = 'tcp://127.0.0.1:%d/00' % self.listener.getsockname()[1]
+
+	def tearDown(self):
+		self.listener.close()
+
+	def serve(self):
+		# Answer INIT with a confirmation that trickles in byte by byte, then
+		# hang up on the next request.
+		(peer, addr) = self.listener.accept()
+		try:
+			data = ''
+			while len(data) < 8:
+				data += peer.recv(0x10000)
+			(length, ref, msg) = connector._packetHeader.unpack_from(data)
+			cnf = pb.InitCnf(major=2, minor=0,
+				max_packet_size=0x1000).SerializeToString()
+			packet = connector._packetHeader.pack(len(cnf) + 6, ref,
+				(connector._Connector.INIT_MSG << 4) | connector._Connector.FLAG_CNF) + cnf
+			for c in packet:
+				peer.sendall(c)
+				time.sleep(0.001)
+			peer.recv(0x10000)
+		finally:
+			peer.close()
+
+	def test_framing(self):
+		t = threading.Thread(target=self.serve)
+		t.start()
+		try:
+			c = connector._Connector(self.address, SocketTransport)
+			self.assertEqual(c.maxPacketSize, 0x1000)
+			try:
+				c.enum()
+				self.fail('no error')
+			except IOError as e:
+				self.assertTrue('Connection closed by server' in e.args[0], e)
+			c.close()
+		finally:
+			t.join()
+
+	def test_wait(self):
+		chunks = []
+		t = SocketTransport('127.0.0.1', self.listener.getsockname()[1],
+			chunks.append, lambda: None)
+		(peer, addr) = self.listener.accept()
+		try:
+			t.send('ping')
+			t.flush()
+			self.assertEqual(peer.recv(4), 'ping')
+			self.assertFalse(t.wait(0))
+			self.assertEqual(t.errorString(), 'Timeout')
+			peer.sendall('pong')
+			while ''.join(chunks) != 'pong':
+				self.assertTrue(t.wait(1000))
+		finally:
+			peer.close()
+		self.assertFalse(t.wait(1000))
+		self.assertEqual(t.errorString(), 'Connection closed by server')
+		t.close()
+		self.assertRaises(IOError, t.send, 'ping')
+
+class StandinParts(unittest.TestCase):
+
+	def setUp(self):
+		self.server = standin.Server(['user']).start()
+		self.conn = connector._Connector(self.server.address(), SocketTransport)
+		self.store = self.conn.enum().fromLabel('user').sid
+
+	def tearDown(self):
+		self.conn.close()
+		self.server.stop()
+
+	def commit(self, comment=None, data=''):
+		with self.conn.create(self.store, 'public.data', 'test.ignore') as w:
+			if data:
+				w.writeAll('FILE', data)
+			w.commit(comment)
+			return w.getRev()
+
+
+class TestPipeline(StandinParts):
+
+	def test_order(self):
+		revs = [ self.commit(u'%d' % i) for i in xrange(3) ]
+		p = self.conn.pipeline()
+		futures = [ p.stat(rev) for rev in revs ]
+		# all requests are sent but nothing is read before a result is needed
+		self.assertFalse(any(f.ready() for f in futures))
+		self.assertEqual(futures[2].result().comment(), u'2')
+		# the confirmations of the earlier requests were read on the way
+		self.assertTrue(futures[0].ready() and futures[1].ready())
+		self.assertEqual([ f.result().comment() for f in futures ],
+			[u'0', u'1', u'2'])
+
+	def test_errors(self):
+		rev = self.commit(data='data')
+		with self.conn.pipeline() as p:
+			good = p.stat(rev)
+			bad = p.stat('\0' * 16)
+			peek = p.peek(self.store, rev)
+		# each request fails or succeeds on its own
+		self.assertTrue(bad.ready() and good.ready() and peek.ready())
+		self.assertRaises(IOError, bad.result)
+		self.assertEqual(good.result().size('FILE'), 4)
+		with peek.result() as r:
+			self.assertEqual(r.readAll('FILE'), 'data')
+		# the error is raised by every call
+		try:
+			bad.result()
+			self.fail('no error')
+		except IOError as e:
+			self.assertEqual(e.args[0], 'ENOENT')
+		# batches report the error of each item in its place
+		[stat, error] = self.conn.statMany([rev, '\0' * 16])
+		self.assertEqual(stat.size('FILE'), 4)
+		self.assertEqual(error.args[0], 'ENOENT')
+
+
+class TestHandle(StandinParts):
+
+	# several packets of the stand-in, and not a multiple of them
+	DATA = ''.join([ chr(i % 251) for i in xrange(100000) ])
+
+	def test_read(self):
+		rev = self.commit(data=self.DATA)
+		with self.conn.peek(self.store, rev) as r:
+			self.assertEqual(r.readAll('FILE'), self.DATA)
+			self.assertEqual(r.readAll('FILE', window=1), self.DATA)
+			r.seek('FILE', 10)
+			buf = bytearray(50000)
+			self.assertEqual(r.readinto('FILE', buf, window=2), 50000)
+			self.assertEqual(str(buf), self.DATA[10:50010])
+			self.assertEqual(r.tell('FILE'), 50010)
+			# short read at the end
+			self.assertEqual(r.readinto('FILE', buf), 49990)
+			self.assertEqual(str(buf[:49990]), self.DATA[50010:])
+			r.seek('FILE', 0)
+			chunks = list(r.readChunks('FILE', 70000))
+			self.assertTrue(len(chunks) > 1)
+			self.assertEqual(''.join(chunks), self.DATA[:70000])
+			self.assertEqual(r.tell('FILE'), 70000)
+			self.assertEqual(''.join(r.readChunks('FILE')), self.DATA[70000:])
+			self.assertEqual(r.read('FILE', 10), '')
+
+	def test_write(self):
+		data = self.DATA
+		with self.conn.create(self.store, 'public.data', 'test.ignore') as w:
+			w.writeFrom('FILE', StringIO.StringIO(data), window=2)
+			self.assertEqual(w.tell('FILE'), len(data))
+			# pieces of any size, continued at the current position
+			w.writeStream('FILE', [ data[i:i+7000] for i in xrange(0, 35000, 7000) ])
+			w.writeStream('META', [])
+			w.seek('FILE', 5)
+			w.write('FILE', 'xyz')
+			w.commit()
+			rev = w.getRev()
+		with self.conn.peek(self.store, rev) as r:
+			self.assertEqual(r.readAll('FILE'),
+				data[:5] + 'xyz' + data[8:] + data[:35000])
+			self.assertEqual(r.readAll('META'), '')
+
+	def test_open(self):
+		data = self.DATA
+		with self.conn.create(self.store, 'public.data', 'test.ignore') as w:
+			f = w.open('FILE', 'w')
+			f.write(data)
+			f.close()
+			f = w.open('FILE', 'a')
+			f.write('tail')
+			f.close()
+			f = w.open('FILE', 'r+')
+			f.seek(-4, io.SEEK_END)
+			self.assertEqual(f.read(), 'tail')
+			f.seek(1)
+			f.write('ab')
+			self.assertEqual(f.read(3), data[3:6])
+			f.close()
+			w.commit()
+			rev = w.getRev()
+		with self.conn.peek(self.store, rev) as r:
+			f = r.open('FILE')
+			self.assertEqual(f.read(10), data[:1] + 'ab' + data[3:10])
+			self.assertEqual(f.read(), data[10:] + 'tail')
+			self.assertRaises(IOError, f.write, 'x')
+			f.close()
+			self.assertRaises(ValueError, r.open, 'FILE', 'x')
+
+class TestThreads(StandinParts):
+
+	def setUp(self):
+		super(TestThreads, self).setUp()
+		self.revs = []
+		for i in xrange(8):
+			with self.conn.create(self.store, 'public.data', 'test.ignore') as w:
+				w.setData('', { u'n' : i })
+				w.commit()
+				self.revs.append(w.getRev())
+
+	def readRevs(self, conn, errors):
+		# GET_REV_DATA is not cached, so every call goes to the server
+		try:
+			for j in xrange(20):
+				for (i, rev) in enumerate(self.revs):
+					[data] = conn.getRevData(self.store, rev, [''])
+					if data != { u'n' : i }:
+						errors.append((i, data))
+		except Exception as e:
+			errors.append(e)
+
+	def runThreads(self, target, count):
+		errors = []
+		threads = [ threading.Thread(target=target, args=(errors,))
+			for i in xrange(count) ]
+		for t in threads:
+			t.start()
+		for t in threads:
+			t.join()
+		self.assertEqual(errors, [])
+
+	def test_shared(self):
+		self.runThreads(lambda errors: self.readRevs(self.conn, errors), 8)
+
+	def test_pool(self):
+		pool = connector.ConnectionPool(3, self.server.address())
+		try:
+			def work(errors):
+				with pool.connection() as c:
+					self.readRevs(c, errors)
+			self.runThreads(work, 8)
+		finally:
+			pool.close()
+
+	def test_checkout(self):
+		pool = connector.ConnectionPool(2, self.server.address())
+		try:
+			a = pool.acquire()
+			b = pool.acquire()
+			self.assertTrue(a is not b)
+			# the pool is exhausted, so the next one has to wait
+			got = []
+			t = threading.Thread(target=lambda: got.append(pool.acquire()))
+			t.start()
+			t.join(0.1)
+			self.assertEqual(got, [])
+			pool.release(a)
+			t.join()
+			self.assertTrue(got[0] is a)
+			pool.release(a)
+			pool.release(b)
+			with pool.connection() as c:
+				self.assertTrue(c is a or c is b)
+				self.assertEqual(c.enum().fromLabel('user').sid, self.store)
+		finally:
+			pool.close()
+
+class TestStandin(StandinParts):
+
+	def test_roundtrip(self):
+		c = self.conn
+		with c.create(self.store, 'public.data', 'test.ignore') as w:
+			w.setData('', { u'a' : [1] })
+			w.setData('/a#+', 2)
+			w.writeAll('FILE', 'data')
+			w.commit()
+			(doc, rev1) = (w.getDoc(), w.getRev())
+		with c.update(self.store, doc, rev1) as w:
+			w.setData('/b', u'x')
+			w.commit()
+			rev2 = w.getRev()
+
+		self.assertEqual(c.lookupDoc(doc).revs(), [rev2])
+		s = c.stat(rev2)
+		self.assertEqual(s.parents(), [rev1])
+		self.assertEqual(s.type(), 'public.data')
+		self.assertEqual(s.size('FILE'), 4)
+		self.assertEqual(c.getRevData(self.store, rev2, ['', '/a#1']),
+			[{ u'a' : [1, 2], u'b' : u'x' }, 2])
+		with c.peek(self.store, rev1) as r:
+			self.assertEqual(r.readAll('FILE'), 'data')
+		self.assertRaises(IOError, c.update, self.store, doc, rev1)
+
+	def test_watch(self):
+		class Hit(connector.Watch):
+			events = []
+			def triggered(self, event, store):
+				self.events.append(event)
+
+		c = self.conn
+		root = c.lookupDoc(self.store).rev(self.store)
+		w = Hit(connector.Watch.TYPE_DOC, self.store)
+		c.watch(w)
+		with c.update(self.store, self.store, root) as h:
+			h.setData('/org.peerdrive.folder#+', { u'' : u'x' })
+			h.commit()
+		for i in xrange(100):
+			if Hit.events:
+				break
+			c.process(10)
+		self.assertEqual(Hit.events, [connector.Watch.EVENT_MODIFIED])
+
+	def test_stat_cache(self):
+		c = self.conn
+		c.statCache.maxSize = 2
+		revs = [ self.commit() for i in xrange(3) ]
+		(hits, misses, size, maxSize) = c.statCacheInfo()
+		c.stat(revs[0])
+		requests = self.server.requests
+		c.stat(revs[0])
+		self.assertEqual(self.server.requests, requests)
+		self.assertEqual(c.statCacheInfo(), (hits + 1, misses + 1, 1, 2))
+		# the stores which were asked are part of the key
+		c.stat(revs[0], [self.store])
+		c.stat(revs[1])
+		self.assertEqual(c.statCacheInfo(), (hits + 1, misses + 3, 2, 2))
+		# which evicted the least recently used entry
+		requests = self.server.requests
+		c.stat(revs[0])
+		self.assertEqual(self.server.requests, requests + 1)
+		# errors are not cached
+		self.assertRaises(IOError, c.stat, '\0' * 16)
+		self.assertRaises(IOError, c.stat, '\0' * 16)
+		self.assertEqual(self.server.requests, requests + 3)
+
+	def test_lookup_watch_limit(self):
+		c = self.conn
+		docs = []
+		for i in xrange(3):
+			with c.create(self.store, 'public.data', 'test.ignore') as w:
+				w.commit()
+				docs.append(w.getDoc())
+		watched = connector.Watch(connector.Watch.TYPE_DOC, docs[2])
+		c.watch(watched)
+		limit = connector._Connector.LOOKUP_WATCH_LIMIT
+		connector._Connector.LOOKUP_WATCH_LIMIT = 1
+		try:
+			for doc in docs:
+				c.lookupDoc(doc)
+			requests = self.server.requests
+			c.lookupDoc(docs[0])
+			c.lookupDoc(docs[2])
+			self.assertEqual(self.server.requests, requests)
+			# over the limit, so neither cached nor watched
+			c.lookupDoc(docs[1])
+			self.assertEqual(self.server.requests, requests + 1)
+		finally:
+			connector._Connector.LOOKUP_WATCH_LIMIT = limit
+		self.assertEqual(c.watchCount(), 2)
+		c.lookupCache.clear()
+		self.assertEqual(c.watchCount(), 1)
+
+	def test_lookup_watch_release(self):
+		# like the folder prefetch, which watches the documents while it looks
+		# them up and releases the watches afterwards
+		c = self.conn
+		docs = []
+		for i in xrange(3):
+			with c.create(self.store, 'public.data', 'test.ignore') as w:
+				w.commit()
+				docs.append(w.getDoc())
+		watches = [ connector.Watch(connector.Watch.TYPE_DOC, doc) for doc in docs ]
+		limit = connector._Connector.LOOKUP_WATCH_LIMIT
+		connector._Connector.LOOKUP_WATCH_LIMIT = 1
+		try:
+			c.watchMany(watches)
+			c.lookupDocs(docs)
+			self.assertEqual(c.lookupCacheInfo()[2], 3)
+			# only one slot may keep the watch of its document
+			c.unwatchMany(watches)
+			self.assertEqual(c.lookupCacheInfo()[2], 1)
+			self.assertEqual(c.watchCount(), 1)
+			# which is not needed anymore once somebody else watches it
+			[w] = [ w for w in watches if c.lookupCache.peek(w.getHash()) ]
+			c.watch(w)
+			c.lookupDoc(docs[0] if docs[0] != w.getHash() else docs[1])
+			self.assertEqual(c.lookupCacheInfo()[2], 2)
+			self.assertEqual(c.watchCount(), 2)
+			c.unwatch(w)
+		finally:
+			connector._Connector.LOOKUP_WATCH_LIMIT = limit
+
+	def test_resolve_path(self):
+		c = self.conn
+		with c.create(self.store, 'org.peerdrive.folder', 'test.ignore') as w:
+			w.setData('', { u'org.peerdrive.folder' : [],
+				u'org.peerdrive.annotation' : { u'title' : u'a' } })
+			w.commit()
+			(doc, rev) = (w.getDoc(), w.getRev())
+		root = c.lookupDoc(self.store).rev(self.store)
+		with c.update(self.store, self.store, root) as h:
+			h.setData('/org.peerdrive.folder#+',
+				{ u'' : connector.DocLink(self.store, doc, False) })
+			h.commit()
+
+		self.assertEqual(c.resolvePath('user:a'), (self.store, doc))
+		requests = self.server.requests
+		self.assertEqual(c.resolvePath('user:a'), (self.store, doc))
+		self.assertEqual(self.server.requests, requests)
+
+		with c.update(self.store, doc, rev) as h:
+			h.setData('/org.peerdrive.annotation/title', u'b')
+			h.commit()
+		for i in xrange(100):
+			if c.pathCacheInfo()[2] == 0:
+				break
+			c.process(10)
+		self.assertRaises(IOError, c.resolvePath, 'user:a')
+		self.assertEqual(c.resolvePath('user:b'), (self.store, doc))
+
+	def test_resolve_path_loop(self):
+		# a folder which contains itself appears twice along the path
+		c = self.conn
+		with c.create(self.store, 'org.peerdrive.folder', 'test.ignore') as w:
+			w.setData('', { u'org.peerdrive.folder' : [],
+				u'org.peerdrive.annotation' : { u'title' : u'a' } })
+			w.commit()
+			(doc, rev) = (w.getDoc(), w.getRev())
+		with c.update(self.store, doc, rev) as w:
+			w.setData('/org.peerdrive.folder#+',
+				{ u'' : connector.DocLink(self.store, doc, False) })
+			w.commit()
+		root = c.lookupDoc(self.store).rev(self.store)
+		with c.update(self.store, self.store, root) as h:
+			h.setData('/org.peerdrive.folder#+',
+				{ u'' : connector.DocLink(self.store, doc, False) })
+			h.commit()
+
+		# only 'user:a/a' stays cached, it holds the folder twice
+		size = connector._Connector.PATH_CACHE_SIZE
+		connector._Connector.PATH_CACHE_SIZE = 1
+		try:
+			c = connector._Connector(self.server.address(), SocketTransport)
+		finally:
+			connector._Connector.PATH_CACHE_SIZE = size
+		try:
+			self.assertEqual(c.resolvePath('user:a/a'), (self.store, doc))
+			with c.update(self.store, doc, c.lookupDoc(doc).rev(self.store)) as h:
+				h.setData('/org.peerdrive.annotation/title', u'b')
+				h.commit()
+			for i in xrange(100):
+				if c.pathCacheInfo()[2] == 0:
+					break
+				c.process(10)
+			self.assertEqual(c.pathCacheInfo()[2], 0)
+			self.assertEqual(c.resolvePath('user:b/b'), (self.store, doc))
+		finally:
+			c.close()
+
+	def test_path_watch_release(self):
+		# the watch of an invalidated path is released while its indication
+		# is dispatched, which must not upset the weakref callback later
+		c = self.conn
+		with c.create(self.store, 'org.peerdrive.folder', 'test.ignore') as w:
+			w.setData('', { u'org.peerdrive.folder' : [],
+				u'org.peerdrive.annotation' : { u'title' : u'a' } })
+			w.commit()
+			(doc, rev) = (w.getDoc(), w.getRev())
+		root = c.lookupDoc(self.store).rev(self.store)
+		with c.update(self.store, self.store, root) as h:
+			h.setData('/org.peerdrive.folder#+',
+				{ u'' : connector.DocLink(self.store, doc, False) })
+			h.commit()
+		c.process(0) # deliver the change of the root before resolving
+		self.assertEqual(c.resolvePath('user:a'), (self.store, doc))
+		# dispatched after the path watch, which keeps its weakref alive
+		other = connector.Watch(connector.Watch.TYPE_DOC, doc)
+		c.watch(other)
+		with c.update(self.store, doc, rev) as h:
+			h.setData('/org.peerdrive.annotation/title', u'b')
+			h.commit()
+
+		stderr = sys.stderr
+		sys.stderr = StringIO.StringIO()
+		try:
+			for i in xrange(100):
+				if c.pathCacheInfo()[2] == 1:
+					break
+				c.process(10)
+			gc.collect()
+			errors = sys.stderr.getvalue()
+		finally:
+			sys.stderr = stderr
+		# only the root prefix is left
+		self.assertEqual(c.pathCacheInfo()[2], 1)
+		self.assertEqual(errors, '')
+		self.assertEqual(c.resolvePath('user:b'), (self.store, doc))
+		c.unwatch(other)
+
+	def test_nested_wait(self):
+		# watchMany() waits for the server with the lock held twice
+		server = standin.Server(['user'], latency=0.3).start()
+		try:
+			c = connector._Connector(server.address(), SocketTransport)
+			store = c.enum().fromLabel('user').sid
+			w = connector.Watch(connector.Watch.TYPE_DOC, store)
+			t = threading.Thread(target=lambda: (time.sleep(0.1), c.enum()))
+			t.start()
+			requests = server.requests
+			c.watch(w)
+			# the other thread could send its request meanwhile
+			self.assertEqual(server.requests, requests + 2)
+			t.join()
+			c.unwatch(w)
+			c.close()
+		finally:
+			server.stop()
+
+	def test_split_batch(self):
+		c = self.conn
+		with c.create(self.store, 'public.data', 'test.ignore') as w:
+			w.commit(u'x' * 10000)
+			rev = w.getRev()
+		requests = self.server.requests
+		stats = c.statMany([rev] * 20)
+		self.assertEqual([ s.comment() for s in stats ], [u'x' * 10000] * 20)
+		self.assertTrue(self.server.requests - requests > 1)
+		size = c._batchSize(connector._Connector.STAT_MANY_MSG,
+			connector._Connector.STAT_MANY_BATCH)
+		self.assertTrue(size * 10000 < connector._Connector.MAX_REPLY_SIZE)
+
+	def test_split_rev_data(self):
+		c = self.conn
+		(a, b) = (u'a' * 40000, u'b' * 40000)
+		with c.create(self.store, 'public.data', 'test.ignore') as w:
+			w.setData('/a', a)
+			w.setData('/b', b)
+			w.commit()
+			rev = w.getRev()
+		self.assertEqual(c.getRevDataMany([(self.store, rev, ['/a', '/b'])] * 3),
+			[[a, b]] * 3)
+		[whole, value] = c.getRevDataValues(self.store, rev, ['', '/a'])
+		self.assertTrue(isinstance(whole, IOError))
+		self.assertEqual(value, a)
+		self.assertRaises(IOError, c.getRevData, self.store, rev, [''])
+
+
+
+class TestFolder(StandinParts):
+
+	def setUp(self):
+		super(TestFolder, self).setUp()
+		# struct.Folder works on the global connection
+		self.saved = connector._connection
+		connector._connection = self.conn
+
+	def tearDown(self):
+		connector._connection = self.saved
+		super(TestFolder, self).tearDown()
+
+	def create(self, title):
+		with self.conn.create(self.store, 'public.data', 'test.ignore') as w:
+			w.setData('', { u'org.peerdrive.annotation' : { u'title' : title } })
+			w.commit()
+			return connector.DocLink(self.store, w.getDoc())
+
+	def folder(self, *titles):
+		f = struct.Folder()
+		for title in titles:
+			f.append(self.create(title))
+		f.create(self.store, u'folder').close()
+		return connector.DocLink(self.store, f.getDoc())
+
+	def titles(self, link):
+		return [ title for (title, l) in struct.Folder(link).items() ]
+
+	def appendElsewhere(self, folder, links):
+		# Change the folder through another connection. Ours caches the head
+		# before and learns about the change only when it reads the next time,
+		# so the first attempt of the next save() works on a stale head.
+		self.conn.lookupDoc(folder.doc())
+		c = connector._Connector(self.server.address(), SocketTransport)
+		try:
+			rev = c.lookupDoc(folder.doc()).rev(self.store)
+			with c.update(self.store, folder.doc(), rev) as w:
+				for link in links:
+					w.setData('/org.peerdrive.folder#+', { u'' : link })
+				w.commit()
+		finally:
+			c.close()
+
+	def test_save_append(self):
+		link = self.folder(u'a', u'b')
+		f = struct.Folder(link)
+		f.append(self.create(u'c'))
+		f.save()
+		self.assertEqual(self.titles(link), [u'a', u'b', u'c'])
+		# nothing left to save
+		requests = self.server.requests
+		f.save()
+		self.assertEqual(self.server.requests, requests)
+
+	def test_save_conflict(self):
+		link = self.folder(u'a')
+		f = struct.Folder(link)
+		f.append(self.create(u'c'))
+		self.appendElsewhere(link, [self.create(u'b')])
+		# the update of the stale head fails with ECONFLICT and is retried
+		f.save()
+		self.assertEqual(self.titles(link), [u'a', u'b', u'c'])
+		self.assertEqual(f.getRev(), self.conn.lookupDoc(link.doc()).rev(self.store))
+
+	def test_save_rebase(self):
+		link = self.folder(u'a')
+		f = struct.Folder(link)
+		(x, y) = (self.create(u'x'), self.create(u'y'))
+		# 'y' is gained by the head as well, 'x' is appended twice
+		f.append(x)
+		f.append(x)
+		f.append(y)
+		self.appendElsewhere(link, [y])
+		f.save()
+		self.assertEqual(self.titles(link), [u'a', u'y', u'x', u'x'])
+
+	def test_save_remove(self):
+		link = self.folder(u'a', u'b', u'c')
+		f = struct.Folder(link)
+		del f[u'b']
+		f.append(self.create(u'e'))
+		self.appendElsewhere(link, [self.create(u'd')])
+		# the whole listing is written, based on the new head
+		f.save()
+		self.assertEqual(self.titles(link), [u'a', u'c', u'd', u'e'])
+
+	def checkIndex(self, f):
+		# every title must resolve to its first entry in the listing
+		items = f.items()
+		for (title, l) in items:
+			first = [ i for (t, i) in items if t == title ][0]
+			self.assertTrue(title in f)
+			self.assertEqual(f[title].doc(), first.doc())
+			self.assertEqual(f.get(title).doc(), first.doc())
+
+	def test_title_index(self):
+		f = struct.Folder(self.folder(u'a', u'b', u'a', u'c', u'b'))
+		[a1, b1, a2, c, b2] = [ l for (t, l) in f.items() ]
+		self.checkIndex(f)
+		del f[u'a']
+		self.assertEqual(f[u'a'].doc(), a2.doc())
+		self.checkIndex(f)
+		del f[-1]
+		self.assertEqual(f[u'b'].doc(), b1.doc())
+		self.checkIndex(f)
+		b3 = self.create(u'b')
+		f.append(b3)
+		f.append(self.create(u'd'))
+		self.assertEqual(f[u'b'].doc(), b1.doc())
+		self.checkIndex(f)
+		f.remove(u'b', b1)
+		self.assertEqual(f[u'b'].doc(), b3.doc())
+		self.checkIndex(f)
+		self.assertEqual([ t for (t, l) in f.items() ], [u'a', u'c', u'b', u'd'])
+		del f[u'a']
+		self.assertFalse(u'a' in f)
+		self.assertEqual(f.get(u'a'), None)
+		self.assertRaises(IndexError, f.__getitem__, u'a')
+		self.assertRaises(ValueError, f.remove, u'a', a1)
+		self.checkIndex(f)
+
+
 if __name__ == '__main__':
 	unittest.main()
 
@@ -23,7 +23,7 @@ from datetime import datetime
 import struct as pystruct
 
 from peerdrive import Connector, Registry
-from peerdrive import struct, importer, fuse, connector
+from peerdrive import struct, merger, importer, fuse, connector
 from peerdrive.connector import Watch, Stat
 from peerdrive.gui import widgets, utils
 
@@ -229,6 +229,7 @@ class FolderEntry(Watch):
 		self.__columnValues = [ column.default() for column in columns ]
 		self.__columnDefs = columns[:]
 		self.__metaData = None
+		self.__savedRev = self.__item[''].rev() # rev hint in the saved folder
 
 		link = self.__item[''].update(self.__model.getStore())
 		self.__store = model.getStore()
@@ -244,6 +245,13 @@ class FolderEntry(Watch):
 	def isValid(self):
 		return self.__valid
 
+	def linkChanged(self):
+		# the rev hint of the link was refreshed since the folder was saved
+		return self.__item[''].rev() != self.__savedRev
+
+	def linkSaved(self):
+		self.__savedRev = self.__item[''].rev()
+
 	def isFolder(self):
 		return self.__isFolder
 
@@ -369,11 +377,10 @@ class FolderEntry(Watch):
 		try:
 			if stat is None:
 				stat = Connector().stat(self.__rev)
-			with Connector().peek(self.__store, self.__rev) as r:
-				try:
-					metaData = r.getData("/org.peerdrive.annotation")
-				except:
-					metaData = { }
+			[metaData] = Connector().getRevDataValues(self.__store, self.__rev,
+				["/org.peerdrive.annotation"], True)
+			if isinstance(metaData, IOError):
+				metaData = { }
 
 			for i in xrange(len(self.__columnDefs)):
 				column = self.__columnDefs[i]
@@ -415,6 +422,8 @@ class FolderModel(QtCore.QAbstractTableModel):
 		self._columns = []
 		self.__typeCodes = set()
 		self.__changedContent = False
+		self.__appended = [] # entries to append on the next save
+		self.__rewrite = False # the whole listing must be written
 		self.__autoClean = False
 		self.__mutable = False
 		self.__store = None
@@ -423,29 +432,66 @@ class FolderModel(QtCore.QAbstractTableModel):
 	def doLoad(self, handle, readWrite, autoClean):
 		self.__mutable = readWrite
 		self.__changedContent = False
+		self.__appended = []
+		self.__rewrite = False
 		self.__autoClean = autoClean
 		self.__typeCodes = set()
 		self.__store = handle.getStore()
 		self._listing = []
 		data = handle.getData('/org.peerdrive.folder')
+		watches = self.__prefetch(data)
 		listing = [ FolderEntry(item, self, self._columns) for item in data ]
 		for entry in listing:
 			if entry.isValid() or (not self.__autoClean):
 				self.__typeCodes.add(entry.getTypeCode())
 				self._listing.append(entry)
-				Connector().watch(entry)
 			else:
 				self.__changedContent = True
+				self.__rewrite = True
+		Connector().watchMany(self._listing)
+		Connector().unwatchMany(watches)
 		self.reset()
 
+	def __prefetch(self, data):
+		# Fill the lookup and stat caches of the connector with a few batched
+		# requests. The entries will then find everything locally. The
+		# documents are watched first, like the entries will do anyway, so
+		# that the cache needs no watches of its own. Returns these watches.
+		links = [ item[''] for item in data ]
+		docs = [ l.doc() for l in links if isinstance(l, connector.DocLink) ]
+		watches = [ Watch(Watch.TYPE_DOC, doc) for doc in docs ]
+		Connector().watchMany(watches)
+		with Connector().pipeline() as pipe:
+			pipe.lookupDocs(docs)
+			lookups = pipe.lookupDocs(docs, [self.__store])
+		revs = [ l.rev(self.__store) for l in lookups.result()
+			if self.__store in l.stores() ]
+		revs.extend([ l.rev() for l in links if isinstance(l, connector.RevLink) ])
+		Connector().statMany(revs)
+		return watches
+
 	def doSave(self, handle):
-		data = [ item.getItem() for item in self._listing ]
-		handle.setData('/org.peerdrive.folder', data)
+		# Appending entries does not need to send the whole listing again.
+		# Refreshed rev hints of the links are only stored by a rewrite.
+		if self.__rewrite or any(e.linkChanged() for e in self._listing):
+			data = [ item.getItem() for item in self._listing ]
+			handle.setData('/org.peerdrive.folder', data)
+		else:
+			with Connector().pipeline() as p:
+				for entry in self.__appended:
+					p.setData(handle, '/org.peerdrive.folder#+', entry.getItem())
+
+	def doSaved(self):
+		# Keep the pending changes until they were committed. A failed save
+		# sends them again the next time.
 		self.__changedContent = False
+		self.__appended = []
+		self.__rewrite = False
+		for entry in self._listing:
+			entry.linkSaved()
 
 	def clear(self):
-		for item in self._listing:
-			Connector().unwatch(item)
+		Connector().unwatchMany(self._listing)
 		self._listing = []
 		del self.__parent
 
@@ -481,6 +527,7 @@ class FolderModel(QtCore.QAbstractTableModel):
 			self._listing = [x for x in self._listing if x.isValid()]
 			if len(removed) > 0:
 				self.__changedContent = True
+				self.__rewrite = True
 				for item in removed:
 					Connector().unwatch(item)
 				self.reset()
@@ -582,6 +629,7 @@ class FolderModel(QtCore.QAbstractTableModel):
 		if not self.__mutable:
 			return False
 		self.__changedContent = True
+		self.__rewrite = True
 		self.beginRemoveRows(QtCore.QModelIndex(), position, position+rows-1)
 		for i in range(rows):
 			Connector().unwatch(self._listing[position])
@@ -802,6 +850,7 @@ class FolderModel(QtCore.QAbstractTableModel):
 		endRow = self.rowCount(QtCore.QModelIndex())
 		self.beginInsertRows(QtCore.QModelIndex(), endRow, endRow)
 		self._listing.append(entry)
+		self.__appended.append(entry)
 		self.endInsertRows()
 		Connector().watch(entry)
 
@@ -947,6 +996,10 @@ class FolderWidget(widgets.DocumentView):
 		if self.model().hasChanged():
 			self.model().doSave(handle)
 
+	def docSaved(self):
+		if self.model().hasChanged():
+			self.model().doSaved()
+
 	def docMergeCheck(self, heads, types, changedParts):
 		(uti, handled) = super(FolderWidget, self).docMergeCheck(heads, types, changedParts)
 		return (uti, handled | set(['PDSD']))
@@ -958,8 +1011,8 @@ class FolderWidget(widgets.DocumentView):
 			mergePdsd = []
 			for r in mergeReaders:
 				mergePdsd.append(struct.loads(self.store(), r.readAll('PDSD')))
-			(newPdsd, newConflict) = struct.merge(basePdsd, mergePdsd)
-			conflicts = conflicts or newConflict
+			(newPdsd, newConflicts) = merger.merge(basePdsd, mergePdsd)
+			conflicts.extend(newConflicts)
 			writer.writeAll('PDSD', struct.dumps(newPdsd))
 
 		return conflicts
@@ -1178,9 +1231,9 @@ class FolderWidget(widgets.DocumentView):
 		dstStore = self.store()
 		with Connector().create(dstStore, info.type(), info.creator()) as w:
 			with Connector().peek(srcStore, srcRev) as r:
-				w.set_data('', r.get_data(''))
+				w.setData('', r.getData(''))
 				for att in info.attachments():
-					w.write(att, r.readAll(att))
+					w.writeStream(att, r.readChunks(att))
 				w.setFlags(r.stat().flags())
 			w.commit("Created from template")
 			destDoc = w.getDoc()
@@ -20,6 +20,7 @@
 from __future__ import absolute_import
 
 from PyQt4 import QtGui
+from peerdrive import merger
 from peerdrive.gui import widgets
 from . import diff3
 
@@ -90,7 +91,8 @@ class TextEdit(widgets.DocumentView):
 				newFile = diff3.text_merge(baseFile, rev1File, rev2File)
 				# the diff3 module is broken, basically there's never a clean
 				# merge
-				conflicts = True
+				conflicts.append(merger.Conflict(merger.Conflict.VALUE, u'',
+					baseFile, [rev1File, rev2File], newFile))
 			writer.writeAll('FILE', newFile)
 
 		return conflicts
@@ -32,6 +32,9 @@
 -define(FLAG_IND, 2).
 -define(FLAG_RSP, 3).
 
+% {packet, 2} framing limits packets to 64KiB including the 6 byte header
+-define(MAX_REPLY_SIZE, (16#FFFF - 6)).
+
 -define(ERROR_MSG,           16#000).
 -define(INIT_MSG,            16#001).
 -define(ENUM_MSG,            16#002).
@@ -78,6 +81,10 @@
 -define(GET_DATA_MSG,        16#02b).
 -define(SET_DATA_MSG,        16#02c).
 -define(GET_LINKS_MSG,       16#02d).
+-define(STAT_MANY_MSG,       16#02e).
+-define(LOOKUP_MANY_MSG,     16#02f).
+-define(GET_REV_DATA_MSG,    16#030).
+-define(WATCH_MANY_MSG,      16#031).
 
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 %% Servlet callbacks
@@ -189,6 +196,10 @@ handle_packet(<<Ref:32, Request:12, ?FLAG_REQ:4, Body/binary>>, #state{auth=true
 			fork(Body, RetPath, fun do_loopup_rev/1),
 			{ok, S};
 
+		?LOOKUP_MANY_MSG ->
+			fork(Body, RetPath, fun do_lookup_many/1),
+			{ok, S};
+
 		?STAT_MSG ->
 			fork(Body, RetPath, fun do_stat/1),
 			{ok, S};
@@ -197,6 +208,14 @@ handle_packet(<<Ref:32, Request:12, ?FLAG_REQ:4, Body/binary>>, #state{auth=true
 			fork(Body, RetPath, fun do_get_links/1),
 			{ok, S};
 
+		?STAT_MANY_MSG ->
+			fork(Body, RetPath, fun do_stat_many/1),
+			{ok, S};
+
+		?GET_REV_DATA_MSG ->
+			fork(Body, RetPath, fun do_get_rev_data/1),
+			{ok, S};
+
 		?PEEK_MSG ->
 			start_worker(S, fun do_peek/2, RetPath, Body);
 
@@ -218,6 +237,9 @@ handle_packet(<<Ref:32, Request:12, ?FLAG_REQ:4, Body/binary>>, #state{auth=true
 		?WATCH_REM_MSG ->
 			{reply, do_watch_rem_req(RetPath, Body), S};
 
+		?WATCH_MANY_MSG ->
+			{reply, do_watch_many_req(RetPath, Body), S};
+
 		?FORGET_MSG ->
 			fork(Body, RetPath, fun do_forget/1),
 			{ok, S};
@@ -408,12 +430,24 @@ do_enum_convert(Store) ->
 do_loopup_doc(Body) ->
 	#lookupdocreq{doc=Doc, stores=Stores} =
 		peerdrive_client_pb:decode_lookupdocreq(Body),
-	{Revs, PreRevs} = peerdrive_broker:lookup_doc(Doc, get_stores(Stores)),
-	Reply = #lookupdoccnf{
+	Reply = lookup_doc(Doc, get_stores(Stores)),
+	peerdrive_client_pb:encode_lookupdoccnf(Reply).
+
+
+do_lookup_many(Body) ->
+	#lookupmanyreq{docs=Docs, stores=Stores} =
+		peerdrive_client_pb:decode_lookupmanyreq(Body),
+	StoreList = get_stores(Stores),
+	Reply = #lookupmanycnf{results=[ lookup_doc(Doc, StoreList) || Doc <- Docs ]},
+	peerdrive_client_pb:encode_lookupmanycnf(Reply).
+
+
+lookup_doc(Doc, Stores) ->
+	{Revs, PreRevs} = peerdrive_broker:lookup_doc(Doc, Stores),
+	#lookupdoccnf{
 		revs = [ #lookupdoccnf_revmap{rid=RId, stores=RS} || {RId, RS} <- Revs ],
 		pre_revs = [ #lookupdoccnf_revmap{rid=RId, stores=RS} || {RId, RS} <- PreRevs ]
-	},
-	peerdrive_client_pb:encode_lookupdoccnf(Reply).
+	}.
 
 
 do_loopup_rev(Body) ->
@@ -431,6 +465,21 @@ do_stat(Body) ->
 	peerdrive_client_pb:encode_statcnf(rev_to_statcnf(Stat)).
 
 
+do_stat_many(Body) ->
+	#statmanyreq{revs=Revs, stores=Stores} =
+		peerdrive_client_pb:decode_statmanyreq(Body),
+	StoreList = get_stores(Stores),
+	Results = [
+		case peerdrive_broker:stat(Rev, StoreList) of
+			{ok, Stat} ->
+				#statmanycnf_result{stat=rev_to_statcnf(Stat)};
+			{error, Error} ->
+				#statmanycnf_result{error=Error}
+		end
+		|| Rev <- Revs ],
+	peerdrive_client_pb:encode_statmanycnf(#statmanycnf{results=Results}).
+
+
 do_get_links(Body) ->
 	#getlinksreq{rev=Rev, stores=Stores} =
 		peerdrive_client_pb:decode_getlinksreq(Body),
@@ -440,6 +489,34 @@ do_get_links(Body) ->
 	peerdrive_client_pb:encode_getlinkscnf(Reply).
 
 
+do_get_rev_data(Body) ->
+	#getrevdatareq{items=Items} =
+		peerdrive_client_pb:decode_getrevdatareq(Body),
+	Results = [ get_rev_data(Item) || Item <- Items ],
+	peerdrive_client_pb:encode_getrevdatacnf(#getrevdatacnf{results=Results}).
+
+
+get_rev_data(#getrevdatareq_item{store=Store, rev=Rev, selectors=Selectors}) ->
+	try
+		{ok, Handle} = check(peerdrive_broker:peek(get_store(Store), Rev)),
+		try
+			Values = [
+				case peerdrive_broker:get_data(Handle, Selector) of
+					{ok, Data} ->
+						#getrevdatacnf_value{data=Data};
+					{error, Error} ->
+						#getrevdatacnf_value{error=Error}
+				end
+				|| Selector <- Selectors ],
+			#getrevdatacnf_result{values=Values}
+		after
+			peerdrive_broker:close(Handle)
+		end
+	catch
+		throw:{error, Reason} -> #getrevdatacnf_result{error=Reason}
+	end.
+
+
 do_peek(Cookie, Body) ->
 	#peekreq{store=Store, rev=Rev} =
 		peerdrive_client_pb:decode_peekreq(Body),
@@ -617,6 +694,26 @@ do_watch_rem_req(RetPath, Body) ->
 	end.
 
 
+do_watch_many_req(RetPath, Body) ->
+	#watchmanyreq{add=Add, rem=Rem} =
+		peerdrive_client_pb:decode_watchmanyreq(Body),
+	try
+		lists:foreach(
+			fun(#watchremreq{type=Type, element=Obj}) ->
+				ok = check(peerdrive_change_monitor:unwatch(Type, Obj))
+			end,
+			Rem),
+		lists:foreach(
+			fun(#watchaddreq{type=Type, element=Obj}) ->
+				ok = check(peerdrive_change_monitor:watch(Type, Obj))
+			end,
+			Add),
+		send_reply(RetPath, <<>>)
+	catch
+		throw:Error -> send_error(RetPath, Error)
+	end.
+
+
 do_watch_progress_req(Body, RetPath, #state{progreg=ProgReg} = S) ->
 	#watchprogressreq{enable=Enable} =
 		peerdrive_client_pb:decode_watchprogressreq(Body),
@@ -914,7 +1011,13 @@ send_error(RetPath, {error, Error}) ->
 
 
 send_reply(#retpath{req=Req} = RetPath, Data) ->
-	send_cnf(RetPath, (Req bsl 4) bor ?FLAG_CNF, Data).
+	case iolist_size(Data) of
+		Size when Size > ?MAX_REPLY_SIZE ->
+			% could not be sent, let the client ask for less
+			send_error(RetPath, {error, e2big});
+		_ ->
+			send_cnf(RetPath, (Req bsl 4) bor ?FLAG_CNF, Data)
+	end.
 
 
 send_cnf(#retpath{ref=Ref, servlet=Servlet}, Cnf, Data) ->